@@ -2,12 +2,131 @@
 Cross-platform audio playback utility for WAV files.
 Handles Windows, macOS, and Linux with native system tools.
 """
+import io
 import os
 import sys
 import shutil
 import subprocess
+import threading
 import wave
 
+# Optional: play PCM straight from memory (no temp file, no player process)
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):  # OSError: PortAudio library missing
+    SOUNDDEVICE_AVAILABLE = False
+
+# WAV sample width (bytes) -> sounddevice raw dtype
+_SAMPLE_DTYPES = {1: "uint8", 2: "int16", 3: "int24", 4: "int32"}
+
+
+class WavStreamPlayer:
+    """
+    Plays WAV byte strings back-to-back through one sounddevice output stream.
+    Writes block until the device has room, so playback is paced by the device itself
+    and the next clip queues behind the previous one without a gap.
+    Requires SOUNDDEVICE_AVAILABLE.
+    """
+
+    def __init__(self, blocksize: int = 1024):
+        self.blocksize = blocksize
+        self._stream = None
+        self._fmt = None
+        self._stopped = False
+        # _busy: a play()/close() call owns the stream. stop() may come from another thread,
+        # so it only aborts; closing is left to the owner (PortAudio can't close a stream
+        # that another thread is writing to).
+        self._busy = False
+        self._lock = threading.Lock()
+
+    def play(self, wav_bytes: bytes) -> None:
+        """Decode WAV bytes in memory and write them to the stream (blocks until queued)."""
+        if not self._enter():
+            return
+        try:
+            with wave.open(io.BytesIO(wav_bytes), "rb") as wav_file:
+                fmt = (wav_file.getframerate(), wav_file.getnchannels(), wav_file.getsampwidth())
+                if fmt != self._fmt:
+                    self._close_stream(drain=True)
+                    stream = sd.RawOutputStream(
+                        samplerate=fmt[0], channels=fmt[1], dtype=_SAMPLE_DTYPES[fmt[2]], blocksize=self.blocksize
+                    )
+                    with self._lock:
+                        self._stream, self._fmt = stream, fmt
+                    if self._stopped:
+                        return
+                    stream.start()
+                while not self._stopped:
+                    frames = wav_file.readframes(self.blocksize)
+                    if not frames:
+                        break
+                    self._stream.write(frames)
+        except Exception:
+            # stop() aborts the stream under a blocked write; that is not an error
+            if not self._stopped:
+                raise
+        finally:
+            self._leave()
+
+    def stop(self) -> None:
+        """Stop immediately, dropping anything still queued. Safe to call from any thread."""
+        with self._lock:
+            self._stopped = True
+            busy = self._busy
+            if self._stream is not None:
+                try:
+                    self._stream.abort()  # Unblocks a write() in progress on the playing thread
+                except Exception:
+                    pass
+        if not busy:
+            # Nobody else is using the stream, so it can be released here
+            self._close_stream(drain=False)
+
+    def close(self) -> None:
+        """Let queued audio finish playing, then release the device."""
+        if not self._enter():
+            return
+        try:
+            self._close_stream(drain=True)
+        finally:
+            self._leave()
+
+    def _enter(self) -> bool:
+        with self._lock:
+            if self._stopped:
+                return False
+            self._busy = True
+            return True
+
+    def _leave(self) -> None:
+        with self._lock:
+            self._busy = False
+            stopped = self._stopped
+        if stopped:
+            # stop() came in while we owned the stream; release it on this thread
+            self._close_stream(drain=False)
+
+    def _close_stream(self, drain: bool) -> None:
+        stream = self._stream
+        if stream is None:
+            return
+        if drain:
+            try:
+                stream.stop()  # Returns once buffered audio has played (or stop() aborts it)
+            except Exception:
+                pass
+        # Detach under the lock so a concurrent stop() can no longer abort it, then close
+        with self._lock:
+            if self._stream is not stream:
+                return
+            self._stream = None
+            self._fmt = None
+        try:
+            stream.close()
+        except Exception:
+            pass
+
 
 def play_wav_sync(wav_path: str) -> None:
     """
@@ -73,7 +192,12 @@ def stop_playback(process=None) -> None:
     Args:
         process: On Mac/Linux, the subprocess.Popen object from play_wav_async()
                  On Windows, pass None
+                 A WavStreamPlayer is stopped directly on any platform
     """
+    if isinstance(process, WavStreamPlayer):
+        process.stop()
+        return
+
     if os.name == "nt":
         # Windows: Purge winsound
         try:
@@ -94,16 +218,18 @@ def stop_playback(process=None) -> None:
                     pass
 
 
-def get_wav_duration(wav_path: str) -> float:
+def get_wav_duration(wav_path) -> float:
     """
     Get the duration of a WAV file in seconds.
     
     Args:
-        wav_path: Path to the WAV file
+        wav_path: Path to the WAV file, or the WAV data itself as bytes
         
     Returns:
         Duration in seconds
     """
+    if isinstance(wav_path, (bytes, bytearray)):
+        wav_path = io.BytesIO(wav_path)
     with wave.open(wav_path, 'rb') as wav_file:
         frames = wav_file.getnframes()
         rate = wav_file.getframerate()
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import http.client
+import io
 import json
 import os
 import re
 import shutil
+import subprocess
 import logging
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
 
@@ -52,7 +62,7 @@ def validate_nickname(nickname: str) -> str:
     
     return nickname
 
-def safe_config_save(file_path: Path, config_data: dict) -> bool:
+def safe_config_save(file_path: Path, config_data: dict, indent: int = 2) -> bool:
     """
     Saves a configuration dictionary to a JSON file safely.
     1. Creates a backup of the existing file (.bak).
@@ -73,7 +83,7 @@ def safe_config_save(file_path: Path, config_data: dict) -> bool:
 
         # Step 2: Write to temporary file
         with temp_path.open("w", encoding="utf-8") as f:
-            json.dump(config_data, f, indent=2)
+            json.dump(config_data, f, indent=indent)
             f.flush()
             os.fsync(f.fileno())
         
@@ -118,3 +128,196 @@ def safe_config_load(file_path: Path) -> dict:
             logger.error(f"Failed to load backup config {bak_path}: {e}")
             
     return {}
+
+def fast_rmtree(path: Path) -> None:
+    """
+    Deletes a directory tree faster than a single-threaded shutil.rmtree.
+    POSIX: hands the tree to `rm -rf` (falls back to shutil.rmtree if that fails).
+    Windows: removes each top-level child on its own thread, then the root.
+    Raises the same errors as shutil.rmtree when something can't be removed.
+    """
+    path = os.fspath(path)
+    if os.name != "nt":
+        result = subprocess.run(["rm", "-rf", "--", path], capture_output=True)
+        if result.returncode == 0 and not os.path.lexists(path):
+            return
+        # Let shutil report a proper exception for whatever is left
+        shutil.rmtree(path)
+        return
+
+    with os.scandir(path) as it:
+        children = [(e.path, e.is_dir(follow_symlinks=False)) for e in it]
+    files = [p for p, is_dir in children if not is_dir]
+    dirs = [p for p, is_dir in children if is_dir]
+    for p in files:
+        os.unlink(p)
+    if dirs:
+        with ThreadPoolExecutor(max_workers=min(16, os.cpu_count() or 1, len(dirs))) as ex:
+            # list() re-raises the first failure
+            list(ex.map(shutil.rmtree, dirs, chunksize=1))
+    os.rmdir(path)
+
+
+def acquire_instance_lock(lock_path: Path) -> Optional[Any]:
+    """
+    Takes a non-blocking exclusive lock on lock_path.
+    Returns the open file (keep a reference for as long as the lock should be held)
+    or None if another process already holds it. The OS drops the lock when the
+    process exits, even on a crash, so there is no stale state to clean up.
+    """
+    f = open(lock_path, "a+b")
+    try:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        f.close()
+        return None
+    return f
+
+
+# Per-thread keep-alive connections to the local server: (host, port) -> (connection, last used).
+# Only back-to-back calls on one thread share a connection (e.g. the chunked TTS fetcher);
+# status polls are further apart than the server's keep-alive, so they reconnect anyway
+# (the server UI's poll uses ping_server, which never pools).
+_HTTP_CONNS = threading.local()
+# uvicorn drops idle keep-alive connections after 5s (timeout_keep_alive); reconnect before that
+HTTP_KEEPALIVE_IDLE_SECS = 4.0
+
+
+def http_request(method: str, url: str, timeout: float, body: bytes | None = None, headers: dict | None = None) -> bytes:
+    """
+    Send a request and return the body, reusing this thread's connection to the same
+    host if it was used within HTTP_KEEPALIVE_IDLE_SECS.
+    Raises urllib.error.HTTPError for 4xx/5xx so callers can treat it like urlopen().
+    Anything other than plain http:// goes through urllib.
+    """
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme != "http" or not parts.hostname:
+        req = urllib.request.Request(url, method=method, data=body, headers=headers or {})
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.read()
+
+    key = (parts.hostname, parts.port or 80)
+    conns = getattr(_HTTP_CONNS, "conns", None)
+    if conns is None:
+        conns = _HTTP_CONNS.conns = {}
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    # Even a recently used connection can race the server's idle close; retry once on a fresh one
+    for attempt in range(2):
+        conn, last_used = conns.pop(key, (None, 0.0))
+        if conn is not None and time.monotonic() - last_used > HTTP_KEEPALIVE_IDLE_SECS:
+            conn.close()
+            conn = None
+        reused = conn is not None
+        if conn is None:
+            conn = http.client.HTTPConnection(*key, timeout=timeout)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+            resp = conn.getresponse()
+            data = resp.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+            conn.close()
+            if reused and attempt == 0:
+                continue
+            raise urllib.error.URLError(e)
+        except Exception:
+            conn.close()
+            raise
+        if resp.will_close:
+            conn.close()
+        else:
+            conns[key] = (conn, time.monotonic())
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, io.BytesIO(data))
+        return data
+    raise AssertionError("unreachable")
+
+
+def http_get_json(url: str, timeout: float = 5.0) -> dict:
+    """Perform an HTTP GET request and return the JSON response."""
+    data = http_request("GET", url, timeout)
+    return json.loads(data.decode("utf-8"))
+
+
+def http_post_json(url: str, payload: dict, timeout: float = 10.0) -> bytes:
+    """Perform an HTTP POST request with a JSON payload and return the response bytes."""
+    data = json.dumps(payload).encode("utf-8")
+    return http_request("POST", url, timeout, body=data, headers={"Content-Type": "application/json"})
+
+
+class TextLogBuffer:
+    """
+    Pending lines for one Tk Text widget. Producers append from any thread; a single
+    Tk callback per flush_ms inserts everything queued so far in one call and trims
+    the widget to its last max_lines lines, so streamed output costs one insert per
+    batch instead of four calls per line. Only uses the widget's methods, so this
+    module doesn't import tkinter.
+    """
+
+    def __init__(self, widget: Any, flush_ms: int = 33, max_lines: int = 5000):
+        self.widget = widget
+        self.flush_ms = flush_ms
+        self.max_lines = max_lines
+        self.lines: deque[str] = deque()
+        self.lock = threading.Lock()
+        self.pending = False
+
+    def push(self, line: str) -> None:
+        with self.lock:
+            self.lines.append(line)
+            if self.pending:
+                return
+            self.pending = True
+        try:
+            self.widget.after(self.flush_ms, self.flush)
+        except Exception:
+            # Widget already destroyed
+            with self.lock:
+                self.pending = False
+                self.lines.clear()
+
+    def flush(self) -> None:
+        with self.lock:
+            text = "".join(self.lines)
+            self.lines.clear()
+            self.pending = False
+        if not text:
+            return
+        try:
+            widget = self.widget
+            if not widget.winfo_exists():
+                return
+            widget.configure(state="normal")
+            widget.insert("end", text)
+            widget.delete("1.0", f"end-{self.max_lines + 1}l")
+            widget.see("end")
+            widget.configure(state="disabled")
+        except Exception:
+            pass
+
+
+_TEXT_LOG_BUFFERS: dict[str, TextLogBuffer] = {}
+_TEXT_LOG_BUFFERS_LOCK = threading.Lock()
+
+
+def text_log_buffer(widget: Any, flush_ms: int = 33, max_lines: int = 5000) -> TextLogBuffer:
+    """The TextLogBuffer for widget, created on first use (keyed by the widget's Tk path)."""
+    key = str(widget)
+    buf = _TEXT_LOG_BUFFERS.get(key)
+    if buf is None or buf.widget is not widget:
+        with _TEXT_LOG_BUFFERS_LOCK:
+            buf = _TEXT_LOG_BUFFERS.get(key)
+            if buf is None or buf.widget is not widget:
+                buf = _TEXT_LOG_BUFFERS[key] = TextLogBuffer(widget, flush_ms, max_lines)
+    return buf
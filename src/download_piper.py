@@ -4,8 +4,8 @@ import shutil
 import tarfile
 import zipfile
 import urllib.request
-import sys
 from pathlib import Path
+from typing import Callable
 
 # Fixed version of Piper to ensure stability and compatibility
 PIPER_VERSION = "2023.11.14-2"
@@ -41,17 +41,18 @@ def get_platform_url():
 
     return None, None
 
-def download_and_extract_piper(target_dir: Path):
+def download_and_extract_piper(target_dir: Path, log: Callable[[str], None] = print):
     """
     Download and extract the Piper binary to the target directory.
     Handles different archive formats (.zip, .tar.gz) and sets executable permissions on Unix-like systems.
+    Status messages go to `log` (stdout by default), one call per message.
     """
     url, filename = get_platform_url()
     if not url:
-        print(f"Error: No compatible Piper binary found for {platform.system()} {platform.machine()}")
+        log(f"Error: No compatible Piper binary found for {platform.system()} {platform.machine()}")
         return False
 
-    print(f"Downloading Piper from {url}...")
+    log(f"Downloading Piper from {url}...")
     
     download_path = target_dir / filename
     temp_download_path = target_dir / f"{filename}.tmp"
@@ -68,8 +69,7 @@ def download_and_extract_piper(target_dir: Path):
                 if percent != last_percent:
                     # Use a standard format that the Manager UI can intercept for its progress bar
                     if percent % 10 == 0:  # Only log to text every 10% to avoid flooding as requested
-                        sys.stdout.write(f"Downloading... {percent}%\n")
-                    sys.stdout.flush()
+                        log(f"Downloading... {percent}%")
                     last_percent = percent
 
         # Download to temporary file first
@@ -81,7 +81,7 @@ def download_and_extract_piper(target_dir: Path):
                 os.remove(download_path)
             temp_download_path.rename(download_path)
             
-        print("\nDownload complete. Extracting...")
+        log("\nDownload complete. Extracting...")
 
         # Extract based on file extension
         if filename.endswith(".zip"):
@@ -91,7 +91,7 @@ def download_and_extract_piper(target_dir: Path):
             with tarfile.open(download_path, "r:gz") as tar_ref:
                 tar_ref.extractall(target_dir)
         
-        print("Extraction complete.")
+        log("Extraction complete.")
 
         # Ensure executable permissions on Mac/Linux (not needed on Windows)
         if platform.system().lower() != "windows":
@@ -100,14 +100,14 @@ def download_and_extract_piper(target_dir: Path):
             if piper_exe.exists():
                 st = os.stat(piper_exe)
                 os.chmod(piper_exe, st.st_mode | 0o111)
-                print(f"Made {piper_exe} executable.")
+                log(f"Made {piper_exe} executable.")
             
             # Also check nested structure (some archives extract to ./piper/piper/piper)
             nested_exe = target_dir / "piper" / "piper" / "piper"
             if nested_exe.exists():
                 st = os.stat(nested_exe)
                 os.chmod(nested_exe, st.st_mode | 0o111)
-                print(f"Made {nested_exe} executable.")
+                log(f"Made {nested_exe} executable.")
         
         # Cleanup the downloaded archive to save space
         try:
@@ -118,7 +118,7 @@ def download_and_extract_piper(target_dir: Path):
         return True
 
     except Exception as e:
-        print(f"\nError downloading/extracting Piper: {e}")
+        log(f"\nError downloading/extracting Piper: {e}")
         # Cleanup temp file if it exists
         if 'temp_download_path' in locals() and temp_download_path.exists():
             try:
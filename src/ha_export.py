@@ -10,11 +10,36 @@ import logging
 import shutil
 import zipfile
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 import json
 
 logger = logging.getLogger(__name__)
 
+_STREAM_CHUNK = 1 << 20  # bytes read per step when streaming a zip
+
+
+class _QueueWriter:
+    """Write-only sink for ZipFile: collects bytes until the generator drains them.
+
+    It has no tell()/seek(), so zipfile falls back to streaming mode (data descriptors).
+    """
+
+    def __init__(self):
+        self.buf: List[bytes] = []
+
+    def write(self, b) -> int:
+        self.buf.append(bytes(b))
+        return len(b)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self.buf)
+        self.buf.clear()
+        return data
+
+
 class HomeAssistantExporter:
     """
     Manages the export of trained Piper voice models into a format
@@ -73,17 +98,8 @@ class HomeAssistantExporter:
         
         return sorted(voices, key=lambda x: x["name"])
     
-    def create_voice_zip_buffer(self, voice_name: str, include_readme: bool = True) -> Optional[tuple]:
-        """
-        Package a voice for Home Assistant into an in-memory buffer.
-        Returns (buffer, filename) or None.
-        """
-        import io
-        
-        # Validate voice_name
-        if not voice_name or '/' in voice_name or '\\' in voice_name or '..' in voice_name:
-            return None
-        
+    def _find_voice_files(self, voice_name: str) -> Optional[tuple]:
+        """(onnx_file, json_file) for voice_name, searching subfolders if needed, or None."""
         onnx_file = self.voices_dir / f"{voice_name}.onnx"
         json_file = self.voices_dir / f"{voice_name}.onnx.json"
         
@@ -96,20 +112,42 @@ class HomeAssistantExporter:
         
         if not onnx_file.exists() or not json_file.exists():
             return None
-            
-        buffer = io.BytesIO()
+        return onnx_file, json_file
+
+    def stream_voice_zip(self, voice_name: str, include_readme: bool = True) -> Optional[tuple]:
+        """
+        Package a voice for Home Assistant as a stream of zip bytes.
+        Returns (chunk_iterator, filename) or None if the voice is missing.
+        Memory stays at about one chunk however large the model is.
+        """
+        if not voice_name or '/' in voice_name or '\\' in voice_name or '..' in voice_name:
+            return None
+
+        files = self._find_voice_files(voice_name)
+        if files is None:
+            return None
+        onnx_file, json_file = files
+
+        return self._iter_voice_zip(voice_name, onnx_file, json_file, include_readme), f"{voice_name}_home_assistant.zip"
+
+    def _iter_voice_zip(self, voice_name: str, onnx_file: Path, json_file: Path, include_readme: bool) -> Iterator[bytes]:
+        sink = _QueueWriter()
         try:
-            with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
-                zf.write(onnx_file, arcname=f"{voice_name}.onnx")
-                zf.write(json_file, arcname=f"{voice_name}.onnx.json")
+            with zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED) as zf:
+                for src, arcname in ((onnx_file, f"{voice_name}.onnx"), (json_file, f"{voice_name}.onnx.json")):
+                    info = zipfile.ZipInfo.from_file(src, arcname=arcname)
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    with open(src, 'rb') as f, zf.open(info, 'w') as dest:
+                        while chunk := f.read(_STREAM_CHUNK):
+                            dest.write(chunk)
+                            if sink.buf:
+                                yield sink.drain()
                 if include_readme:
                     zf.writestr("README.txt", self._generate_readme(voice_name, json_file))
-            
-            buffer.seek(0)
-            return buffer, f"{voice_name}_home_assistant.zip"
+            yield sink.drain()
         except Exception as e:
-            logger.error(f"Memory export failed for {voice_name}: {e}")
-            return None
+            logger.error(f"Streaming export failed for {voice_name}: {e}")
+            raise
 
     def export_voice(self, voice_name: str, include_readme: bool = True) -> Optional[Path]:
         """
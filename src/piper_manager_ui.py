@@ -1,10 +1,15 @@
 ﻿from __future__ import annotations
 
+import atexit
+import contextlib
 import os
+import queue
 import sys
+import threading
 import time
 import shutil
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # --- Core Modules ---
@@ -17,6 +22,7 @@ except ImportError:
     import download_piper
 
 import audio_playback
+from common_utils import acquire_instance_lock, fast_rmtree, http_get_json, http_post_json, text_log_buffer
 
 # --- File System Paths ---
 # Define key paths relative to this script for consistent location across environments
@@ -46,21 +52,111 @@ RUN_KEY = r"HKCU\Software\Microsoft\Windows\CurrentVersion\Run"
 RUN_VALUE_NAME = "Piper TTS Server"
 
 
+class _UILogWriter(threading.Thread):
+    """
+    Background writer for the UI log. Callers only enqueue lines; this thread drains
+    whatever has queued up, writes it with one write() on a file it keeps open, and
+    flushes. No disk I/O happens on the Tk thread or in subprocess reader loops.
+    Queue items: str (a line), threading.Event (set once everything before it is on
+    disk), None (close and exit).
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True, name="UILogWriter")
+        self.queue: queue.Queue = queue.Queue()
+
+    def run(self) -> None:
+        fh = None
+        while True:
+            items = [self.queue.get()]
+            while True:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [i for i in items if isinstance(i, str)]
+            if lines:
+                try:
+                    if fh is None:
+                        UI_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+                        fh = UI_LOG_PATH.open("a", encoding="utf-8", buffering=65536)
+                    fh.write("".join(lines))
+                    fh.flush()
+                except Exception:
+                    # Best-effort logging only.
+                    pass
+            for item in items:
+                if isinstance(item, threading.Event):
+                    item.set()
+            if None in items:
+                if fh is not None:
+                    fh.close()
+                return
+
+
+_UI_LOG_WRITER: _UILogWriter | None = None
+_UI_LOG_LOCK = threading.Lock()
+
+
+def _ui_log_writer() -> _UILogWriter:
+    global _UI_LOG_WRITER
+    with _UI_LOG_LOCK:
+        if _UI_LOG_WRITER is None:
+            _UI_LOG_WRITER = _UILogWriter()
+            _UI_LOG_WRITER.start()
+        return _UI_LOG_WRITER
+
+
+# (whole second, "%Y-%m-%d %H:%M:%S", "%H:%M:%S"); swapped as one tuple so threads never see a mix
+_TS_CACHE: tuple[int, str, str] = (-1, "", "")
+
+
+def _timestamps() -> tuple[int, str, str]:
+    """Formatted timestamps for the current second, re-rendered at most once per second."""
+    global _TS_CACHE
+    t = int(time.time())
+    cached = _TS_CACHE
+    if cached[0] != t:
+        lt = time.localtime(t)
+        cached = _TS_CACHE = (t, time.strftime("%Y-%m-%d %H:%M:%S", lt), time.strftime("%H:%M:%S", lt))
+    return cached
+
+
 def _write_ui_log(msg: str) -> None:
-    """Write a message to the UI log file with a timestamp."""
+    """Write a message to the UI log file with a timestamp (queued to the writer thread)."""
     try:
-        UI_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-        with UI_LOG_PATH.open("a", encoding="utf-8") as f:
-            f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {msg}\n")
+        _ui_log_writer().queue.put(f"[{_timestamps()[1]}] {msg}\n")
     except Exception:
         # Best-effort logging only.
         pass
 
 
+def _flush_ui_log(timeout: float = 1.0) -> None:
+    """Wait (bounded) until every line queued so far is on disk."""
+    writer = _UI_LOG_WRITER
+    if writer is None or not writer.is_alive():
+        return
+    done = threading.Event()
+    writer.queue.put(done)
+    done.wait(timeout)
+
+
+def _close_ui_log() -> None:
+    writer = _UI_LOG_WRITER
+    if writer is None or not writer.is_alive():
+        return
+    writer.queue.put(None)
+    writer.join(timeout=2.0)
+
+
+atexit.register(_close_ui_log)
+
+
 def _install_excepthook() -> None:
     """Install a global exception hook to log unhandled exceptions to the UI log."""
     def _hook(exc_type, exc, tb):
         _write_ui_log("UNHANDLED EXCEPTION:\n" + "".join(traceback.format_exception(exc_type, exc, tb)))
+        _flush_ui_log()
         try:
             sys.__excepthook__(exc_type, exc, tb)
         except Exception:
@@ -73,13 +169,13 @@ _install_excepthook()
 
 
 # --- Additional Standard Imports ---
+import codecs
 import json
+import locale
 import re
-import socket
 import subprocess
-import threading
-import queue
 import urllib.error
+import urllib.parse
 import urllib.request
 import webbrowser
 
@@ -87,24 +183,37 @@ import webbrowser
 import tkinter as tk
 from tkinter import ttk, filedialog
 
-# Port used to ensure only one instance of the manager is running at a time
-SINGLE_INSTANCE_PORT = 5003
+# Optional: in-process port lookup (otherwise lsof / PowerShell is spawned)
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# Optional: push-based file change notifications (otherwise the server log is polled)
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Lock file used to ensure only one instance of the manager is running at a time
+# (shared with piper_server_ui.py, so the two UIs also exclude each other)
+SINGLE_INSTANCE_LOCK = SCRIPT_DIR / ".instance.lock"
 
 def check_single_instance() -> bool:
     """
-    Check if another instance is already running using a network socket.
+    Check if another instance is already running using an OS file lock.
     Returns True if this is the only instance, False otherwise.
     """
-    try:
-        # Try to bind to the dedicated port on localhost
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.bind(('127.0.0.1', SINGLE_INSTANCE_PORT))
-        # Persist the socket reference globally to keep it locked
-        globals()['_instance_socket'] = s
-        return True
-    except socket.error:
-        # Port already in use, instance already exists
+    lock = acquire_instance_lock(SINGLE_INSTANCE_LOCK)
+    if lock is None:
+        # Lock already held, instance already exists
         return False
+    # Persist the file handle globally to keep it locked
+    globals()['_instance_lock'] = lock
+    return True
 
 
 def _startup_shortcut_path() -> Path:
@@ -140,33 +249,24 @@ def _ps_single_quote(value: str) -> str:
 
 def _now() -> str:
     """Return the current time as a string."""
-    return time.strftime("%H:%M:%S")
+    return _timestamps()[2]
+
+
+# Lines kept in a log widget; older ones are trimmed on flush
+MAX_LOG_LINES = 5000
+# Delay before a batch of queued log lines is written to the widget (~30 Hz)
+LOG_FLUSH_MS = 33
 
 
 def log_to(widget: tk.Text, msg: str, save_to_file: bool = True) -> None:
     """
     Append a message to a Tkinter Text widget and optionally save to log file.
-    This function is thread-safe.
+    This function is thread-safe. Lines are batched and shown within ~33ms.
     """
     if save_to_file:
         _write_ui_log(msg)
 
-    def _execute():
-        try:
-            if not widget.winfo_exists():
-                return
-            widget.configure(state="normal")
-            widget.insert("end", f"[{_now()}] {msg}\n")
-            widget.see("end")
-            widget.configure(state="disabled")
-        except Exception:
-            pass
-
-    try:
-        widget.after(0, _execute)
-    except Exception:
-        # Fallback if widget is already destroyed
-        pass
+    text_log_buffer(widget, LOG_FLUSH_MS, MAX_LOG_LINES).push(f"[{_now()}] {msg}\n")
 
 
 def run_cmd_capture(args: list[str], cwd: Path | None = None) -> tuple[int, str]:
@@ -194,10 +294,38 @@ def run_cmd_capture(args: list[str], cwd: Path | None = None) -> tuple[int, str]
         return 1, str(e)
 
 
+_NEWLINE_RE = re.compile(r"\r\n|\r|\n")
+REALTIME_READ_SIZE = 1 << 16
+
+
+PROGRESS_PREFIX = "PROGRESS:"
+_PROGRESS_LEN = len(PROGRESS_PREFIX)
+
+
+def _handle_realtime_line(line_str: str, log_widget: tk.Text, progress_callback) -> None:
+    # Intercept progress markers for the UI bar
+    if line_str[:_PROGRESS_LEN] == PROGRESS_PREFIX:
+        # Protocol: PROGRESS:current/total
+        rest = line_str[_PROGRESS_LEN:]
+        slash = rest.find("/")
+        if slash > 0 and progress_callback:
+            try:
+                current = int(rest[:slash])
+                total = int(rest[slash + 1:])
+            except ValueError:
+                return
+            if total:
+                progress_callback(current * 100.0 / total, f"{current}/{total}")
+    else:
+        # Echo standard output to the manager's log window
+        log_to(log_widget, line_str, save_to_file=False)
+
+
 def run_cmd_realtime(args: list[str], log_widget: tk.Text, progress_callback=None, cwd: Path | None = None) -> int:
     """
     Execute a process and stream its output live to a Tkinter Text widget.
     Also parses 'PROGRESS:' messages to trigger UI progress bar updates.
+    Output is read in blocks and split into lines here, rather than one readline() per line.
     """
     try:
         kwargs = {}
@@ -209,36 +337,33 @@ def run_cmd_realtime(args: list[str], log_widget: tk.Text, progress_callback=Non
             cwd=str(cwd) if cwd else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
             shell=False,
-            bufsize=1, # Line buffering for interactive feedback
+            bufsize=REALTIME_READ_SIZE,
             **kwargs,
         )
 
-        full_output = []
         if p.stdout:
-            # Read output stream line by line
-            for line in iter(p.stdout.readline, ""):
-                line_str = line.strip()
-                # Intercept progress markers for the UI bar
-                if line_str.startswith("PROGRESS:"):
-                    try:
-                        # Protocol: PROGRESS:current/total
-                        parts = line_str.replace("PROGRESS:", "").split("/")
-                        if len(parts) == 2:
-                            current = int(parts[0])
-                            total = int(parts[1])
-                            percent = (current / total) * 100
-                            if progress_callback:
-                                progress_callback(percent, f"{current}/{total}")
-                    except Exception:
-                        pass
-                else:
-                    # Echo standard output to the manager's log window
-                    log_to(log_widget, line_str, save_to_file=False)
-                full_output.append(line)
-        
-        p.stdout.close()
+            # Same decoding text=True would use, fed incrementally so split characters survive
+            decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace")
+            pending = ""
+            while True:
+                # read1 returns whatever is available (up to the limit) instead of waiting to fill it
+                chunk = p.stdout.read1(REALTIME_READ_SIZE)
+                if not chunk:
+                    break
+                pending += decoder.decode(chunk)
+                # Hold back a trailing '\r' in case its '\n' arrives in the next block
+                cut = len(pending) - 1 if pending.endswith("\r") else len(pending)
+                *lines, pending_tail = _NEWLINE_RE.split(pending[:cut])
+                pending = pending_tail + pending[cut:]
+                for line in lines:
+                    _handle_realtime_line(line.strip(), log_widget, progress_callback)
+            pending += decoder.decode(b"", final=True)
+            for line in _NEWLINE_RE.split(pending.rstrip("\r")):
+                if line:
+                    _handle_realtime_line(line.strip(), log_widget, progress_callback)
+
+            p.stdout.close()
         return_code = p.wait()
         return return_code
     except Exception as e:
@@ -246,18 +371,55 @@ def run_cmd_realtime(args: list[str], log_widget: tk.Text, progress_callback=Non
         return 1
 
 
+# Written into the venv after a successful dependency check; see _deps_marker_key()
+DEPS_MARKER = VENV_DIR / ".deps_ok"
+
+
+def _deps_marker_key() -> str | None:
+    """Identity of the verified setup: venv interpreter + requirements.txt mtimes.
+    Rebuilding the venv or editing requirements changes it and forces a re-check."""
+    try:
+        req_mtime = (SCRIPT_DIR / "requirements.txt").stat().st_mtime_ns
+        return f"{VENV_PYTHON.stat().st_mtime_ns}:{req_mtime}"
+    except OSError:
+        return None
+
+
+def _write_deps_marker() -> None:
+    key = _deps_marker_key()
+    if key:
+        try:
+            DEPS_MARKER.write_text(key, encoding="utf-8")
+        except OSError:
+            pass
+
+
 def ensure_venv_and_deps(log: tk.Text) -> bool:
     """
     Self-healing setup: ensures the .venv exists, is compatible (Python < 3.13),
     and has all required packages installed.
     """
+    # Fast path: this exact venv already passed the checks below, so skip spawning
+    # the interpreter twice (version probe + import probe) on every server start.
+    key = _deps_marker_key()
+    if key:
+        try:
+            if DEPS_MARKER.read_text(encoding="utf-8") == key:
+                return True
+        except OSError:
+            pass
+
     # Audio-related libraries (pydub) are currently incompatible with Python 3.13 due to 'audioop' removal.
     if VENV_PYTHON.exists():
         try:
             code, out = run_cmd_capture([str(VENV_PYTHON), "--version"])
             if " 3.13" in out or " 3.14" in out:
                 log_to(log, "Incompatible environment (Python 3.13+ detected). Re-initializing with 3.10...")
-                shutil.rmtree(VENV_DIR, ignore_errors=True)
+                # Parallel delete (venvs hold thousands of small files); sweep up any leftovers
+                try:
+                    fast_rmtree(VENV_DIR)
+                except OSError:
+                    shutil.rmtree(VENV_DIR, ignore_errors=True)
         except Exception:
             pass
 
@@ -292,6 +454,7 @@ def ensure_venv_and_deps(log: tk.Text) -> bool:
     # Optimization: Verify if major dependencies are already active to skip pip lag
     code, _ = run_cmd_capture([str(VENV_PYTHON), "-c", "import fastapi; import uvicorn; import pydub; import numpy"], cwd=SCRIPT_DIR)
     if code == 0:
+        _write_deps_marker()
         return True
 
     log_to(log, "Installing/Updating library dependencies (pip)...")
@@ -307,6 +470,7 @@ def ensure_venv_and_deps(log: tk.Text) -> bool:
         log_to(log, f"Critical Failure: pip installation failed (code {code}):\n{out}")
         return False
 
+    _write_deps_marker()
     return True
 
 
@@ -334,58 +498,151 @@ STARTER_MODELS = {
     }
 }
 
+# Copy size for model downloads: 1 MiB per read instead of urlretrieve's 8 KiB blocks
+DOWNLOAD_CHUNK = 1 << 20
+
+# Remote validators (ETag / Last-Modified) of the starter files, {url: {"etag": ..., "checked": epoch}}
+STARTER_ETAGS_PATH = SCRIPT_DIR / ".starter_etags.json"
+# Files already on disk are revalidated with a HEAD request at most this often
+STARTER_RECHECK_SECS = 7 * 24 * 3600
+
+
+def _response_validator(headers) -> str | None:
+    return headers.get("ETag") or headers.get("Last-Modified")
+
+
+class _HeadRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """urllib turns a redirected HEAD into a GET; keep it a HEAD so no body is fetched."""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        new = super().redirect_request(req, fp, code, msg, headers, newurl)
+        if new is not None:
+            new.method = req.get_method()
+        return new
+
+
+_HEAD_OPENER = urllib.request.build_opener(_HeadRedirectHandler)
+
+
+def _head_validator(url: str) -> str | None:
+    """ETag (or Last-Modified) of url via HEAD, or None if it can't be determined."""
+    try:
+        with _HEAD_OPENER.open(urllib.request.Request(url, method="HEAD"), timeout=5) as resp:
+            return _response_validator(resp.headers)
+    except Exception:
+        return None
+
+
+def _load_starter_etags() -> dict:
+    try:
+        data = json.loads(STARTER_ETAGS_PATH.read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _save_starter_etags(etags: dict) -> None:
+    try:
+        STARTER_ETAGS_PATH.write_text(json.dumps(etags, indent=2), encoding="utf-8")
+    except Exception:
+        pass
+
+
+def _stream_download(url: str, dest: Path) -> str | None:
+    """Download url to dest, copying the response in 1 MiB blocks. Returns the response's validator."""
+    with urllib.request.urlopen(url, timeout=60) as resp, open(dest, "wb", buffering=DOWNLOAD_CHUNK) as f:
+        shutil.copyfileobj(resp, f, length=DOWNLOAD_CHUNK)
+        return _response_validator(resp.headers)
+
+
+def _download_starter_file(log: tk.Text, name: str, kind: str, url: str, dest: Path,
+                           update: bool = False) -> tuple[str, str, bool, str | None]:
+    """Fetch one starter file to a .tmp sibling, then rename it into place.
+    Returns (name, kind, ok, remote validator)."""
+    # Atomic-like download: fetch to a .tmp file first to prevent half-finished garbage
+    temp_path = dest.with_suffix(".tmp")
+    try:
+        if kind == "onnx":
+            if update:
+                log_to(log, f"Model Update: A newer {name} is available, downloading...")
+            else:
+                log_to(log, f"Model Missing: Initializing download for {name}...")
+            log_to(log, f"  Fetching from: {url}...")
+
+        validator = _stream_download(url, temp_path)
+
+        # Commit the download by renaming on success (raises if the temp file is gone)
+        os.replace(temp_path, dest)
+        invalidate_voice_cache()
+        if kind == "onnx":
+            log_to(log, f"  Deployment successful: {dest.name}")
+        else:
+            log_to(log, f"  Configuration loaded for {name}")
+        return name, kind, True, validator
+    except Exception as e:
+        with contextlib.suppress(OSError):
+            temp_path.unlink()
+        what = name if kind == "onnx" else f"config for {name}"
+        log_to(log, f"Failed to acquire {what}: {e}")
+        return name, kind, False, None
+
+
 def ensure_starter_models(log: tk.Text) -> bool:
     """
     Checks for the minimum set of voice models and downloads them from Hugging Face if missing.
     Ensures both the .onnx model and the .onnx.json configuration are present.
+    Missing files are fetched concurrently (each transfer is independent and network-bound).
+    Files already on disk are revalidated weekly with parallel HEAD requests and only
+    re-downloaded when the remote ETag changed.
     """
     voices_root = SCRIPT_DIR.parent
-    
-    all_good = True
-    
+    etags = _load_starter_etags()
+    now = time.time()
+
+    tasks = []
+    stale = []
     for name, info in STARTER_MODELS.items():
         onnx_path = voices_root / info["rel_path"]
         json_path = onnx_path.with_suffix(".onnx.json")
         
         # Structure the voices/ sub-folder (e.g., voices/Ryan/)
         onnx_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Validate/Download the primary ONNX binary
-        if not onnx_path.exists():
-            log_to(log, f"Model Missing: Initializing download for {name}...")
-            try:
-                log_to(log, f"  Fetching from: {info['onnx_url']}...")
-                
-                # Atomic-like download: fetch to a .tmp file first to prevent half-finished garbage
-                temp_path = onnx_path.with_suffix(".tmp")
-                urllib.request.urlretrieve(info["onnx_url"], temp_path)
-                
-                # Commit the download by renaming on success
-                if temp_path.exists():
-                    temp_path.replace(onnx_path)
-                    log_to(log, f"  Deployment successful: {onnx_path.name}")
-                else:
-                    log_to(log, f"  Critical Error: Temporary file disappeared during download for {name}")
-                    all_good = False
-                    
-            except Exception as e:
-                log_to(log, f"Failed to acquire {name}: {e}")
-                all_good = False
-                continue
 
-        # Validate/Download the metadata JSON
-        if not json_path.exists():
-            try:
-                # Small config file, fetch and move
-                temp_json = json_path.with_suffix(".tmp")
-                urllib.request.urlretrieve(info["json_url"], temp_json)
-                
-                if temp_json.exists():
-                    temp_json.replace(json_path)
-                    log_to(log, f"  Configuration loaded for {name}")
-            except Exception as e:
-                log_to(log, f"Failed to acquire config for {name}: {e}")
-                all_good = False
+        # The model and its metadata JSON are separate tasks; the small JSON
+        # overlaps the large model transfer.
+        for kind, url, path in (("onnx", info["onnx_url"], onnx_path), ("json", info["json_url"], json_path)):
+            if not path.exists():
+                tasks.append((name, kind, url, path))
+            elif now - etags.get(url, {}).get("checked", 0) > STARTER_RECHECK_SECS:
+                stale.append((name, kind, url, path))
+
+    etags_changed = False
+    if stale:
+        with ThreadPoolExecutor(max_workers=min(8, len(stale))) as ex:
+            validators = list(ex.map(lambda t: _head_validator(t[2]), stale))
+        for (name, kind, url, path), validator in zip(stale, validators):
+            if validator is None:
+                continue  # offline or no validator; try again next launch
+            known = etags.get(url, {}).get("etag")
+            if known and known != validator:
+                tasks.append((name, kind, url, path, True))
+            else:
+                # First sighting of an existing file is taken as current
+                etags[url] = {"etag": validator, "checked": now}
+                etags_changed = True
+
+    all_good = True
+    if tasks:
+        with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as ex:
+            results = list(ex.map(lambda t: _download_starter_file(log, *t), tasks))
+        all_good = all(ok for _name, _kind, ok, _validator in results)
+        for task, (_name, _kind, ok, validator) in zip(tasks, results):
+            if ok and validator:
+                etags[task[2]] = {"etag": validator, "checked": now}
+                etags_changed = True
+
+    if etags_changed:
+        _save_starter_etags(etags)
     
     if all_good:
         log_to(log, "Default voice model state verified.")
@@ -411,27 +668,18 @@ def ensure_piper_binary(log: tk.Text) -> bool:
 
     log_to(log, "Core binary 'piper' not found. Launching downloader...")
     
-    # Capture the downloader's terminal output and pipe it into the UI log
-    class LogRedirect:
-        def __init__(self, text_widget):
-            self.text_widget = text_widget
-        def write(self, msg):
-            if msg.strip():
-                # Relay to UI thread safely via after()
-                self.text_widget.after(0, lambda: log_to(self.text_widget, msg.strip()))
-        def flush(self):
-            pass
+    # Relay the downloader's status messages to the UI log via after() (thread-safe)
+    def relay(msg: str) -> None:
+        msg = msg.strip()
+        if msg:
+            log.after(0, log_to, log, msg)
 
-    original_stdout = sys.stdout
     try:
-        sys.stdout = LogRedirect(log)
         # Execute the automated download and extraction logic
-        download_piper.download_and_extract_piper(SCRIPT_DIR)
+        download_piper.download_and_extract_piper(SCRIPT_DIR, log=relay)
     except Exception as e:
         log_to(log, f"Binary deployment failure: {e}")
         return False
-    finally:
-        sys.stdout = original_stdout
 
     # Final check of disk state
     if (piper_dir / exe_name).exists() or (piper_dir / "piper" / exe_name).exists():
@@ -442,30 +690,40 @@ def ensure_piper_binary(log: tk.Text) -> bool:
     return False
 
 
-def http_get_json(url: str, timeout: float = 5.0) -> dict:
-    """Perform an HTTP GET request and return the JSON response."""
-    req = urllib.request.Request(url, method="GET")
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        data = resp.read()
-    return json.loads(data.decode("utf-8"))
+def powershell(args: str) -> tuple[int, str]:
+    """Run a PowerShell command and return its exit code and output."""
+    return run_cmd_capture(["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-Command", args], cwd=SCRIPT_DIR)
 
 
-def http_post_json(url: str, payload: dict, timeout: float = 10.0) -> bytes:
-    """Perform an HTTP POST request with a JSON payload and return the response bytes."""
-    data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        method="POST",
-        data=data,
-        headers={"Content-Type": "application/json"},
-    )
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return resp.read()
+def _stop_port_listeners_psutil(log: tk.Text, port: int) -> bool | None:
+    """
+    Kills whatever is listening on the TCP port without spawning a helper process.
+    Returns None when the connection table can't be read (e.g. macOS without root),
+    so the caller falls back to lsof / PowerShell.
+    """
+    try:
+        conns = psutil.net_connections(kind="tcp")
+    except (psutil.AccessDenied, OSError):
+        return None
+
+    pids = sorted({c.pid for c in conns
+                   if c.pid and c.laddr and c.laddr.port == port and c.status == psutil.CONN_LISTEN})
+    if not pids:
+        log_to(log, f"No active listener detected on port {port}.")
+        return True
 
+    try:
+        for pid in pids:
+            try:
+                psutil.Process(pid).kill()
+            except psutil.NoSuchProcess:
+                pass
+    except Exception as e:
+        log_to(log, f"Port Reclamation failed: {e}")
+        return False
 
-def powershell(args: str) -> tuple[int, str]:
-    """Run a PowerShell command and return its exit code and output."""
-    return run_cmd_capture(["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-Command", args], cwd=SCRIPT_DIR)
+    log_to(log, f"Successfully reclaimed port {port} (Terminated PIDs: {', '.join(map(str, pids))}).")
+    return True
 
 
 def stop_server_by_port(log: tk.Text, port: int) -> bool:
@@ -473,6 +731,11 @@ def stop_server_by_port(log: tk.Text, port: int) -> bool:
     Finds and terminates any process currently bound to the specified TCP port.
     Crucial for clearing 'ghost' processes before starting a new server instance.
     """
+    if PSUTIL_AVAILABLE:
+        result = _stop_port_listeners_psutil(log, port)
+        if result is not None:
+            return result
+
     if os.name != "nt":
         # Unix-like (Mac/Linux) port cleanup using the 'lsof' utility
         if not shutil.which("lsof"):
@@ -561,9 +824,12 @@ def start_server_process(log: tk.Text, host: str, port: int) -> bool:
         kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP | getattr(subprocess, "CREATE_NO_WINDOW", 0)
 
     try:
+        # All three std streams share the one null handle Popen opens for DEVNULL, so
+        # nothing of the UI's console (or pythonw's missing one) is duplicated into the child
         subprocess.Popen(
             cmd,
             cwd=str(SCRIPT_DIR),
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.DEVNULL, # Server logs its own data to piper_server.log
             stderr=subprocess.DEVNULL,
             **kwargs,
@@ -791,12 +1057,59 @@ def autostart_query() -> tuple[bool, str]:
         return False, "Disabled"
 
 
+# (mtime_ns of every directory under voices/, sorted .onnx paths) from the last walk
+_VOICES_CACHE: tuple[dict[str, int], list[Path]] | None = None
+
+
+def invalidate_voice_cache() -> None:
+    """Forget the cached scan so the next scan_voices() walks voices/ again."""
+    global _VOICES_CACHE
+    _VOICES_CACHE = None
+
+
+def _voice_dirs_unchanged(dir_mtimes: dict[str, int]) -> bool:
+    # Adding/removing a file or folder bumps its parent's mtime, so checking
+    # every known directory catches changes at any depth without re-walking
+    try:
+        return all(os.stat(d).st_mtime_ns == m for d, m in dir_mtimes.items())
+    except OSError:
+        return False
+
+
 def scan_voices() -> list[Path]:
-    """Scan voices/ folder for all .onnx files."""
+    """Scan voices/ folder for all .onnx files (cached until a directory changes)."""
+    global _VOICES_CACHE
     voices_dir = SCRIPT_DIR.parent / "voices"
     if not voices_dir.exists():
         return []
-    return sorted(voices_dir.rglob("*.onnx"))
+
+    cached = _VOICES_CACHE
+    if cached is not None and _voice_dirs_unchanged(cached[0]):
+        return list(cached[1])
+
+    dir_mtimes: dict[str, int] = {}
+    paths: list[Path] = []
+    try:
+        stack = [(str(voices_dir), os.stat(voices_dir).st_mtime_ns)]
+    except OSError:
+        return []
+    # Iterative scandir walk: DirEntry already knows its type (and, on Windows,
+    # its stat), so only matching files become Path objects
+    while stack:
+        root, mtime = stack.pop()
+        dir_mtimes[root] = mtime
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, entry.stat(follow_symlinks=False).st_mtime_ns))
+                    elif entry.name.endswith(".onnx"):
+                        paths.append(Path(entry.path))
+        except OSError:
+            continue
+    paths.sort()
+    _VOICES_CACHE = (dir_mtimes, paths)
+    return list(paths)
 
 
 def load_config() -> dict:
@@ -889,6 +1202,11 @@ class App(ttk.Frame):
                 return
             time.sleep(2)
             
+        changed = threading.Event()
+        observer = self._watch_file(server_log, changed)
+        # With notifications the timeout is only a safety net; otherwise it is the poll interval
+        idle_wait = 5.0 if observer else 0.5
+
         try:
             with open(server_log, "r", encoding="utf-8") as f:
                 # Start reading from the current end of the file
@@ -897,16 +1215,43 @@ class App(ttk.Frame):
                     if not self.master.winfo_exists():
                         # Stop trailing if the UI window is closed
                         break
-                    line = f.readline()
-                    if line:
-                        msg = line.strip()
-                        if msg:
-                            # Update UI from thread: use after() and disable recursive disk logging
-                            self.master.after(0, lambda m=msg: log_to(self.log, f"[SERVER] {m}", save_to_file=False))
+                    changed.clear()
+                    msgs = [m for m in (line.strip() for line in f.readlines()) if m]
+                    if msgs:
+                        # log_to is thread-safe and batches lines into one widget insert; each line
+                        # still gets its own timestamp. No disk logging (it's already in the file).
+                        for m in msgs:
+                            log_to(self.log, f"[SERVER] {m}", save_to_file=False)
                     else:
-                        time.sleep(0.5) # Efficiency pause
+                        changed.wait(idle_wait)
         except Exception:
             pass
+        finally:
+            if observer:
+                observer.stop()
+
+    @staticmethod
+    def _watch_file(path: Path, changed: threading.Event):
+        """Start a watchdog observer that sets `changed` whenever `path` is written.
+        Returns the observer, or None when watchdog is unavailable or fails to start."""
+        if not WATCHDOG_AVAILABLE:
+            return None
+
+        target = os.path.normcase(str(path))
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if os.path.normcase(str(event.src_path)) == target:
+                    changed.set()
+
+        try:
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(_Handler(), str(path.parent), recursive=False)
+            observer.start()
+            return observer
+        except Exception:
+            return None
 
     def _initial_setup_check(self) -> None:
         """
@@ -6,35 +6,60 @@ Copyright (c) 2026 PiperTTS Mockingbird Developers
 
 from __future__ import annotations
 
+import base64
+import copy
 import json
 import os
 import sys
 import subprocess
 import tempfile
 import threading
+import wave
 import queue
 import time
 import re
 import asyncio
+import atexit
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import FastAPI, Response, UploadFile, File, Form, HTTPException, Request
-from fastapi.responses import StreamingResponse, HTMLResponse, FileResponse
+from fastapi.responses import StreamingResponse, HTMLResponse, FileResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import List, Dict, Optional
+from starlette.formparsers import MultiPartParser
 from starlette.middleware.base import BaseHTTPMiddleware
 import logging
 import shutil
-import urllib.request
 import zipfile
+from stat import S_ISREG
 import io
 from logging.handlers import RotatingFileHandler
 from training_manager import training_manager
 
+# Optional C-accelerated JSON; the stdlib json module is used when it's missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Optional pywin32: create .lnk shortcuts in-process instead of via PowerShell
+try:
+    import pythoncom
+    import win32com.client
+    WIN32COM_AVAILABLE = True
+except ImportError:
+    pythoncom = None
+    WIN32COM_AVAILABLE = False
+
 # Common utilities for sanitization and config management
-from common_utils import validate_voice_name, safe_config_save, safe_config_load
+from common_utils import validate_voice_name, safe_config_save, safe_config_load, fast_rmtree
 
 # Home Assistant & Wyoming integration imports
 from ha_export import HomeAssistantExporter
@@ -45,10 +70,22 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 
 # Root folder where Piper training "dojos" live.
 DOJO_ROOT = SCRIPT_DIR.parent / "training" / "make piper voice models" / "tts_dojo"
+PRETRAINED_ROOT = DOJO_ROOT / "PRETRAINED_CHECKPOINTS"
+
+# Installed voice models (custom/ holds user-imported packages)
+VOICES_ROOT = SCRIPT_DIR.parent / "voices"
+CUSTOM_VOICES_ROOT = VOICES_ROOT / "custom"
+HOW_TO_ADD_MD = VOICES_ROOT / "HOW_TO_ADD_VOICES.md"
+_VOICES_REAL = os.path.realpath(VOICES_ROOT)
 
 
+@lru_cache(maxsize=256)
 def _validate_voice_name(voice: str) -> str:
-    """Wrapper for the common sanitization utility."""
+    """Wrapper for the common sanitization utility.
+
+    validate_voice_name is pure, so valid names are memoized (invalid ones raise
+    and are never cached).
+    """
     return validate_voice_name(voice)
 
 # Setup logging
@@ -85,13 +122,27 @@ logging.basicConfig(
 
 logger = logging.getLogger("piper_server")
 
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that encodes with orjson when it is installed.
+
+    Installed as the app's default response class: endpoints that return large
+    segment lists spend most of their response time encoding floats.
+    """
+
+    def render(self, content) -> bytes:
+        if not ORJSON_AVAILABLE:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
 # Initialize FastAPI application
 app = FastAPI(
     title="PiperTTS Mockingbird API",
     description="Local, private text-to-speech server with custom voice training",
     version="1.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=FastJSONResponse,
 )
 
 # Security headers middleware (invisible protection)
@@ -118,7 +169,7 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
         
         # Allow health check and docs without authentication
-        if request.url.path in ["/", "/health", "/api/docs", "/api/redoc", "/api/openapi.json"]:
+        if request.url.path in ["/", "/health", "/ping", "/api/docs", "/api/redoc", "/api/openapi.json"]:
             return await call_next(request)
         
         # Check for API key in header or query parameter
@@ -160,6 +211,26 @@ PROCESS_IDLE_TIMEOUT_SECONDS = 120  # Clean up processes idle for 2 minutes (mem
 MAX_CONCURRENT_PROCESSES = int(os.environ.get("PIPER_MAX_PROCESSES", "3"))  # Limit concurrent voice processes
 MAX_TEXT_LENGTH = int(os.environ.get("PIPER_MAX_TEXT_LENGTH", "100000"))  # Max characters (will be chunked)
 CHUNK_SIZE = int(os.environ.get("PIPER_CHUNK_SIZE", "5000"))  # Characters per chunk for long texts
+# Threads used to size dojos in parallel for the storage dashboard (1 = scan sequentially,
+# e.g. when antivirus on-access scanning makes parallel walks slower)
+STORAGE_SCAN_WORKERS = int(os.environ.get("PIPER_STORAGE_SCAN_WORKERS", str(min(32, (os.cpu_count() or 1) * 4))))
+
+# Shared worker pool for fire-and-forget endpoint jobs (model/tool downloads).
+# Bounded so a burst of requests queues up instead of spawning a thread each.
+_BG_EXEC = ThreadPoolExecutor(max_workers=4, thread_name_prefix="piper-bg")
+
+
+def _submit_bg(fn, *args):
+    """Run fn(*args) on the shared background pool, logging any failure (futures swallow them)."""
+    def _log_failure(fut):
+        if fut.cancelled():
+            return
+        exc = fut.exception()
+        if exc is not None:
+            logger.error(f"Background task {getattr(fn, '__name__', fn)} failed: {exc}", exc_info=exc)
+    fut = _BG_EXEC.submit(fn, *args)
+    fut.add_done_callback(_log_failure)
+    return fut
 
 # Default model to prefer if multiple are found
 PREFERRED_MODEL = "en_US-hfc_female-medium.onnx"
@@ -196,6 +267,13 @@ STARTER_MODELS = {
     }
 }
 
+# Flat, immutable view of STARTER_MODELS built once for the download worker
+StarterModel = namedtuple("StarterModel", "name rel_path onnx_url json_url")
+STARTER_RECORDS = tuple(
+    StarterModel(name, info["rel_path"], info["onnx_url"], info["json_url"])
+    for name, info in STARTER_MODELS.items()
+)
+
 # Cache for available models to avoid frequent disk scans
 _MODEL_CACHE: list[Path] = []
 _LAST_CACHE_UPDATE: float = 0
@@ -209,6 +287,11 @@ _CONFIG_CACHE_MAX_SIZE = 100  # Maximum number of cached configs
 _PARAGRAPH_SPLIT_PATTERN = re.compile(r'\n\s*\n|\n(?=\s{2,})')
 _SENTENCE_SPLIT_PATTERN = re.compile(r'([.!?]+(?:[\s"\')]|$))')
 _INVISIBLE_CHARS = ['\u200b', '\u200c', '\u200d', '\ufeff']
+_SAFE_NAME_RE = re.compile(r'[^a-zA-Z0-9._-]')
+# Voice names accepted by the Home Assistant export endpoints (\Z: no trailing newline)
+_VOICE_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]{1,64}\Z')
+# Characters stripped from uploaded master-audio filenames in a single translate() pass
+_UPLOAD_NAME_STRIP = str.maketrans('', '', '\0/\\')
 
 
 class TTSReq(BaseModel):
@@ -841,8 +924,9 @@ def get_sentence_silence_seconds() -> float | None:
     return value
 
 
+@lru_cache(maxsize=4096)
 def format_bytes(size: int) -> str:
-    """Formats bytes into human readable string."""
+    """Formats bytes into human readable string (memoized; sizes repeat across listings)."""
     for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
         if size < 1024.0:
             return f"{size:.2f} {unit}"
@@ -924,21 +1008,113 @@ def invalidate_voice_cache() -> None:
     _VOICES_DIR_MTIME = 0
 
 
-def get_size_bytes(path: Path) -> int:
-    """Robustly calculates size in bytes for a file or directory."""
+def _scan_dir_sized(path) -> tuple[int, dict[str, int]]:
+    """Walk a directory tree with os.scandir in one pass.
+
+    Returns (total_bytes, {top_level_entry_name: bytes}). Sizes come from
+    DirEntry.stat(), which scandir caches per entry, so nothing is stat'ed twice.
+    Symlinks are counted as links, not followed.
+    """
     total = 0
-    try:
-        if not path.exists(): return 0
-        if path.is_file(): return path.stat().st_size
-        for root, dirs, files in os.walk(path):
-            for f in files:
+    children: dict[str, int] = {}
+    stack: list[tuple[str, str | None]] = [(os.fspath(path), None)]
+    while stack:
+        current, top = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = top if top is not None else entry.name
                 try:
-                    total += os.path.getsize(os.path.join(root, f))
-                except (OSError, PermissionError):
+                    if entry.is_dir(follow_symlinks=False):
+                        children.setdefault(name, 0)
+                        stack.append((entry.path, name))
+                        continue
+                    size = entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+                total += size
+                children[name] = children.get(name, 0) + size
+    return total, children
+
+
+def _iter_files_scandir(path, suffix: str):
+    """Yield DirEntry objects for files under path whose name ends with suffix (case-insensitive)."""
+    suffix = suffix.lower()
+    stack = [os.fspath(path)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(suffix) and entry.is_file():
+                        yield entry
+                except OSError:
                     continue
-    except Exception:
-        pass
-    return total
+
+
+def _entry_size(entry: os.DirEntry, is_dir: bool | None = None) -> int:
+    """Size of a scandir entry: the file size, or the recursive total for a folder.
+
+    Pass is_dir when the caller already asked the entry, to skip the repeat lookup.
+    """
+    try:
+        if is_dir is None:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        if is_dir:
+            return _scan_dir_sized(entry.path)[0]
+        return entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        return 0
+
+
+def get_size_bytes(path: Path) -> int:
+    """Robustly calculates size in bytes for a file or directory."""
+    try:
+        if os.path.isdir(path):
+            return _scan_dir_sized(path)[0]
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+_COPY_BUFSIZE = 1 << 20  # 1 MiB chunks for userspace copies
+_SENDFILE_CHUNK = 16 << 20  # 16 MiB per sendfile() call
+# Starlette keeps uploads up to this size in memory and spools larger ones to disk
+_UPLOAD_SPOOL_MAX = getattr(MultiPartParser, "spool_max_size", 1024 * 1024)
+
+
+def _fast_save(src, dst_path: Path, size: int | None = None) -> None:
+    """Copy an uploaded file object to dst_path with as few syscalls as possible.
+
+    On Linux, uploads known to be spooled to disk (size above Starlette's spool
+    threshold) are copied in kernel space via os.sendfile(). Everything else
+    (in-memory spools, unknown sizes, other platforms) falls back to a buffered
+    copy with 1 MiB chunks instead of the 16 KiB default. Blocking: call it via
+    asyncio.to_thread from async handlers.
+    """
+    with open(dst_path, "wb") as dst:
+        # SpooledTemporaryFile.fileno() forces small in-memory uploads to disk,
+        # so only take the sendfile path when the spool has already rolled over.
+        if sys.platform.startswith("linux") and size is not None and size > _UPLOAD_SPOOL_MAX:
+            try:
+                src_fd = src.fileno()
+                dst_fd = dst.fileno()
+                while os.sendfile(dst_fd, src_fd, None, _SENDFILE_CHUNK) > 0:
+                    pass
+                return
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                # Not a real fd (or kernel refused); finish with a plain copy
+                # from wherever the file position was left.
+                pass
+        shutil.copyfileobj(src, dst, length=_COPY_BUFSIZE)
 
 
 def get_model_path_by_name(name: str) -> Path | None:
@@ -955,7 +1131,7 @@ def get_model_path_by_name(name: str) -> Path | None:
     global _MODEL_MAP_CACHE, _LAST_CACHE_UPDATE, _VOICES_DIR_MTIME
     
     # Check if voices directory has been modified
-    voices_dir = SCRIPT_DIR.parent / "voices"
+    voices_dir = VOICES_ROOT
     should_refresh = not _MODEL_MAP_CACHE
     
     if voices_dir.exists():
@@ -975,7 +1151,7 @@ def get_model_path_by_name(name: str) -> Path | None:
     # Refresh if needed
     if should_refresh:
         new_map = {}
-        search_roots = [(SCRIPT_DIR.parent / "voices", True), (SCRIPT_DIR, False)]
+        search_roots = [(VOICES_ROOT, True), (SCRIPT_DIR, False)]
         
         for root, recursive in search_roots:
             if not root.exists(): continue
@@ -1068,10 +1244,74 @@ def list_voices():
         return VoicesResponse(success=False, voices=[], count=0)
 
 
+# Last parsed config.json, keyed by (st_mtime_ns, st_size) of the file it came from
+_CFG_CACHE = {"key": None, "val": None}
+_cfg_lock = threading.Lock()
+
+
 def load_config() -> dict:
-    """Load config.json safely with backup recovery."""
+    """Load config.json safely with backup recovery.
+
+    The parsed dict is memoized on the file's mtime and size, so status polls only
+    pay for a stat() until the file changes. Callers get their own deep copy.
+    """
+    config_path = SCRIPT_DIR / "config.json"
+    try:
+        st = config_path.stat()
+        key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+
+    if key is not None:
+        with _cfg_lock:
+            if _CFG_CACHE["key"] == key:
+                return copy.deepcopy(_CFG_CACHE["val"])
+
+    cfg = safe_config_load(config_path)
+    if key is not None:
+        with _cfg_lock:
+            _CFG_CACHE["key"] = key
+            _CFG_CACHE["val"] = copy.deepcopy(cfg)
+    return cfg
+
+
+def save_config(cfg: dict) -> None:
+    """Write config.json through safe_config_save (.bak rotation, fsync, atomic replace).
+
+    Raises OSError if the write failed, so callers can report it.
+    """
     config_path = SCRIPT_DIR / "config.json"
-    return safe_config_load(config_path)
+    ok = safe_config_save(config_path, cfg, indent=4)
+    with _cfg_lock:
+        _CFG_CACHE["key"] = None
+    if not ok:
+        raise OSError(f"Failed to save {config_path}")
+
+
+# Serializes every load-modify-save of config.json so concurrent requests don't drop each other's keys
+_cfg_write_lock = threading.Lock()
+
+
+def set_config_value(key: str, value) -> bool:
+    """Set one config.json key, skipping the write when it already holds value.
+
+    Returns True if the file was rewritten.
+    """
+    with _cfg_write_lock:
+        cfg = load_config()
+        if key in cfg and cfg[key] == value:
+            return False
+        cfg[key] = value
+        save_config(cfg)
+        return True
+
+
+def update_config(values: dict) -> None:
+    """Merge values into config.json under the same lock as set_config_value."""
+    with _cfg_write_lock:
+        cfg = load_config()
+        cfg.update(values)
+        save_config(cfg)
 
 
 def resolve_model_path(requested_voice: str | None = None) -> Path:
@@ -1088,8 +1328,7 @@ def resolve_model_path(requested_voice: str | None = None) -> Path:
     requested_voice = (requested_voice or "").strip()
     
     # Allowed directories for security (prevent path traversal)
-    dojo_root = SCRIPT_DIR.parent / "training" / "make piper voice models" / "tts_dojo"
-    allowed_roots = [SCRIPT_DIR.parent / "voices", SCRIPT_DIR, dojo_root]
+    allowed_roots = [VOICES_ROOT, SCRIPT_DIR, DOJO_ROOT]
 
     if requested_voice:
         # Allow either an explicit path to a .onnx file, or a bare filename.
@@ -1157,6 +1396,14 @@ def resolve_model_path(requested_voice: str | None = None) -> Path:
 
 _SERVER_START_TIME = time.time()
 
+@app.api_route("/ping", methods=["GET", "HEAD"], tags=["System"])
+def ping():
+    """
+    Bare liveness check for pollers: 204 with no body.
+    Unlike /health it does no voice scan and builds no JSON.
+    """
+    return Response(status_code=204)
+
 @app.get("/health", response_model=HealthResponse, tags=["System"])
 def health():
     """
@@ -1524,6 +1771,7 @@ class DetectNonsilentRequest(BaseModel):
     silence_thresh_offset_db: float = -16.0
     pad_ms: int = 200
     min_segment_ms: int = 500
+    columnar: bool = False  # return starts_ms/ends_ms arrays instead of segment objects
 
 
 class SegmentMs(BaseModel):
@@ -1531,10 +1779,26 @@ class SegmentMs(BaseModel):
     end_ms: float
 
 
+def _segments_body(pairs, columnar: bool = False) -> dict:
+    """Build the segment portion of a slicer response.
+
+    The default is a list of {"start_ms", "end_ms"} objects. Columnar output uses
+    parallel starts_ms/ends_ms arrays, which is about half the JSON and lets the
+    client decode straight into typed arrays.
+    """
+    if columnar:
+        return {
+            "starts_ms": [float(s) for s, _ in pairs],
+            "ends_ms": [float(e) for _, e in pairs],
+        }
+    return {"segments": [{"start_ms": float(s), "end_ms": float(e)} for s, e in pairs]}
+
+
 class VoiceLabelRequest(BaseModel):
     voice: str
     segments: list[SegmentMs]
     k: int = 2
+    columnar: bool = False  # return starts_ms/ends_ms arrays instead of segment objects
 
 
 class VoiceSplitRequest(BaseModel):
@@ -1544,6 +1808,7 @@ class VoiceSplitRequest(BaseModel):
     hop_s: float = 0.5
     thresh: float = 0.78
     min_seg_s: float = 1.0
+    columnar: bool = False  # return starts_ms/ends_ms arrays instead of segment objects
 
 
 class VoiceFilterRequest(BaseModel):
@@ -1553,6 +1818,7 @@ class VoiceFilterRequest(BaseModel):
     ref_end_ms: float
     threshold: float = 0.78
     mode: str = "keep"  # keep|remove
+    columnar: bool = False  # return starts_ms/ends_ms arrays instead of segment objects
 
 
 @app.post("/api/training/create")
@@ -1678,9 +1944,14 @@ def download_wavs_zip(voice: str):
 
     mem = io.BytesIO()
     with zipfile.ZipFile(mem, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for p in sorted(wav_folder.glob("*.wav")):
+        with os.scandir(wav_folder) as it:
+            entries = sorted(
+                (e for e in it if e.name.lower().endswith(".wav") and e.is_file()),
+                key=lambda e: e.name,
+            )
+        for e in entries:
             # Store only filename in zip to mimic 'export folder' behavior
-            zf.write(p, arcname=p.name)
+            zf.write(e.path, arcname=e.name)
         # include metadata.csv if present
         meta = dojo_path / "dataset" / "metadata.csv"
         if meta.exists():
@@ -1699,27 +1970,46 @@ async def upload_audio(voice: str, file: UploadFile = File(...), auto_split: boo
     # Sanitize filename to prevent path traversal
     safe_filename = Path(file.filename).name if file.filename else "upload.wav"
     # Remove dangerous characters but preserve spaces and international characters
-    safe_filename = safe_filename.replace('\0', '').replace('..', '').replace('/', '').replace('\\', '')
+    safe_filename = safe_filename.translate(_UPLOAD_NAME_STRIP).replace('..', '')
     
     temp_dir = Path(tempfile.gettempdir())
     dest_path = temp_dir / safe_filename
     
-    with dest_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    await asyncio.to_thread(_fast_save, file.file, dest_path, file.size)
     
     dojo_path = DOJO_ROOT / f"{voice}_dojo"
     raw_folder = dojo_path / "dataset" / "raw"
     raw_folder.mkdir(parents=True, exist_ok=True)
     master_wav_path = raw_folder / "master.wav"
+    # The old master's float32 sidecar (voice tools) is stale now; unmap and delete it
+    from voice_tools import release_master_wav_mmap
+    release_master_wav_mmap(master_wav_path)
+
+    # Already 22.05 kHz mono 16-bit PCM? Then there's nothing to normalize.
+    # wave.open rejects anything that isn't a PCM WAV, which falls through to pydub.
+    conformant = False
+    try:
+        with wave.open(str(dest_path), "rb") as w:
+            conformant = (
+                w.getframerate() == 22050
+                and w.getnchannels() == 1
+                and w.getsampwidth() == 2
+                and w.getnframes() > 0
+            )
+    except (wave.Error, EOFError, OSError):
+        conformant = False
 
     # Normalize uploads into a real WAV file so downstream tools work.
     # For MP3/M4A/etc this requires ffmpeg.
     try:
-        from pydub import AudioSegment
+        if conformant:
+            shutil.move(str(dest_path), str(master_wav_path))
+        else:
+            from pydub import AudioSegment
 
-        audio = AudioSegment.from_file(str(dest_path))
-        audio = audio.set_frame_rate(22050).set_channels(1)
-        audio.export(str(master_wav_path), format="wav")
+            audio = AudioSegment.from_file(str(dest_path))
+            audio = audio.set_frame_rate(22050).set_channels(1)
+            audio.export(str(master_wav_path), format="wav")
     except Exception as e:
         logger.error(f"Failed to process uploaded audio: {e}")
         msg = str(e)
@@ -1807,7 +2097,10 @@ def detect_nonsilent_api(req: DetectNonsilentRequest):
     if not result.get("ok"):
         return Response(content=result.get("error", "Detection failed"), status_code=500)
 
-    return {"status": "ok", "segments": result.get("segments", [])}
+    segments = result.get("segments", [])
+    if req.columnar:
+        return {"status": "ok", **_segments_body([(d["start_ms"], d["end_ms"]) for d in segments], True)}
+    return {"status": "ok", "segments": segments}
 
 
 @app.post("/api/training/segments/voice-label")
@@ -1822,11 +2115,20 @@ def voice_label_segments_api(req: VoiceLabelRequest):
         return Response(content="Master audio not found for this voice.", status_code=404)
 
     try:
-        from voice_tools import VoiceDepsMissing, load_master_wav, voice_label_segments
+        from voice_tools import VoiceDepsMissing, load_master_wav_mmap, segments_array, voice_label_segments
 
-        wav = load_master_wav(master_path)
-        segments_ms = [(float(s.start_ms), float(s.end_ms)) for s in req.segments]
+        wav = load_master_wav_mmap(master_path)
+        segments_ms = segments_array(
+            (s.start_ms for s in req.segments), (s.end_ms for s in req.segments), len(req.segments)
+        )
         voice_ids = voice_label_segments(wav=wav, segments_ms=segments_ms, k=int(req.k))
+        if req.columnar:
+            return {
+                "status": "ok",
+                "used_trim_silence": bool(wav.used_trim_silence),
+                **_segments_body(segments_ms, True),
+                "voice_ids": [int(vid) for vid in voice_ids],
+            }
         out_segments = [
             {"start_ms": float(seg[0]), "end_ms": float(seg[1]), "voice_id": int(vid)}
             for seg, vid in zip(segments_ms, voice_ids)
@@ -1855,11 +2157,15 @@ def voice_split_segments_api(req: VoiceSplitRequest):
         return Response(content="Master audio not found for this voice.", status_code=404)
 
     try:
-        from voice_tools import VoiceDepsMissing, load_master_wav, voice_split_by_changes
+        from voice_tools import VoiceDepsMissing, load_master_wav_mmap, segments_array, voice_split_by_changes
 
-        wav = load_master_wav(master_path)
+        wav = load_master_wav_mmap(master_path)
         if req.base_segments and len(req.base_segments) > 0:
-            base_segments = [(float(s.start_ms), float(s.end_ms)) for s in req.base_segments]
+            base_segments = segments_array(
+                (s.start_ms for s in req.base_segments),
+                (s.end_ms for s in req.base_segments),
+                len(req.base_segments),
+            )
         else:
             base_segments = [(0.0, (len(wav.wav) / wav.sr) * 1000.0)]
 
@@ -1874,7 +2180,7 @@ def voice_split_segments_api(req: VoiceSplitRequest):
         return {
             "status": "ok",
             "used_trim_silence": bool(wav.used_trim_silence),
-            "segments": [{"start_ms": float(s), "end_ms": float(e)} for (s, e) in new_segments],
+            **_segments_body(new_segments, req.columnar),
         }
     except VoiceDepsMissing as e:
         return Response(content=str(e), status_code=501)
@@ -1895,16 +2201,25 @@ def voice_filter_segments_api(req: VoiceFilterRequest):
         return Response(content="Master audio not found for this voice.", status_code=404)
 
     try:
-        from voice_tools import VoiceDepsMissing, load_master_wav, voice_filter_segments
+        from voice_tools import VoiceDepsMissing, load_master_wav_mmap, segments_array, voice_filter_segments
 
-        wav = load_master_wav(master_path)
-        segments_ms = [(float(s.start_ms), float(s.end_ms)) for s in req.segments]
+        wav = load_master_wav_mmap(master_path)
+        segments_ms = segments_array(
+            (s.start_ms for s in req.segments), (s.end_ms for s in req.segments), len(req.segments)
+        )
         mode = (req.mode or "keep").strip().lower()
         if mode not in ("keep", "remove"):
             return Response(content="mode must be 'keep' or 'remove'", status_code=400)
 
+        # Publish at most ~100 progress updates regardless of segment count so the
+        # embedding loop isn't slowed down by per-segment bookkeeping.
+        last_reported = [0]
+
         def update_progress(current: int, total: int):
-            training_manager.set_filter_progress(req.voice, current, total)
+            step = max(1, total // 100)
+            if current - last_reported[0] >= step or current == total:
+                training_manager.set_filter_progress(req.voice, current, total)
+                last_reported[0] = current
 
         kept, kept_count = voice_filter_segments(
             wav=wav,
@@ -1920,7 +2235,7 @@ def voice_filter_segments_api(req: VoiceFilterRequest):
             "used_trim_silence": bool(wav.used_trim_silence),
             "kept": int(kept_count),
             "total": int(len(segments_ms)),
-            "segments": [{"start_ms": float(s), "end_ms": float(e)} for (s, e) in kept],
+            **_segments_body(kept, req.columnar),
         }
     except VoiceDepsMissing as e:
         return Response(content=str(e), status_code=501)
@@ -1952,30 +2267,29 @@ async def voice_filter_segments_upload_api(
         return Response(content="mode must be 'keep' or 'remove'", status_code=400)
 
     try:
-        segs_raw = json.loads(segments_json)
+        segs_raw = orjson.loads(segments_json) if ORJSON_AVAILABLE else json.loads(segments_json)
         if not isinstance(segs_raw, list):
             return Response(content="segments_json must be a JSON list", status_code=400)
 
-        segments_ms: list[tuple[float, float]] = []
-        for item in segs_raw:
-            if not isinstance(item, dict):
-                continue
-            segments_ms.append((float(item.get("start_ms")), float(item.get("end_ms"))))
+        segments_ms: list[tuple[float, float]] = [
+            (float(item["start_ms"]), float(item["end_ms"]))
+            for item in segs_raw
+            if isinstance(item, dict)
+        ]
 
         from voice_tools import (
             VoiceDepsMissing,
-            load_master_wav,
+            load_master_wav_mmap,
             voice_filter_segments_by_ref_audio,
         )
 
         # Save upload to temp and normalize to a WAV for resemblyzer.
         # Sanitize filename to prevent path traversal
         safe_filename = Path(file.filename).name if file.filename else "ref.wav"
-        safe_filename = re.sub(r'[^a-zA-Z0-9._-]', '_', safe_filename)
+        safe_filename = _SAFE_NAME_RE.sub('_', safe_filename)
         temp_dir = Path(tempfile.gettempdir())
         up_path = temp_dir / f"piper_ref_{voice}_{int(time.time())}_{safe_filename}"
-        with up_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await asyncio.to_thread(_fast_save, file.file, up_path, file.size)
 
         ref_wav_path = temp_dir / f"piper_ref_{voice}_{int(time.time())}.wav"
         try:
@@ -1990,7 +2304,7 @@ async def voice_filter_segments_upload_api(
             except Exception:
                 pass
 
-        wav = load_master_wav(master_path)
+        wav = load_master_wav_mmap(master_path)
         kept, kept_count, used_trim_silence = voice_filter_segments_by_ref_audio(
             wav=wav,
             segments_ms=segments_ms,
@@ -2009,7 +2323,7 @@ async def voice_filter_segments_upload_api(
             "used_trim_silence": bool(wav.used_trim_silence) or bool(used_trim_silence),
             "kept": int(kept_count),
             "total": int(len(segments_ms)),
-            "segments": [{"start_ms": float(s), "end_ms": float(e)} for (s, e) in kept],
+            **_segments_body(kept),
         }
     except VoiceDepsMissing as e:
         return Response(content=str(e), status_code=501)
@@ -2212,34 +2526,136 @@ def update_dataset_properties(request: TrainingSettingsRequest):
     return training_manager.update_dataset_settings(voice, request.settings)
 
 
+_PS_SENTINEL = "---END---"
+
+# Win32 helpers shared by every focus/launch snippet. Compiled once per worker
+# process instead of once per request.
+_PS_WINAPI_PREAMBLE = '''
+Add-Type @"
+using System;
+using System.Runtime.InteropServices;
+public class WinAPI {
+    [DllImport("user32.dll")]
+    public static extern bool SetForegroundWindow(IntPtr hWnd);
+    [DllImport("user32.dll")]
+    public static extern IntPtr FindWindow(string lpClassName, string lpWindowName);
+    [DllImport("user32.dll")]
+    public static extern bool ShowWindow(IntPtr hWnd, int nCmdShow);
+    [DllImport("user32.dll")]
+    public static extern bool IsIconic(IntPtr hWnd);
+    [DllImport("user32.dll")]
+    public static extern void keybd_event(byte bVk, byte bScan, uint dwFlags, int dwExtraInfo);
+}
+"@
+'''
+
+
+class PSWorker:
+    """A persistent PowerShell process for window focus/launch snippets (Windows only).
+
+    Cold-starting powershell.exe and JIT-compiling the Add-Type block costs
+    ~500 ms per call. This keeps one interpreter alive, compiles WinAPI once,
+    and feeds it scripts over stdin, reading output until a sentinel line.
+    """
+
+    def __init__(self):
+        self.proc: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        self.proc = subprocess.Popen(
+            ["powershell", "-NoProfile", "-NoLogo", "-Command", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+        self._send(_PS_WINAPI_PREAMBLE)
+
+    def _send(self, script: str) -> str:
+        # "-Command -" executes stdin line by line, so ship each script as a single
+        # base64 line and dot-source it. Scripts must not call `exit`.
+        encoded = base64.b64encode(script.encode("utf-8")).decode("ascii")
+        self.proc.stdin.write(
+            ". ([ScriptBlock]::Create([Text.Encoding]::UTF8.GetString("
+            f"[Convert]::FromBase64String('{encoded}'))))\n"
+            f"Write-Output '{_PS_SENTINEL}'\n"
+        )
+        self.proc.stdin.flush()
+        lines = []
+        for line in self.proc.stdout:
+            line = line.rstrip("\r\n")
+            if line == _PS_SENTINEL:
+                return "\n".join(lines)
+            lines.append(line)
+        raise RuntimeError("PowerShell worker exited unexpectedly")
+
+    def warm_up(self):
+        """Start the worker ahead of the first request."""
+        try:
+            with self._lock:
+                if self.proc is None or self.proc.poll() is not None:
+                    self._start()
+        except Exception as e:
+            logger.warning(f"Failed to start PowerShell worker: {e}")
+
+    def run(self, script: str) -> str:
+        """Run a script in the worker and return its stdout."""
+        with self._lock:
+            if self.proc is None or self.proc.poll() is not None:
+                self._start()
+            try:
+                return self._send(script)
+            except (OSError, RuntimeError):
+                # Broken pipe or dead interpreter: drop it so the next call respawns
+                self.proc = None
+                raise
+
+    def run_logged(self, script: str) -> None:
+        """Run a script, logging instead of raising (for fire-and-forget threads)."""
+        try:
+            self.run(script)
+        except Exception as e:
+            logger.error(f"PowerShell worker script failed: {e}")
+
+
+ps_worker = PSWorker()
+if os.name == "nt":
+    threading.Thread(target=ps_worker.warm_up, daemon=True, name="PSWorkerWarmup").start()
+
+# Remembers a recent "TensorBoard is up" answer so repeat launches skip the docker round-trips.
+_TB_STATUS_TTL = 30.0
+_tb_status_cache = {"ts": 0.0, "running": False}
+
+
 @app.post("/api/tools/launch")
 def launch_tool(tool: str, dojo: str | None = None):
     """Launch one of the standalone GUI tools."""
     if tool == "tensorboard":
         # Special handling for TensorBoard since it runs in Docker instead of a local Python script
         def _launch_tb():
+            global _tb_status_cache
             try:
-                # Check if container is running
-                check_cmd = ["docker", "ps", "-f", "name=textymcspeechy-piper", "--format", "{{.Names}}"]
+                if _tb_status_cache["running"] and time.time() - _tb_status_cache["ts"] < _TB_STATUS_TTL:
+                    logger.info("TensorBoard is already running in the container.")
+                    return
+
+                # One call answers both questions: `docker top` fails if the container
+                # isn't running, and otherwise lists its process command lines.
+                top_cmd = ["docker", "top", "textymcspeechy-piper", "-o", "args"]
                 result = subprocess.run(
-                    check_cmd,
+                    top_cmd,
                     capture_output=True,
                     text=True,
                     creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
                 )
-                if "textymcspeechy-piper" not in result.stdout:
+                if result.returncode != 0:
                     logger.error("TensorBoard launch failed: textymcspeechy-piper container not running")
                     return
 
-                # Check if tensorboard is already running inside the container
-                ps_cmd = ["docker", "exec", "textymcspeechy-piper", "ps", "aux"]
-                ps_result = subprocess.run(
-                    ps_cmd,
-                    capture_output=True,
-                    text=True,
-                    creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
-                )
-                if "tensorboard" in ps_result.stdout:
+                if "tensorboard" in result.stdout:
+                    _tb_status_cache = {"ts": time.time(), "running": True}
                     logger.info("TensorBoard is already running in the container.")
                     return
 
@@ -2256,10 +2672,12 @@ def launch_tool(tool: str, dojo: str | None = None):
                     "docker", "exec", "-d", "textymcspeechy-piper", 
                     "tensorboard", "--logdir", log_dir, "--bind_all", "--port", "6006"
                 ]
-                subprocess.run(
+                launch_result = subprocess.run(
                     launch_cmd,
                     creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
                 )
+                if launch_result.returncode == 0:
+                    _tb_status_cache = {"ts": time.time(), "running": True}
                 logger.info(f"Launched TensorBoard in container for dojo: {target_dojo}")
             except Exception as e:
                 logger.error(f"Failed to launch TensorBoard: {e}")
@@ -2287,21 +2705,6 @@ def launch_tool(tool: str, dojo: str | None = None):
             # 1. Try to FIND and FOCUS existing instance first (Safe for tools with state like Slicer)
             if os.name == 'nt':
                 ps_focus_tool = f'''
-Add-Type @"
-using System;
-using System.Runtime.InteropServices;
-public class WinAPI {{
-    [DllImport("user32.dll")]
-    public static extern bool SetForegroundWindow(IntPtr hWnd);
-    [DllImport("user32.dll")]
-    public static extern bool ShowWindow(IntPtr hWnd, int nCmdShow);
-    [DllImport("user32.dll")]
-    public static extern bool IsIconic(IntPtr hWnd);
-    [DllImport("user32.dll")]
-    public static extern void keybd_event(byte bVk, byte bScan, uint dwFlags, int dwExtraInfo);
-}}
-"@
-
 # Simulate Alt key to relax Foreground Lock
 [WinAPI]::keybd_event(0x12, 0, 0, 0)
 Start-Sleep -Milliseconds 5
@@ -2311,19 +2714,15 @@ $proc = Get-Process | Where-Object {{ $_.MainWindowTitle -like "{title_pattern}"
 if ($proc) {{
     $hwnd = $proc.MainWindowHandle
     if ($hwnd -ne 0) {{
-        if ([WinAPI]::IsIconic($hwnd)) {{ [WinAPI]::ShowWindow($hwnd, 9) }}
-        [WinAPI]::SetForegroundWindow($hwnd)
+        if ([WinAPI]::IsIconic($hwnd)) {{ [WinAPI]::ShowWindow($hwnd, 9) | Out-Null }}
+        [WinAPI]::SetForegroundWindow($hwnd) | Out-Null
         Write-Output "FOCUSED"
-        exit 0
     }}
 }}
-exit 1
 '''
-                result = subprocess.run(["powershell", "-NoProfile", "-Command", ps_focus_tool], 
-                                      capture_output=True, text=True,
-                                      creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
-                
-                if "FOCUSED" in result.stdout:
+                output = ps_worker.run(ps_focus_tool)
+
+                if "FOCUSED" in output:
                     logger.info(f"Focused existing tool: {tool}")
                     return
 
@@ -2349,6 +2748,127 @@ exit 1
     return {"status": "launched"}
 
 
+if os.name == "nt":
+    import ctypes
+    from ctypes import wintypes
+
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _EnumWindowsProc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _kernel32.TerminateProcess.argtypes = (wintypes.HANDLE, wintypes.UINT)
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+
+
+def _explorer_windows() -> list[tuple[int, str]]:
+    """(hwnd, title) for every visible File Explorer window, via EnumWindows."""
+    found: list[tuple[int, str]] = []
+    cls_buf = ctypes.create_unicode_buffer(64)
+
+    def _cb(hwnd, _lparam):
+        if _user32.IsWindowVisible(hwnd):
+            _user32.GetClassNameW(hwnd, cls_buf, 64)
+            if cls_buf.value == "CabinetWClass":
+                n = _user32.GetWindowTextLengthW(hwnd)
+                buf = ctypes.create_unicode_buffer(n + 1)
+                _user32.GetWindowTextW(hwnd, buf, n + 1)
+                found.append((hwnd, buf.value))
+        return True
+
+    _user32.EnumWindows(_EnumWindowsProc(_cb), 0)
+    return found
+
+
+def _windows_matching_titles(titles, first_only: bool = False) -> list[tuple[int, int]]:
+    """(hwnd, pid) for every visible top-level window whose title contains one of titles.
+
+    With first_only, enumeration stops at the first match (for existence checks).
+    """
+    found: list[tuple[int, int]] = []
+    pid = wintypes.DWORD()
+
+    def _cb(hwnd, _lparam):
+        if _user32.IsWindowVisible(hwnd):
+            n = _user32.GetWindowTextLengthW(hwnd)
+            if n:
+                buf = ctypes.create_unicode_buffer(n + 1)
+                _user32.GetWindowTextW(hwnd, buf, n + 1)
+                if any(t in buf.value for t in titles):
+                    _user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+                    found.append((hwnd, pid.value))
+                    if first_only:
+                        return False  # stops EnumWindows
+        return True
+
+    _user32.EnumWindows(_EnumWindowsProc(_cb), 0)
+    return found
+
+
+def _any_window_matching(titles) -> bool:
+    return bool(_windows_matching_titles(titles, first_only=True))
+
+
+def _kill_windows_by_title(titles) -> set[int]:
+    """Terminate the processes owning windows whose title contains one of titles.
+
+    Native replacement for Get-Process | Where MainWindowTitle -like | Stop-Process.
+    Never kills this server process. Returns the pids that were terminated.
+    """
+    killed: set[int] = set()
+    own_pid = os.getpid()
+    for _hwnd, pid in _windows_matching_titles(titles):
+        if pid == own_pid or pid in killed:
+            continue
+        handle = _kernel32.OpenProcess(0x0001, False, pid)  # PROCESS_TERMINATE
+        if not handle:
+            continue
+        try:
+            if _kernel32.TerminateProcess(handle, 1):
+                killed.add(pid)
+        finally:
+            _kernel32.CloseHandle(handle)
+    return killed
+
+
+def _focus_hwnd(hwnd: int):
+    # Tap Alt to relax the foreground lock, same trick as the PowerShell snippets.
+    _user32.keybd_event(0x12, 0, 0, 0)
+    _user32.keybd_event(0x12, 0, 2, 0)
+    if _user32.IsIconic(hwnd):
+        _user32.ShowWindow(hwnd, 9)  # SW_RESTORE
+    _user32.SetForegroundWindow(hwnd)
+
+
+def _open_path_win32(abs_path: str) -> bool:
+    """Focus or open an Explorer window for abs_path without spawning PowerShell.
+
+    Explorer titles windows with the folder name (or the full path, if that option
+    is on). Returns False when a window with the same folder name is already open,
+    since only the Shell.Application lookup can tell which folder it shows.
+    """
+    target = abs_path.casefold()
+    leaf = (os.path.basename(abs_path.rstrip("\\/")) or abs_path).casefold()
+
+    windows = _explorer_windows()
+    for hwnd, title in windows:
+        if title.casefold() == target:
+            _focus_hwnd(hwnd)
+            return True
+    if any(title.casefold() == leaf for _, title in windows):
+        return False
+
+    os.startfile(abs_path)
+    deadline = time.monotonic() + 2.0
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        for hwnd, title in _explorer_windows():
+            if title.casefold() in (target, leaf):
+                _focus_hwnd(hwnd)
+                return True
+    return True
+
+
 def _force_open_path(path: Path):
     """Open a path and try to force it to the foreground on Windows."""
     try:
@@ -2357,23 +2877,6 @@ def _force_open_path(path: Path):
             # Use native Windows API via PowerShell to force window to foreground
             # Includes Shell.Application lookup to find ALREADY OPEN windows
             ps_cmd = '''
-Add-Type @"
-using System;
-using System.Runtime.InteropServices;
-public class WinAPI {
-    [DllImport("user32.dll")]
-    public static extern bool SetForegroundWindow(IntPtr hWnd);
-    [DllImport("user32.dll")]
-    public static extern IntPtr FindWindow(string lpClassName, string lpWindowName);
-    [DllImport("user32.dll")]
-    public static extern bool ShowWindow(IntPtr hWnd, int nCmdShow);
-    [DllImport("user32.dll")]
-    public static extern bool IsIconic(IntPtr hWnd);
-    [DllImport("user32.dll")]
-    public static extern void keybd_event(byte bVk, byte bScan, uint dwFlags, int dwExtraInfo);
-}
-"@
-
 $targetPath = "''' + abs_path.replace('"', '`"') + '''"
 $hwnd = 0
 
@@ -2425,11 +2928,27 @@ if ($hwnd -ne 0) {
     [WinAPI]::SetForegroundWindow($hwnd)
 }
 '''
-            subprocess.Popen(["powershell", "-NoProfile", "-Command", ps_cmd], 
-                           creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+
+            def _open():
+                try:
+                    if _open_path_win32(abs_path):
+                        return
+                except Exception as e:
+                    logger.debug(f"EnumWindows lookup failed for {abs_path}: {e}")
+                ps_worker.run_logged(ps_cmd)
+
+            # Run in the background: both paths wait for Explorer to appear
+            threading.Thread(target=_open, daemon=True).start()
         else:
             opener = "open" if sys.platform == "darwin" else "xdg-open"
-            subprocess.Popen([opener, abs_path])
+            # Detached: returns once the opener is spawned and never becomes our zombie
+            subprocess.Popen(
+                [opener, abs_path],
+                start_new_session=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
     except Exception as e:
         logger.error(f"Failed to force open path {path}: {e}")
 
@@ -2446,13 +2965,13 @@ def open_folder(folder_type: str, dojo: str | None = None):
     
     path = None
     if folder_type == "voices":
-        path = SCRIPT_DIR.parent / "voices"
+        path = VOICES_ROOT
     elif folder_type == "dojo" and dojo:
-        path = SCRIPT_DIR.parent / "training" / "make piper voice models" / "tts_dojo" / f"{dojo}_dojo"
+        path = DOJO_ROOT / f"{dojo}_dojo"
     elif folder_type == "dataset" and dojo:
-        path = SCRIPT_DIR.parent / "training" / "make piper voice models" / "tts_dojo" / f"{dojo}_dojo" / "dataset"
+        path = DOJO_ROOT / f"{dojo}_dojo" / "dataset"
     elif folder_type == "docs":
-        path = SCRIPT_DIR.parent / "voices" / "HOW_TO_ADD_VOICES.md"
+        path = HOW_TO_ADD_MD
     
     if path and path.exists():
         _force_open_path(path)
@@ -2473,96 +2992,262 @@ def get_server_config():
     return load_config()
 
 
+def _scan_dojo_storage(de: os.DirEntry, with_subparts: bool = True) -> tuple[int, dict]:
+    """Size one *_dojo folder and (optionally) list its subparts for the storage dashboard."""
+    # One walk gives the dojo total and every top-level subfolder's size
+    size, child_sizes = _scan_dir_sized(de.path)
+
+    # Scan subparts
+    subparts = []
+    if not with_subparts:
+        return size, {"name": de.name, "size": format_bytes(size), "path": de.path, "subparts": subparts}
+
+    # 1. Training & Reference Audio (Folders)
+    for sub_dir, label in [("dataset", "Training Audio"), ("target_voice_dataset", "Reference Audio")]:
+        if sub_dir in child_sizes:
+            subparts.append({"id": sub_dir, "name": label, "size": format_bytes(child_sizes[sub_dir]), "type": "folder"})
+
+    # 2. Checkpoints (Files), newest first
+    for sub_dir, prefix in [("voice_checkpoints", "Latest"), ("archived_checkpoints", "Archive")]:
+        if sub_dir not in child_sizes:
+            continue
+        # Stat each entry exactly once up front; the sort then compares plain tuples
+        ckpts = []
+        try:
+            with os.scandir(os.path.join(de.path, sub_dir)) as it:
+                for e in it:
+                    if e.name.endswith(".ckpt") and e.is_file():
+                        st = e.stat()
+                        ckpts.append((st.st_mtime, e.name, st.st_size))
+        except OSError:
+            continue
+        ckpts.sort(reverse=True)
+        for _mtime, name, size_bytes in ckpts:
+            subparts.append({
+                "id": f"{sub_dir}/{name}",
+                "name": f"{prefix}: {name}",
+                "size": format_bytes(size_bytes),
+                "type": "checkpoint"
+            })
+
+    # 3. Exported Voices (Files)
+    if "tts_voices" in child_sizes:
+        for f in _iter_files_scandir(os.path.join(de.path, "tts_voices"), ".onnx"):
+            subparts.append({
+                "id": os.path.relpath(f.path, de.path).replace("\\", "/"),
+                "name": f"Voice: {f.name}",
+                "size": format_bytes(_entry_size(f)),
+                "type": "voice",
+                "full_path": os.path.realpath(f.path)
+            })
+
+    # 4. Other Big Folders
+    for sub_dir, label in [("training_folder", "Working Training Data")]:
+        if sub_dir in child_sizes:
+            subparts.append({"id": sub_dir, "name": label, "size": format_bytes(child_sizes[sub_dir]), "type": "folder"})
+
+    return size, {
+        "name": de.name,
+        "size": format_bytes(size),
+        "path": de.path,
+        "subparts": subparts
+    }
+
+
+DOCKER_TRAINING_IMAGE = "domesticatedviking/textymcspeechy-piper:latest"
+_DOCKER_SOCKET = "/var/run/docker.sock"
+_DOCKER_SIZE_TTL = 30.0
+_docker_size_cache = {"ts": 0.0, "value": (None, "0")}
+
+
+def _docker_pipe_exchange(request: bytes) -> bytes:
+    """Send one request over the Docker Desktop named pipe and read until it closes."""
+    chunks = []
+    with open(r"\\.\pipe\docker_engine", "r+b", buffering=0) as pipe:
+        pipe.write(request)
+        while True:
+            try:
+                chunk = pipe.read(65536)
+            except BrokenPipeError:
+                break
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _docker_api_get(api_path: str, timeout: float = 5.0) -> tuple[int, bytes]:
+    """GET a Docker Engine API path over the local socket (named pipe on Windows).
+
+    Sends HTTP/1.0 so the daemon closes the connection after one un-chunked reply.
+    Raises OSError when the engine isn't reachable (TimeoutError after `timeout` seconds).
+    """
+    request = f"GET {api_path} HTTP/1.0\r\nHost: docker\r\n\r\n".encode("ascii")
+    chunks = []
+    if os.name == "nt":
+        # Pipe reads have no timeout of their own and block forever if Docker Desktop
+        # hangs, so the exchange runs on a helper thread that we stop waiting for
+        result: dict = {}
+
+        def exchange():
+            try:
+                result["data"] = _docker_pipe_exchange(request)
+            except BaseException as e:
+                result["error"] = e
+
+        worker = threading.Thread(target=exchange, name="docker-pipe", daemon=True)
+        worker.start()
+        worker.join(timeout)
+        if worker.is_alive():
+            raise TimeoutError(f"Docker Engine did not answer within {timeout:g}s")
+        if "error" in result:
+            raise result["error"]
+        chunks.append(result["data"])
+    else:
+        import socket
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(_DOCKER_SOCKET)
+            sock.sendall(request)
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    head, _, body = b"".join(chunks).partition(b"\r\n\r\n")
+    try:
+        status = int(head.split(b" ", 2)[1])
+    except (IndexError, ValueError):
+        raise OSError("Malformed response from Docker Engine")
+    return status, body
+
+
+def _docker_image_size_cli() -> tuple[int | None, str]:
+    """Fallback: ask the docker CLI for the image size (decimal units, e.g. '17.2GB')."""
+    try:
+        img_check = subprocess.run(
+            ["docker", "images", "--format", "{{.Size}}", DOCKER_TRAINING_IMAGE],
+            capture_output=True, text=True, timeout=10
+        )
+        size_text = img_check.stdout.strip()
+        if not size_text:
+            return None, "0"
+        # Approximate conversion for the totals display
+        size_bytes = 0
+        if "GB" in size_text:
+            size_bytes = int(float(size_text.replace("GB", "")) * (1024**3))
+        elif "MB" in size_text:
+            size_bytes = int(float(size_text.replace("MB", "")) * (1024**2))
+        return size_bytes, size_text
+    except Exception:
+        return None, "0"
+
+
+def _docker_image_size() -> tuple[int | None, str]:
+    """(size_bytes, display_size) of the training image, or (None, "0") if it isn't installed.
+
+    Asks the Engine API directly (no docker CLI process) and caches the answer for 30 s.
+    """
+    now = time.monotonic()
+    if now - _docker_size_cache["ts"] < _DOCKER_SIZE_TTL:
+        return _docker_size_cache["value"]
+
+    value: tuple[int | None, str]
+    if os.environ.get("DOCKER_HOST"):
+        # Remote/custom engine: let the CLI resolve it
+        value = _docker_image_size_cli()
+    else:
+        try:
+            status, body = _docker_api_get(f"/images/{DOCKER_TRAINING_IMAGE}/json")
+            if status == 200:
+                size_bytes = int(json.loads(body).get("Size") or 0)
+                value = (size_bytes, format_bytes(size_bytes))
+            else:
+                value = (None, "0")
+        except (OSError, ValueError):
+            value = _docker_image_size_cli()
+
+    _docker_size_cache.update(ts=now, value=value)
+    return value
+
+
+# Last /api/storage/info result per detail level. Reused for a few seconds while the top-level
+# dojo/voices/pretrained folders are unchanged, so dashboard polls don't re-walk every tree.
+_STORAGE_CACHE_TTL = 5.0
+_storage_cache: dict[str, dict] = {}
+
+
+def invalidate_storage_cache() -> None:
+    """Force the next /api/storage/info call to rescan disk."""
+    _storage_cache.clear()
+    _docker_size_cache["ts"] = 0.0
+
+
+def _mtime_ns_or_none(path: Path):
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 @app.get("/api/storage/info", tags=["System"])
-def get_storage_info():
-    """Gathers detailed storage usage information for the web dashboard."""
-    dojo_root = SCRIPT_DIR.parent / "training" / "make piper voice models" / "tts_dojo"
-    pretrained_root = dojo_root / "PRETRAINED_CHECKPOINTS"
-    voices_root = SCRIPT_DIR.parent / "voices"
-    
+def get_storage_info(detail: str = "full"):
+    """Gathers detailed storage usage information for the web dashboard.
+
+    detail=summary skips the per-dojo subpart listing (checkpoints, exported
+    voices, folder breakdown) and returns only dojo totals with empty subparts.
+    """
+    if detail not in ("full", "summary"):
+        return Response(content="detail must be 'full' or 'summary'", status_code=400)
+
+    sig = tuple(_mtime_ns_or_none(p) for p in (DOJO_ROOT, VOICES_ROOT, PRETRAINED_ROOT))
+    now = time.monotonic()
+    cached = _storage_cache.get(detail)
+    if cached is not None and cached["sig"] == sig and now - cached["ts"] < _STORAGE_CACHE_TTL:
+        return cached["data"]
+
+    data = _collect_storage_info(DOJO_ROOT, PRETRAINED_ROOT, VOICES_ROOT, detail == "full")
+    _storage_cache[detail] = {"ts": now, "sig": sig, "data": data}
+    return data
+
+
+def _collect_storage_info(dojo_root: Path, pretrained_root: Path, voices_root: Path, with_subparts: bool = True) -> dict:
     totals = {"dojos": 0, "models": 0, "voices": 0, "docker": 0}
     
     # Dojos
     dojos = []
     if dojo_root.exists():
-        for d in dojo_root.iterdir():
-            if d.is_dir() and d.name.endswith("_dojo"):
-                size = get_size_bytes(d)
-                totals["dojos"] += size
-                
-                # Scan subparts
-                subparts = []
-                
-                # 1. Training & Reference Audio (Folders)
-                for sub_dir, label in [("dataset", "Training Audio"), ("target_voice_dataset", "Reference Audio")]:
-                    p = d / sub_dir
-                    if p.exists():
-                        subparts.append({"id": sub_dir, "name": label, "size": format_bytes(get_size_bytes(p)), "type": "folder"})
-
-                # 2. Checkpoints (Files)
-                # Latest
-                ckpt_dir = d / "voice_checkpoints"
-                if ckpt_dir.exists():
-                    ckpts = sorted(list(ckpt_dir.glob("*.ckpt")), key=lambda x: x.stat().st_mtime, reverse=True)
-                    for f in ckpts:
-                        subparts.append({
-                            "id": f"voice_checkpoints/{f.name}", 
-                            "name": f"Latest: {f.name}", 
-                            "size": format_bytes(get_size_bytes(f)), 
-                            "type": "checkpoint"
-                        })
-                # Archived
-                arch_dir = d / "archived_checkpoints"
-                if arch_dir.exists():
-                    archs = sorted(list(arch_dir.glob("*.ckpt")), key=lambda x: x.stat().st_mtime, reverse=True)
-                    for f in archs:
-                        subparts.append({
-                            "id": f"archived_checkpoints/{f.name}", 
-                            "name": f"Archive: {f.name}", 
-                            "size": format_bytes(get_size_bytes(f)), 
-                            "type": "checkpoint"
-                        })
-
-                # 3. Exported Voices (Files)
-                voice_dir = d / "tts_voices"
-                if voice_dir.exists():
-                    for f in voice_dir.rglob("*.onnx"):
-                        subparts.append({
-                            "id": str(f.relative_to(d)).replace("\\", "/"),
-                            "name": f"Voice: {f.name}",
-                            "size": format_bytes(get_size_bytes(f)),
-                            "type": "voice",
-                            "full_path": str(f.resolve())
-                        })
-
-                # 4. Other Big Folders
-                for sub_dir, label in [("training_folder", "Working Training Data")]:
-                    p = d / sub_dir
-                    if p.exists():
-                        subparts.append({"id": sub_dir, "name": label, "size": format_bytes(get_size_bytes(p)), "type": "folder"})
-                
-                dojos.append({
-                    "name": d.name, 
-                    "size": format_bytes(size), 
-                    "path": str(d),
-                    "subparts": subparts
-                })
-                
+        with os.scandir(dojo_root) as it:
+            dojo_entries = [e for e in it if e.name.endswith("_dojo") and e.is_dir()]
+        if STORAGE_SCAN_WORKERS > 1 and len(dojo_entries) > 1:
+            # Dojos are independent trees; overlapping their metadata reads cuts
+            # latency toward the largest dojo instead of the sum of all of them.
+            with ThreadPoolExecutor(max_workers=min(STORAGE_SCAN_WORKERS, len(dojo_entries))) as ex:
+                results = list(ex.map(lambda de: _scan_dojo_storage(de, with_subparts), dojo_entries))
+        else:
+            results = [_scan_dojo_storage(de, with_subparts) for de in dojo_entries]
+        for size, info in results:
+            totals["dojos"] += size
+            dojos.append(info)
+
     # Pretrained Models
     models = []
     if pretrained_root.exists():
         for sub in ["default", "languages"]:
             path = pretrained_root / sub
             if not path.exists(): continue
-            for f in path.glob("*"):
+            with os.scandir(path) as it:
+                entries = list(it)
+            for f in entries:
                 if f.name == ".SAMPLING_RATE" or f.name.startswith("."): continue
-                size = get_size_bytes(f)
+                size = _entry_size(f)
                 totals["models"] += size
-                
+
                 # Add descriptive names for core training bases
                 display_name = f.name
-                model_format = f.suffix.upper().replace(".", "") or "CKPT"
-                
+                model_format = os.path.splitext(f.name)[1].upper().replace(".", "") or "CKPT"
+
                 if f.name == "F_voice": 
                     display_name = "Female Base Model (High Res)"
                     model_format = "CKPT"
@@ -2572,7 +3257,7 @@ def get_storage_info():
                 elif f.name == ".ESPEAK_LANGUAGE": 
                     display_name = "eSpeak-NG Language Data"
                     model_format = "DATA"
-                
+
                 models.append({
                     "name": f.name, 
                     "display_name": display_name,
@@ -2580,56 +3265,49 @@ def get_storage_info():
                     "type": sub, 
                     "size": size
                 })
-                
-    # Production Voices
+
+    # Production Voices: one scandir pass, partitioned straight into the response rows
     default_voices = []
     custom_voices = []
+
+    def _voice_row(entry: os.DirEntry, is_dir: bool) -> dict:
+        size = _entry_size(entry, is_dir)
+        totals["voices"] += size
+        return {"name": entry.name, "size": format_bytes(size), "format": "FOLDER" if is_dir else "ONNX"}
+
     if voices_root.exists():
-        for item in voices_root.iterdir():
-            if item.name == "HOW_TO_ADD_VOICES.md": continue
-            
-            # Special handling for the 'custom' folder to list its contents individually
-            if item.is_dir() and item.name.lower() == "custom":
-                for subitem in item.iterdir():
-                    if subitem.name == "HOW_TO_ADD_VOICES.md": continue
-                    # We only care about directories (voice packages) or .onnx files
-                    if subitem.is_dir() or subitem.suffix.lower() == ".onnx":
-                        size = get_size_bytes(subitem)
-                        totals["voices"] += size
-                        custom_voices.append({"name": subitem.name, "size": size, "is_dir": subitem.is_dir(), "is_custom": True})
-                continue
+        with os.scandir(voices_root) as it:
+            for item in it:
+                name = item.name
+                if name == "HOW_TO_ADD_VOICES.md": continue
+                item_is_dir = item.is_dir(follow_symlinks=False)
+
+                # Special handling for the 'custom' folder to list its contents individually
+                if item_is_dir and name.lower() == "custom":
+                    with os.scandir(item.path) as sub_it:
+                        for subitem in sub_it:
+                            if subitem.name == "HOW_TO_ADD_VOICES.md": continue
+                            # We only care about directories (voice packages) or .onnx files
+                            sub_is_dir = subitem.is_dir(follow_symlinks=False)
+                            if sub_is_dir or subitem.name.lower().endswith(".onnx"):
+                                custom_voices.append(_voice_row(subitem, sub_is_dir))
+                    continue
 
-            # Regular voices
-            size = get_size_bytes(item)
-            totals["voices"] += size
-            default_voices.append({"name": item.name, "size": size, "is_dir": item.is_dir(), "is_custom": False})
+                # Regular voices
+                default_voices.append(_voice_row(item, item_is_dir))
 
     # Docker Check
-    docker_installed = False
-    docker_size = "0"
-    try:
-        # Check for the piper training image
-        img_check = subprocess.run(
-            ["docker", "images", "--format", "{{.Size}}", "domesticatedviking/textymcspeechy-piper:latest"],
-            capture_output=True, text=True, timeout=10
-        )
-        if img_check.stdout.strip():
-            docker_installed = True
-            docker_size = img_check.stdout.strip()
-            # Approximate conversion for the totals display
-            if "GB" in docker_size:
-                totals["docker"] = int(float(docker_size.replace("GB", "")) * (1024**3))
-            elif "MB" in docker_size:
-                totals["docker"] = int(float(docker_size.replace("MB", "")) * (1024**2))
-    except Exception:
-        pass
+    docker_bytes, docker_size = _docker_image_size()
+    docker_installed = docker_bytes is not None
+    if docker_installed:
+        totals["docker"] = docker_bytes
 
     return {
         "status": "success",
         "dojos": dojos,
         "models": [{"name": m["name"], "display_name": m.get("display_name"), "format": m.get("format"), "size": format_bytes(m["size"])} for m in models],
-        "default_voices": [{"name": v["name"], "size": format_bytes(v["size"]), "format": "ONNX" if not v["is_dir"] else "FOLDER"} for v in default_voices],
-        "custom_voices": [{"name": v["name"], "size": format_bytes(v["size"]), "format": "ONNX" if not v["is_dir"] else "FOLDER"} for v in custom_voices],
+        "default_voices": default_voices,
+        "custom_voices": custom_voices,
         "docker_image_size": docker_size if docker_installed else None,
         "total_managed_size": format_bytes(sum(totals.values()))
     }
@@ -2639,8 +3317,9 @@ def get_storage_info():
 def prune_docker_action():
     """Removes the 17GB Piper VITS training image."""
     try:
-        subprocess.run(["docker", "rmi", "domesticatedviking/textymcspeechy-piper:latest"], 
+        subprocess.run(["docker", "rmi", DOCKER_TRAINING_IMAGE], 
                       capture_output=True, text=True, timeout=30)
+        invalidate_storage_cache()
         return {"status": "success", "message": "Docker image pruned."}
     except Exception as e:
         return {"status": "error", "message": f"Failed to prune: {str(e)}"}
@@ -2682,15 +3361,20 @@ def delete_storage_item_final(type: str, name: str, subpath: str = None):
             voice_name = name.replace("_dojo", "")
             res = training_manager.delete_dojo(voice_name)
             if res.get("ok"):
+                invalidate_storage_cache()
                 return {"status": "success", "message": f"Deleted Dojo {voice_name}"}
             else:
                 return {"status": "error", "message": res.get("error", "Failed to delete dojo")}
 
-        path = SCRIPT_DIR.parent / "training" / "make piper voice models" / "tts_dojo" / name
+        path = DOJO_ROOT / name
         if subpath:
             path = path / subpath
+            master = DOJO_ROOT / name / "dataset" / "raw" / "master.wav"
+            if master == path or master.is_relative_to(path):
+                from voice_tools import release_master_wav_mmap
+                release_master_wav_mmap(master)
     elif type == "model":
-        root = SCRIPT_DIR.parent / "training" / "make piper voice models" / "tts_dojo" / "PRETRAINED_CHECKPOINTS"
+        root = PRETRAINED_ROOT
         for sub in ["default", "languages"]:
             p = root / sub / name
             if p.exists():
@@ -2698,17 +3382,14 @@ def delete_storage_item_final(type: str, name: str, subpath: str = None):
                 break
     elif type == "voice":
         # First try direct path in voices root
-        path = SCRIPT_DIR.parent / "voices" / name
+        path = VOICES_ROOT / name
         if not path.exists():
             # If not found, try looking inside the custom/ folder
-            path = SCRIPT_DIR.parent / "voices" / "custom" / name
+            path = CUSTOM_VOICES_ROOT / name
         
-        # Security: ensure it's still inside voices root using is_relative_to()
-        root = (SCRIPT_DIR.parent / "voices").resolve()
-        try:
-            if path.exists() and not path.resolve().is_relative_to(root):
-                path = None
-        except ValueError:
+        # Security: ensure it's still inside voices root (one realpath + prefix compare)
+        rp = os.path.realpath(path)
+        if not (rp == _VOICES_REAL or rp.startswith(_VOICES_REAL + os.sep)):
             path = None
 
     if not path or not path.exists():
@@ -2716,12 +3397,13 @@ def delete_storage_item_final(type: str, name: str, subpath: str = None):
     
     try:
         if path.is_dir():
-            shutil.rmtree(path)
+            fast_rmtree(path)
         else:
             path.unlink()
         
         if type == "voice":
             invalidate_voice_cache()
+        invalidate_storage_cache()
             
         return {"status": "success", "message": f"Deleted {name}"}
     except Exception as e:
@@ -2731,19 +3413,13 @@ def delete_storage_item_final(type: str, name: str, subpath: str = None):
 @app.post("/api/config")
 async def update_server_config(new_cfg: dict):
     """Update the server configuration file."""
-    config_path = SCRIPT_DIR / "config.json"
     try:
         # If the UI sets a new default voice, ensure any env override doesn't pin the model.
         if isinstance(new_cfg, dict) and "voice_model" in new_cfg:
             os.environ.pop(PIPER_MODEL_ENV, None)
 
-        current = load_config()
-        current.update(new_cfg)
-        # Use async file I/O to avoid blocking
-        json_str = json.dumps(current, indent=4)
-        await asyncio.to_thread(
-            config_path.write_text, json_str, encoding="utf-8"
-        )
+        # Write off the event loop
+        await asyncio.to_thread(update_config, new_cfg)
         return {"ok": True}
     except Exception as e:
         return Response(content=str(e), status_code=500)
@@ -2763,32 +3439,55 @@ def restart_server():
 @app.post("/api/tools/download-models")
 def download_starter_models():
     """Downloads the starter voice models in the background."""
-    def _download():
-        voices_root = SCRIPT_DIR.parent
-        # Pre-compute items list to avoid repeated dict access
-        models_to_download = list(STARTER_MODELS.items())
-        for name, info in models_to_download:
-            onnx_path = voices_root / info["rel_path"]
+    def _fetch(session, url: str, dest: Path) -> None:
+        # Stream to a .part file so an interrupted download never looks complete
+        part = dest.with_name(dest.name + ".part")
+        try:
+            with session.get(url, stream=True, timeout=(10, 60)) as r:
+                r.raise_for_status()
+                # Copy straight from the socket in 1 MiB blocks (models are hundreds of MB)
+                r.raw.decode_content = True
+                with open(part, "wb") as f:
+                    shutil.copyfileobj(r.raw, f, length=_COPY_BUFSIZE)
+            os.replace(part, dest)
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
+
+    def _jobs():
+        # One job per missing file: the small .json transfer overlaps the .onnx one
+        for rec in STARTER_RECORDS:
+            onnx_path = SCRIPT_DIR.parent / rec.rel_path
             json_path = onnx_path.with_suffix(onnx_path.suffix + ".json")
             onnx_path.parent.mkdir(parents=True, exist_ok=True)
-            
             if not onnx_path.exists():
-                logger.info(f"Downloading model: {name}...")
-                try:
-                    urllib.request.urlretrieve(info["onnx_url"], onnx_path)
-                    logger.info(f"  Saved {name}")
-                except Exception as e:
-                    logger.error(f"Failed to download {name}: {e}")
-            
+                yield rec.onnx_url, onnx_path, rec.name
             if not json_path.exists():
-                try:
-                    urllib.request.urlretrieve(info["json_url"], json_path)
-                    logger.info(f"  Saved config for {name}")
-                except Exception as e:
-                    logger.error(f"Failed to download config for {name}: {e}")
+                yield rec.json_url, json_path, f"config for {rec.name}"
+
+    def _download_one(session, job) -> None:
+        url, dest, label = job
+        logger.info(f"Downloading {label}...")
+        try:
+            _fetch(session, url, dest)
+            logger.info(f"  Saved {label}")
+        except Exception as e:
+            logger.error(f"Failed to download {label}: {e}")
+
+    def _download():
+        import requests
+
+        jobs = list(_jobs())
+        # One keep-alive session shared by all workers; every model lives on the
+        # same host, so later files skip the TCP/TLS handshake.
+        if jobs:
+            with requests.Session() as session:
+                with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+                    list(ex.map(lambda job: _download_one(session, job), jobs))
         invalidate_voice_cache()
+        invalidate_storage_cache()
 
-    threading.Thread(target=_download).start()
+    _submit_bg(_download)
     return {"status": "download_started"}
 
 
@@ -2797,14 +3496,28 @@ def download_piper_tool():
     """Triggers the Piper binary download process."""
     try:
         from download_piper import download_and_extract_piper
-        threading.Thread(target=download_and_extract_piper, args=(SCRIPT_DIR,)).start()
+        _submit_bg(download_and_extract_piper, SCRIPT_DIR)
         return {"status": "download_started"}
     except Exception as e:
         return Response(content=str(e), status_code=500)
 
 
+def _stat_etag(st: os.stat_result) -> str:
+    """Strong ETag from a file's mtime and size."""
+    return f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """True when the request's If-None-Match already names etag (so a 304 will do)."""
+    if_none_match = request.headers.get("if-none-match", "")
+    if not if_none_match:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return etag in tags or "*" in tags
+
+
 @app.get("/dojo_data/{path:path}")
-async def serve_dojo_file(path: str):
+async def serve_dojo_file(path: str, request: Request):
     """Explicitly serve files from the dojo directory to ensure playback works."""
     file_path = (DOJO_ROOT / path).resolve()
     # Security: Ensure the resolved path is still inside DOJO_ROOT using is_relative_to()
@@ -2814,14 +3527,119 @@ async def serve_dojo_file(path: str):
     except ValueError:
         raise HTTPException(status_code=403, detail="Access denied")
         
-    if file_path.exists() and file_path.is_file():
-        return FileResponse(file_path)
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        st = None
+
+    if st is not None and S_ISREG(st.st_mode):
+        # Clips get re-exported under the same name, so let the browser keep a copy
+        # but revalidate it each time; an unchanged file costs a bodyless 304.
+        etag = _stat_etag(st)
+        headers = {"Cache-Control": "no-cache", "ETag": etag}
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers=headers)
+        # Hand over the stat we already have so FileResponse doesn't stat again
+        return FileResponse(file_path, stat_result=st, headers=headers)
     
     # Log the failure for debugging
     logger.warning(f"Audio file not found: {file_path}")
     raise HTTPException(status_code=404, detail="File not found")
 
 
+_GPU_QUERY = [
+    "nvidia-smi",
+    "--query-gpu=utilization.gpu,memory.used,memory.total,temperature.gpu",
+    "--format=csv,noheader,nounits",
+]
+_GPU_LOOP_MS = 500
+_GPU_STATS_TTL = 1.0  # seconds a one-shot sample is reused once the loop has failed
+
+# Latest GPU sample. A long-lived `nvidia-smi --loop-ms` process keeps it fresh so
+# dashboard polls don't each spawn nvidia-smi; "loop_failed" disables it for good
+# and switches polls to one-shot queries.
+_gpu_state = {"ts": 0.0, "payload": None, "proc": None, "loop_failed": False}
+_gpu_lock = threading.Lock()
+
+
+def _gpu_startupinfo():
+    # Windows: Suppress console window popup
+    if os.name != 'nt':
+        return None
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    startupinfo.wShowWindow = subprocess.SW_HIDE
+    return startupinfo
+
+
+def _parse_gpu_line(line: str) -> dict:
+    parts = [x.strip() for x in line.split(',')]
+    if len(parts) < 4:
+        return {"available": False, "error": "Invalid GPU data format"}
+    return {
+        "available": True,
+        "utilization_gpu": int(parts[0]),
+        "memory_used_mb": int(parts[1]),
+        "memory_total_mb": int(parts[2]),
+        "temperature_c": int(parts[3])
+    }
+
+
+def _gpu_loop_reader(proc: subprocess.Popen) -> None:
+    try:
+        for line in proc.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                payload = _parse_gpu_line(line)
+            except ValueError:
+                continue
+            with _gpu_lock:
+                _gpu_state["payload"] = payload
+                _gpu_state["ts"] = time.monotonic()
+    except (OSError, ValueError):
+        pass
+    with _gpu_lock:
+        if _gpu_state["proc"] is proc:
+            _gpu_state["proc"] = None
+            # Exited on its own (no GPU, driver error): stop retrying the loop
+            if proc.poll() not in (None, 0) or _gpu_state["payload"] is None:
+                _gpu_state["loop_failed"] = True
+
+
+def _ensure_gpu_loop() -> None:
+    with _gpu_lock:
+        if _gpu_state["proc"] is not None or _gpu_state["loop_failed"]:
+            return
+        try:
+            # GPU 0 only, matching the first line the one-shot query reports
+            proc = subprocess.Popen(
+                _GPU_QUERY + ["--id=0", f"--loop-ms={_GPU_LOOP_MS}"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                startupinfo=_gpu_startupinfo(),
+            )
+        except OSError:
+            _gpu_state["loop_failed"] = True
+            return
+        _gpu_state["proc"] = proc
+    threading.Thread(target=_gpu_loop_reader, args=(proc,), daemon=True, name="GPUStatsLoop").start()
+
+
+def _stop_gpu_loop() -> None:
+    proc = _gpu_state.get("proc")
+    if proc is not None and proc.poll() is None:
+        try:
+            proc.terminate()
+        except OSError:
+            pass
+
+
+atexit.register(_stop_gpu_loop)
+
+
 @app.get("/api/gpu-stats", tags=["System"])
 async def get_gpu_stats():
     """
@@ -2830,6 +3648,16 @@ async def get_gpu_stats():
     Returns GPU utilization, memory usage, and temperature using nvidia-smi.
     Useful for monitoring hardware during training.
     """
+    # Popen can block (driver init, AV scanning); keep it off the event loop
+    await asyncio.to_thread(_ensure_gpu_loop)
+    with _gpu_lock:
+        payload, ts, loop_failed = _gpu_state["payload"], _gpu_state["ts"], _gpu_state["loop_failed"]
+    if not loop_failed:
+        # The loop is running (or starting): serve its latest sample, however old
+        return payload if payload is not None else {"available": False}
+    if payload is not None and time.monotonic() - ts < _GPU_STATS_TTL:
+        return payload
+
     try:
         # Query nvidia-smi
         # util.gpu: GPU utilization (%)
@@ -2837,18 +3665,11 @@ async def get_gpu_stats():
         # memory.total: VRAM total (MiB)
         # temperature.gpu: Core temperature (C)
         # We use a timeout to prevent hanging if the driver is unresponsive
-        
-        # Windows: Suppress console window popup
-        startupinfo = None
-        if os.name == 'nt':
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-
-        result = subprocess.run(
-            ["nvidia-smi", "--query-gpu=utilization.gpu,memory.used,memory.total,temperature.gpu", "--format=csv,noheader,nounits"],
-            capture_output=True, text=True, check=False,
-            startupinfo=startupinfo
+        result = await asyncio.to_thread(
+            subprocess.run,
+            _GPU_QUERY,
+            capture_output=True, text=True, check=False, timeout=5,
+            startupinfo=_gpu_startupinfo()
         )
         
         if result.returncode != 0:
@@ -2859,35 +3680,111 @@ async def get_gpu_stats():
              return {"available": False, "error": "No GPU data returned"}
         
         # Take the first line (GPU 0)
-        first_line = output.split('\n')[0]
-        parts = [x.strip() for x in first_line.split(',')]
-        
-        if len(parts) < 4:
-            return {"available": False, "error": "Invalid GPU data format"}
-
-        return {
-            "available": True,
-            "utilization_gpu": int(parts[0]),
-            "memory_used_mb": int(parts[1]),
-            "memory_total_mb": int(parts[2]),
-            "temperature_c": int(parts[3])
-        }
+        payload = _parse_gpu_line(output.split('\n')[0])
+        if payload.get("available"):
+            with _gpu_lock:
+                _gpu_state["payload"] = payload
+                _gpu_state["ts"] = time.monotonic()
+        return payload
 
     except FileNotFoundError:
         return {"available": False, "error": "nvidia-smi not found"}
+    except subprocess.TimeoutExpired:
+        return {"available": False, "error": "nvidia-smi timed out"}
     except Exception as e:
         logger.error(f"GPU stats query failed: {e}")
         return {"available": False, "error": str(e)}
 
 
+def _create_shortcut(
+    shortcut_path: Path,
+    target: Path,
+    *,
+    window_style: int | None = None,
+    icon_location: str | None = None,
+    description: str | None = None,
+) -> None:
+    """Create a Windows .lnk via the WScript.Shell COM object.
+
+    Uses pywin32 in-process when installed; otherwise runs the same COM calls on
+    the persistent PowerShell worker rather than cold-starting powershell.exe.
+    """
+    working_dir = str(SCRIPT_DIR.parent)
+    if WIN32COM_AVAILABLE:
+        # Endpoints run on arbitrary threads; COM must be initialized per thread
+        pythoncom.CoInitialize()
+        try:
+            shell = win32com.client.Dispatch("WScript.Shell")
+            lnk = shell.CreateShortcut(str(shortcut_path))
+            lnk.TargetPath = str(target)
+            lnk.WorkingDirectory = working_dir
+            if window_style is not None:
+                lnk.WindowStyle = window_style
+            if icon_location is not None:
+                lnk.IconLocation = icon_location
+            if description is not None:
+                lnk.Description = description
+            lnk.Save()
+            return
+        finally:
+            pythoncom.CoUninitialize()
+
+    def _q(value: str) -> str:
+        return "'" + str(value).replace("'", "''") + "'"
+
+    lines = [
+        "$WshShell = New-Object -ComObject WScript.Shell",
+        f"$Shortcut = $WshShell.CreateShortcut({_q(shortcut_path)})",
+        f"$Shortcut.TargetPath = {_q(target)}",
+        f"$Shortcut.WorkingDirectory = {_q(working_dir)}",
+    ]
+    if window_style is not None:
+        lines.append(f"$Shortcut.WindowStyle = {int(window_style)}")
+    if icon_location is not None:
+        lines.append(f"$Shortcut.IconLocation = {_q(icon_location)}")
+    if description is not None:
+        lines.append(f"$Shortcut.Description = {_q(description)}")
+    lines.append("$Shortcut.Save()")
+    ps_worker.run("\n".join(lines))
+
+
+def _windows_startup_dir() -> Optional[Path]:
+    """The user's Startup folder: the shell's FOLDERID_Startup, else derived from APPDATA.
+
+    Asking the shell also honours redirected/roaming profiles that the env var misses.
+    """
+    try:
+        import uuid
+        folderid_startup = (ctypes.c_char * 16).from_buffer_copy(
+            uuid.UUID("B97D20BB-F46A-4C97-BA10-5E3608430854").bytes_le
+        )
+        out = ctypes.c_wchar_p()
+        if ctypes.windll.shell32.SHGetKnownFolderPath(ctypes.byref(folderid_startup), 0, None, ctypes.byref(out)) == 0:
+            try:
+                return Path(out.value)
+            finally:
+                ctypes.windll.ole32.CoTaskMemFree(out)
+    except Exception as e:
+        logger.debug(f"SHGetKnownFolderPath(Startup) failed: {e}")
+    appdata = os.environ.get("APPDATA")
+    if appdata:
+        return Path(appdata) / "Microsoft" / "Windows" / "Start Menu" / "Programs" / "Startup"
+    return None
+
+
+# Startup shortcut locations never change while the process runs; resolve them once.
+if os.name == "nt":
+    _STARTUP_DIR = _windows_startup_dir()
+    _STARTUP_LNK_PATH = (_STARTUP_DIR or SCRIPT_DIR) / "PiperTTS Mockingbird.lnk"
+    _WYOMING_LNK_PATH = (_STARTUP_DIR or SCRIPT_DIR) / "PiperTTS Wyoming.lnk"
+else:
+    _STARTUP_LNK_PATH = SCRIPT_DIR / "autostart_dummy"
+    _WYOMING_LNK_PATH = SCRIPT_DIR / "wyoming_autostart_dummy"
+
+
 def _startup_shortcut_path() -> Path:
     """Return the path to the startup shortcut/link for the current OS."""
-    if os.name != "nt":
-        return SCRIPT_DIR / "autostart_dummy"
-    appdata = os.environ.get("APPDATA")
-    if not appdata:
-        return SCRIPT_DIR / "PiperTTS Mockingbird.lnk"
-    return Path(appdata) / "Microsoft" / "Windows" / "Start Menu" / "Programs" / "Startup" / "PiperTTS Mockingbird.lnk"
+    return _STARTUP_LNK_PATH
 
 
 @app.get("/api/startup-status")
@@ -2912,11 +3809,8 @@ async def set_startup(request: Request):
         enabled = data.get("enabled", False)
         
         # Update config.json to maintain parity with Python UI
-        cfg = load_config()
-        cfg["launch_on_startup"] = enabled
-        config_path = SCRIPT_DIR / "config.json"
         try:
-            config_path.write_text(json.dumps(cfg, indent=4), encoding="utf-8")
+            await asyncio.to_thread(set_config_value, "launch_on_startup", enabled)
         except Exception as e:
             logger.error(f"Failed to write config.json: {e}")
             
@@ -2930,16 +3824,7 @@ async def set_startup(request: Request):
                 if launcher_vbs.exists():
                     shortcut_path.parent.mkdir(parents=True, exist_ok=True)
                     # WindowStyle = 7 means "Minimized"
-                    ps_cmd = (
-                        f"$WshShell = New-Object -ComObject WScript.Shell; "
-                        f"$Shortcut = $WshShell.CreateShortcut('{str(shortcut_path)}'); "
-                        f"$Shortcut.TargetPath = '{str(launcher_vbs)}'; "
-                        f"$Shortcut.WorkingDirectory = '{str(SCRIPT_DIR.parent)}'; "
-                        f"$Shortcut.WindowStyle = 7; "
-                        f"$Shortcut.Save()"
-                    )
-                    subprocess.run(["powershell", "-NoProfile", "-Command", ps_cmd], 
-                                 check=False, capture_output=True, creationflags=0x08000000)
+                    await asyncio.to_thread(_create_shortcut, shortcut_path, launcher_vbs, window_style=7)
                     logger.info(f"Created startup shortcut: {shortcut_path}")
         else:
             if shortcut_path.exists():
@@ -2981,11 +3866,8 @@ async def create_desktop_shortcut():
     """Create a desktop shortcut to the PiperTTS Mockingbird Dashboard."""
     try:
         # Update config.json to maintain parity with Python UI
-        cfg = load_config()
-        cfg["desktop_shortcut"] = True
-        config_path = SCRIPT_DIR / "config.json"
         try:
-            config_path.write_text(json.dumps(cfg, indent=4), encoding="utf-8")
+            await asyncio.to_thread(set_config_value, "desktop_shortcut", True)
         except Exception as e:
             logger.error(f"Failed to write config.json: {e}")
 
@@ -3008,17 +3890,13 @@ async def create_desktop_shortcut():
             icon_path = SCRIPT_DIR.parent / "assets" / "mockingbird.ico"
             icon_location = f"{str(icon_path)}, 0" if icon_path.exists() else "shell32.dll, 44"
             
-            ps_cmd = (
-                f"$WshShell = New-Object -ComObject WScript.Shell; "
-                f"$Shortcut = $WshShell.CreateShortcut('{str(shortcut_path)}'); "
-                f"$Shortcut.TargetPath = '{str(launcher_vbs)}'; "
-                f"$Shortcut.WorkingDirectory = '{str(SCRIPT_DIR.parent)}'; "
-                f"$Shortcut.IconLocation = '{icon_location}'; "
-                f"$Shortcut.Description = 'PiperTTS Mockingbird Manager'; "
-                f"$Shortcut.Save()"
+            await asyncio.to_thread(
+                _create_shortcut,
+                shortcut_path,
+                launcher_vbs,
+                icon_location=icon_location,
+                description="PiperTTS Mockingbird Manager",
             )
-            subprocess.run(["powershell", "-NoProfile", "-Command", ps_cmd], 
-                         check=False, capture_output=True, creationflags=0x08000000)
             logger.info(f"Created Windows desktop shortcut: {shortcut_path}")
             return {"success": True, "message": "Desktop shortcut created"}
             
@@ -3038,7 +3916,7 @@ cd "{SCRIPT_DIR.parent}"
 "{python_exe}" "{manager_script}"
 """
             
-            shortcut_path.write_text(script_content, encoding="utf-8")
+            await asyncio.to_thread(shortcut_path.write_text, script_content, encoding="utf-8")
             # Make executable
             os.chmod(shortcut_path, 0o755)
             logger.info(f"Created macOS desktop shortcut: {shortcut_path}")
@@ -3076,7 +3954,7 @@ Terminal=false
 Categories=AudioVideo;Audio;
 """
             
-            shortcut_path.write_text(desktop_content, encoding="utf-8")
+            await asyncio.to_thread(shortcut_path.write_text, desktop_content, encoding="utf-8")
             # Make executable
             os.chmod(shortcut_path, 0o755)
             logger.info(f"Created Linux desktop shortcut: {shortcut_path}")
@@ -3092,11 +3970,8 @@ async def remove_desktop_shortcut():
     """Remove the desktop shortcut."""
     try:
         # Update config.json to maintain parity with Python UI
-        cfg = load_config()
-        cfg["desktop_shortcut"] = False
-        config_path = SCRIPT_DIR / "config.json"
         try:
-            config_path.write_text(json.dumps(cfg, indent=4), encoding="utf-8")
+            await asyncio.to_thread(set_config_value, "desktop_shortcut", False)
         except Exception as e:
             logger.error(f"Failed to write config.json: {e}")
 
@@ -3133,85 +4008,132 @@ async def remove_desktop_shortcut():
         return {"success": False, "error": str(e)}
 
 
+_DIAG_TTL = 2.0
+# In-flight or recent diagnostics run, shared by every caller inside the TTL
+_DIAG_CACHE = {"task": None, "ts": 0.0}
+
+
 @app.get("/api/run-diagnostic")
 async def run_diagnostic():
-    """Run system health checks."""
-    checks = []
-    
+    """Run system health checks.
+
+    Requests within _DIAG_TTL of a run share its result (or wait on the same run
+    if it is still going) instead of probing the GPU and disk again.
+    """
+    now = time.monotonic()
+    task = _DIAG_CACHE["task"]
+    if (
+        task is None
+        or now - _DIAG_CACHE["ts"] >= _DIAG_TTL
+        or task.get_loop() is not asyncio.get_running_loop()
+        # A cancelled run (e.g. at shutdown) is replaced too; exception() would raise on it
+        or (task.done() and (task.cancelled() or task.exception() is not None))
+    ):
+        task = asyncio.ensure_future(_run_diagnostic_checks())
+        _DIAG_CACHE["task"] = task
+        _DIAG_CACHE["ts"] = now
+    # shield: a client hanging up must not cancel the run other callers are awaiting
+    return await asyncio.shield(task)
+
+
+async def _run_diagnostic_checks() -> dict:
+    """The checks are independent, so they run concurrently: blocking disk checks on
+    worker threads, the GPU probe on the event loop. Latency is the slowest check.
+    """
     # Check Piper Executable
-    try:
-        exe = resolve_piper_exe()
-        if exe:
-            exe_path = Path(exe)
-            if exe_path.exists() or shutil.which(exe):
-                checks.append({"name": "Piper Engine", "passed": True, "message": f"Found at {exe}"})
-            else:
-                checks.append({"name": "Piper Engine", "passed": False, "message": "Piper executable configured but not found on disk"})
-        else:
-            checks.append({"name": "Piper Engine", "passed": False, "message": "Piper executable could not be resolved"})
-    except Exception as e:
-        logger.error(f"Diagnostic Error (Piper): {e}")
-        checks.append({"name": "Piper Engine", "passed": False, "message": str(e)})
+    def _check_piper():
+        try:
+            exe = resolve_piper_exe()
+            if exe:
+                exe_path = Path(exe)
+                if exe_path.exists() or shutil.which(exe):
+                    return {"name": "Piper Engine", "passed": True, "message": f"Found at {exe}"}
+                return {"name": "Piper Engine", "passed": False, "message": "Piper executable configured but not found on disk"}
+            return {"name": "Piper Engine", "passed": False, "message": "Piper executable could not be resolved"}
+        except Exception as e:
+            logger.error(f"Diagnostic Error (Piper): {e}")
+            return {"name": "Piper Engine", "passed": False, "message": str(e)}
 
     # Check Voices Folder
-    try:
-        voices_dir = SCRIPT_DIR.parent / "voices"
-        if voices_dir.exists():
-            onnx_files = list(voices_dir.rglob("*.onnx"))
-            if onnx_files:
-                checks.append({"name": "Voice Models", "passed": True, "message": f"Found {len(onnx_files)} voice(s)"})
-            else:
-                checks.append({"name": "Voice Models", "passed": False, "message": "No .onnx models found in voices/"})
-        else:
-            checks.append({"name": "Voice Models", "passed": False, "message": "Voices directory missing"})
-    except Exception as e:
-        logger.error(f"Diagnostic Error (Voices): {e}")
-        checks.append({"name": "Voice Models", "passed": False, "message": str(e)})
+    def _check_voices():
+        try:
+            voices_dir = VOICES_ROOT
+            if voices_dir.exists():
+                # One scandir stream per folder; entry types come from the dirents
+                onnx_count = sum(1 for _ in _iter_files_scandir(voices_dir, ".onnx"))
+                if onnx_count:
+                    return {"name": "Voice Models", "passed": True, "message": f"Found {onnx_count} voice(s)"}
+                return {"name": "Voice Models", "passed": False, "message": "No .onnx models found in voices/"}
+            return {"name": "Voice Models", "passed": False, "message": "Voices directory missing"}
+        except Exception as e:
+            logger.error(f"Diagnostic Error (Voices): {e}")
+            return {"name": "Voice Models", "passed": False, "message": str(e)}
 
     # Check GPU
-    try:
-        # Use a timeout of 5s for the GPU check call
-        gpu = await asyncio.wait_for(get_gpu_stats(), timeout=5.0)
-        if gpu.get("available"):
-            checks.append({"name": "GPU Acceleration", "passed": True, "message": f"NVIDIA GPU Active ({gpu.get('utilization_gpu')}% load)"})
-        else:
-            checks.append({"name": "GPU Acceleration", "passed": True, "message": "Running on CPU (No NVIDIA GPU detected)"})
-    except asyncio.TimeoutError:
-        checks.append({"name": "GPU Acceleration", "passed": True, "message": "GPU check timed out; assuming CPU mode"})
-    except Exception as e:
-        logger.error(f"Diagnostic Error (GPU): {e}")
-        checks.append({"name": "GPU Acceleration", "passed": True, "message": f"GPU check error: {str(e)} (defaulting to CPU)"})
+    async def _check_gpu():
+        try:
+            # Use a timeout of 5s for the GPU check call
+            gpu = await asyncio.wait_for(get_gpu_stats(), timeout=5.0)
+            if gpu.get("available"):
+                return {"name": "GPU Acceleration", "passed": True, "message": f"NVIDIA GPU Active ({gpu.get('utilization_gpu')}% load)"}
+            return {"name": "GPU Acceleration", "passed": True, "message": "Running on CPU (No NVIDIA GPU detected)"}
+        except asyncio.TimeoutError:
+            return {"name": "GPU Acceleration", "passed": True, "message": "GPU check timed out; assuming CPU mode"}
+        except Exception as e:
+            logger.error(f"Diagnostic Error (GPU): {e}")
+            return {"name": "GPU Acceleration", "passed": True, "message": f"GPU check error: {str(e)} (defaulting to CPU)"}
 
     # Check Config
-    try:
-        config_path = SCRIPT_DIR / "config.json"
-        if config_path.exists():
+    def _check_config():
+        try:
+            config_path = SCRIPT_DIR / "config.json"
+            # Open directly instead of exists() + read: a missing file is just the error case
+            try:
+                raw = config_path.read_bytes()
+            except FileNotFoundError:
+                return {"name": "Configuration", "passed": True, "message": "Using default settings (no config.json)"}
             try:
-                json.loads(config_path.read_text(encoding="utf-8"))
-                checks.append({"name": "Configuration", "passed": True, "message": "config.json is valid"})
+                orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+                return {"name": "Configuration", "passed": True, "message": "config.json is valid"}
             except Exception:
-                checks.append({"name": "Configuration", "passed": False, "message": "config.json is corrupted"})
-        else:
-            checks.append({"name": "Configuration", "passed": True, "message": "Using default settings (no config.json)"})
-    except Exception as e:
-        checks.append({"name": "Configuration", "passed": False, "message": str(e)})
+                return {"name": "Configuration", "passed": False, "message": "config.json is corrupted"}
+        except Exception as e:
+            return {"name": "Configuration", "passed": False, "message": str(e)}
 
-    # Check Startup Shortcut cache/consistency
-    try:
-        if os.name == 'nt':
+    # Check Startup Shortcut cache/consistency (Windows only)
+    def _check_startup():
+        try:
+            if os.name != 'nt':
+                return None
             shortcut_path = _startup_shortcut_path()
             cfg = load_config()
             should_be_enabled = cfg.get("launch_on_startup", False)
             is_enabled = shortcut_path.exists()
             if should_be_enabled == is_enabled:
-                checks.append({"name": "Startup Sync", "passed": True, "message": "Settings match system state"})
-            else:
-                checks.append({"name": "Startup Sync", "passed": False, "message": f"Config mismatch: Config={should_be_enabled}, Disk={is_enabled}"})
-    except Exception as e:
-        logger.error(f"Diagnostic Error (Startup): {e}")
-        # Not a critical failure for the whole system
-        checks.append({"name": "Startup Sync", "passed": True, "message": f"Could not check startup state: {e}"})
+                return {"name": "Startup Sync", "passed": True, "message": "Settings match system state"}
+            return {"name": "Startup Sync", "passed": False, "message": f"Config mismatch: Config={should_be_enabled}, Disk={is_enabled}"}
+        except Exception as e:
+            logger.error(f"Diagnostic Error (Startup): {e}")
+            # Not a critical failure for the whole system
+            return {"name": "Startup Sync", "passed": True, "message": f"Could not check startup state: {e}"}
+
+    names = ("Piper Engine", "Voice Models", "GPU Acceleration", "Configuration", "Startup Sync")
+    results = await asyncio.gather(
+        asyncio.to_thread(_check_piper),
+        asyncio.to_thread(_check_voices),
+        _check_gpu(),
+        asyncio.to_thread(_check_config),
+        asyncio.to_thread(_check_startup),
+        return_exceptions=True,
+    )
 
+    checks = []
+    for name, res in zip(names, results):
+        if isinstance(res, BaseException):
+            logger.error(f"Diagnostic Error ({name}): {res}")
+            checks.append({"name": name, "passed": False, "message": str(res)})
+        elif res is not None:
+            checks.append(res)
     return {"success": True, "checks": checks}
 
 
@@ -3219,7 +4141,7 @@ def _ensure_guides_generated():
     """Mirror logic from Python UI to ensure HTML guides are generated from Markdown source."""
     # 1. Voice Guide
     try:
-        guide_md = SCRIPT_DIR.parent / "voices" / "HOW_TO_ADD_VOICES.md"
+        guide_md = HOW_TO_ADD_MD
         template = SCRIPT_DIR / "voice_guide_template.html"
         # Check in docs first
         output = SCRIPT_DIR.parent / "docs" / "Voice_Guide.html"
@@ -3245,32 +4167,62 @@ async def open_logs_folder():
         if not logs_dir.exists():
             logs_dir.mkdir(parents=True, exist_ok=True)
         
-        _force_open_path(logs_dir)
+        await asyncio.to_thread(_force_open_path, logs_dir)
         return {"success": True}
     except Exception as e:
         logger.error(f"Failed to open logs folder: {e}")
         return {"success": False, "error": str(e)}
 
 
+# Manager dashboards this server started directly (fallback launch path); these
+# are terminated by handle instead of being searched for. Not persisted: a pid
+# saved across server restarts could belong to an unrelated process by then.
+_dashboard_procs: list[subprocess.Popen] = []
+
+
+def _terminate_tracked_dashboards() -> None:
+    for proc in _dashboard_procs:
+        if proc.poll() is None:
+            try:
+                proc.terminate()
+                proc.wait(timeout=0.5)
+            except Exception as e:
+                logger.debug(f"Could not stop dashboard pid {proc.pid}: {e}")
+    _dashboard_procs.clear()
+
+
 @app.post("/api/open-python-dashboard")
 async def open_python_dashboard():
     """Open the Python Manager Dashboard UI."""
     try:
         # 1. Force Close existing instances first (as requested by user)
         # This ensures the new window appears in the foreground by restarting it.
+        if _dashboard_procs:
+            await asyncio.to_thread(_terminate_tracked_dashboards)
         if os.name == 'nt':
-            ps_kill = '''
+            titles = ("PiperTTS Mockingbird • Manager Dashboard", "PiperTTS Mockingbird")
+            try:
+                if _kill_windows_by_title(titles):
+                    # Poll every 25ms (500ms cap) instead of a fixed pause; usually already gone
+                    for _ in range(20):
+                        if not _any_window_matching(titles):
+                            break
+                        await asyncio.sleep(0.025)
+            except Exception as e:
+                logger.warning(f"Native window kill failed, falling back to PowerShell: {e}")
+                ps_kill = '''
 $titles = @("PiperTTS Mockingbird • Manager Dashboard", "PiperTTS Mockingbird")
-Get-Process | Where-Object { 
+# The dashboard always runs under python/pythonw; don't scan every process on the system
+Get-Process -Name python, pythonw -ErrorAction SilentlyContinue | Where-Object { 
     $p = $_
     $titles | Where-Object { $p.MainWindowTitle -like "*$_*" }
 } | Stop-Process -Force -ErrorAction SilentlyContinue
 '''
-            subprocess.run(["powershell", "-NoProfile", "-Command", ps_kill], 
-                           creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
-            
-            # Brief pause to ensure cleanup
-            await asyncio.sleep(0.5)
+                # Reuse the persistent PowerShell worker instead of cold-starting powershell.exe
+                await asyncio.to_thread(ps_worker.run_logged, ps_kill)
+                
+                # Brief pause to ensure cleanup
+                await asyncio.sleep(0.5)
 
         # 2. Launch new instance
         # Check root directory for launchers
@@ -3296,9 +4248,10 @@ Get-Process | Where-Object {
                     python_exe = str(w_exe)
             
             logger.info(f"Opening Python Dashboard via fallback script: {ui_script}")
-            subprocess.Popen([python_exe, str(ui_script)], 
+            proc = subprocess.Popen([python_exe, str(ui_script)], 
                            cwd=str(SCRIPT_DIR), 
                            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0) if os.name == 'nt' else 0)
+            _dashboard_procs.append(proc)
             return {"success": True}
             
         return {"success": False, "error": "Manager UI launcher or script not found"}
@@ -3307,23 +4260,37 @@ Get-Process | Where-Object {
         return {"success": False, "error": str(e)}
 
 
+# Guide locations in preference order: /docs/ or root, HTML before the Markdown source.
+# Only the candidate list is fixed; existence is probed per request because the
+# HTML guides can be (re)generated while the server runs.
+_WEBUI_GUIDE_CANDIDATES = (
+    SCRIPT_DIR.parent / "docs" / "WebUI_User_Manual.html",
+    SCRIPT_DIR.parent / "WebUI_User_Manual.html",
+    SCRIPT_DIR.parent / "docs" / "WEBUI_USER_MANUAL.md",
+    SCRIPT_DIR.parent / "WEBUI_USER_MANUAL.md",
+)
+_VOICE_GUIDE_CANDIDATES = (
+    SCRIPT_DIR.parent / "docs" / "Voice_Guide.html",
+    SCRIPT_DIR.parent / "Voice_Guide.html",
+    HOW_TO_ADD_MD,
+)
+
+
+def _first_existing(candidates) -> Optional[Path]:
+    """First path in candidates that exists (one stat each, stopping at the first hit)."""
+    for p in candidates:
+        if os.path.exists(p):
+            return p
+    return None
+
+
 @app.get("/api/open-webui-guide")
 async def open_webui_guide():
     """Open the WebUI User Manual HTML."""
     try:
-        # Check in /docs/ or root
-        guide_path = SCRIPT_DIR.parent / "docs" / "WebUI_User_Manual.html"
-        if not guide_path.exists():
-            guide_path = SCRIPT_DIR.parent / "WebUI_User_Manual.html"
-            
-        if not guide_path.exists():
-            # Fallback to MD if HTML is missing
-            guide_path = SCRIPT_DIR.parent / "docs" / "WEBUI_USER_MANUAL.md"
-        if not guide_path.exists():
-            guide_path = SCRIPT_DIR.parent / "WEBUI_USER_MANUAL.md"
-            
-        if guide_path.exists():
-            _force_open_path(guide_path)
+        guide_path = _first_existing(_WEBUI_GUIDE_CANDIDATES)
+        if guide_path:
+            await asyncio.to_thread(_force_open_path, guide_path)
             return {"success": True}
         return {"success": False, "error": "User Manual (HTML or MD) not found"}
     except Exception as e:
@@ -3334,17 +4301,9 @@ async def open_webui_guide():
 async def open_add_voices_guide():
     """Open the Add Voices Guide HTML."""
     try:
-        # Check in /docs/ or root
-        guide_path = SCRIPT_DIR.parent / "docs" / "Voice_Guide.html"
-        if not guide_path.exists():
-            guide_path = SCRIPT_DIR.parent / "Voice_Guide.html"
-            
-        if not guide_path.exists():
-            # Fallback to source MD
-            guide_path = SCRIPT_DIR.parent / "voices" / "HOW_TO_ADD_VOICES.md"
-            
-        if guide_path.exists():
-            _force_open_path(guide_path)
+        guide_path = _first_existing(_VOICE_GUIDE_CANDIDATES)
+        if guide_path:
+            await asyncio.to_thread(_force_open_path, guide_path)
             return {"success": True}
         return {"success": False, "error": "Voice Guide not found"}
     except Exception as e:
@@ -3354,18 +4313,39 @@ async def open_add_voices_guide():
 # --- Web Dashboard ---
 WEB_DIR = SCRIPT_DIR / "web"
 
+# index.html bytes, keyed by the (st_mtime_ns, st_size) they were read at
+_INDEX_CACHE = {"key": None, "body": b"", "etag": ""}
+
+
 @app.get("/", response_class=HTMLResponse)
-async def serve_dashboard():
-    """Serve the dashboard index page at the root URL."""
+async def serve_dashboard(request: Request):
+    """Serve the dashboard index page at the root URL.
+
+    The raw bytes are kept in memory and re-read only when the file changes; browsers
+    revalidate with If-None-Match and get a bodyless 304 while it is unchanged.
+    """
     index_file = WEB_DIR / "index.html"
-    if index_file.exists():
-        return index_file.read_text(encoding="utf-8")
-    return "<h1>Piper TTS Server</h1><p>Dashboard not found in src/web/index.html</p>"
+    try:
+        st = os.stat(index_file)
+    except OSError:
+        return "<h1>Piper TTS Server</h1><p>Dashboard not found in src/web/index.html</p>"
+
+    key = (st.st_mtime_ns, st.st_size)
+    if _INDEX_CACHE["key"] != key:
+        _INDEX_CACHE["body"] = await asyncio.to_thread(index_file.read_bytes)
+        _INDEX_CACHE["etag"] = _stat_etag(st)
+        _INDEX_CACHE["key"] = key
+
+    etag = _INDEX_CACHE["etag"]
+    headers = {"Cache-Control": "no-cache", "ETag": etag}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(_INDEX_CACHE["body"], headers=headers)
 
 # ==================== Home Assistant & Wyoming Integration ====================
 
 # Initialize HA exporter
-VOICES_DIR = SCRIPT_DIR.parent / "voices"
+VOICES_DIR = VOICES_ROOT
 HA_EXPORT_DIR = SCRIPT_DIR.parent / "exports" / "home_assistant"
 ha_exporter = HomeAssistantExporter(VOICES_DIR, HA_EXPORT_DIR)
 
@@ -3393,7 +4373,7 @@ async def api_ha_export_voice(voice_name: str):
     In the new lean model, we don't save to disk; we just verify the voice exists.
     """
     try:
-        if not re.match(r'^[a-zA-Z0-9_-]{1,64}$', voice_name):
+        if not _VOICE_NAME_RE.match(voice_name):
             return {"success": False, "error": "Invalid voice name format"}
         
         # Check if voice exists (reusing the discovery logic)
@@ -3415,17 +4395,18 @@ async def api_ha_export_voice(voice_name: str):
 async def api_ha_download_export(voice_name: str):
     """Generate and stream the HA voice package on-the-fly."""
     try:
-        if not re.match(r'^[a-zA-Z0-9_-]{1,64}$', voice_name):
+        if not _VOICE_NAME_RE.match(voice_name):
             raise HTTPException(status_code=400, detail="Invalid voice name format")
         
-        result = ha_exporter.create_voice_zip_buffer(voice_name)
+        # Zip is built while it is sent: constant memory, first bytes arrive immediately
+        result = ha_exporter.stream_voice_zip(voice_name)
         if not result:
             raise HTTPException(status_code=404, detail="Voice not found or export failed")
             
-        buffer, filename = result
+        chunks, filename = result
         
         return StreamingResponse(
-            buffer,
+            chunks,
             media_type="application/zip",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
@@ -3452,12 +4433,8 @@ async def api_open_integration_folder(name: str):
         if not folder_path.exists():
             return {"success": False, "error": f"Folder {name} not found"}
             
-        if sys.platform == "win32":
-            _force_open_path(folder_path)
-        elif sys.platform == "darwin":  # macOS
-            subprocess.Popen(["open", str(folder_path)])
-        else:  # linux
-            subprocess.Popen(["xdg-open", str(folder_path)])
+        # Explorer on Windows, open/xdg-open elsewhere; spawning off the event loop
+        await asyncio.to_thread(_force_open_path, folder_path)
             
         return {"success": True}
     except Exception as e:
@@ -3537,6 +4514,12 @@ async def api_wyoming_start(host: str = "127.0.0.1", port: int = 10200):
 @app.post("/api/wyoming/stop")
 async def api_wyoming_stop():
     """Stop the Wyoming protocol server."""
+    # Shielded: if the client disconnects mid-stop, teardown still runs to completion
+    # instead of leaving a half-stopped server (and its port) behind.
+    return await asyncio.shield(asyncio.ensure_future(_stop_wyoming()))
+
+
+async def _stop_wyoming() -> dict:
     global wyoming_server, wyoming_task
     
     async with wyoming_lock:
@@ -3546,6 +4529,7 @@ async def api_wyoming_stop():
             
             await wyoming_server.stop()
             
+            # stop() usually ends the serve task itself; only cancel and wait if it didn't
             if wyoming_task and not wyoming_task.done():
                 wyoming_task.cancel()
                 try:
@@ -3564,34 +4548,52 @@ async def api_wyoming_stop():
             return {"success": False, "error": str(e)}
 
 
+_LOCAL_IP_TTL = 60.0
+_LOCAL_IP_CACHE = {"key": None, "ip": None, "ts": 0.0}
+
+
+def _detect_local_ip() -> Optional[str]:
+    """LAN address of the default route (UDP connect sends no packets)."""
+    import socket
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.settimeout(0.5)
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+    except Exception:
+        return None
+
+
 @app.get("/api/wyoming/status")
 async def api_wyoming_status():
     """Get Wyoming server status."""
     try:
-        is_running = wyoming_server and wyoming_server.is_running()
+        # Snapshot the global once: start/stop can swap it while we await the IP lookup.
+        # is_running() is a flag read and voices a dict, so nothing here can stall a poll.
+        server = wyoming_server
+        is_running = server and server.is_running()
         
         status = {
             "running": is_running,
-            "voices_count": len(wyoming_server.handler.voices) if is_running else 0
+            "voices_count": len(server.handler.voices) if is_running else 0
         }
         
         if is_running:
-            status["host"] = wyoming_server.host
-            status["port"] = wyoming_server.port
+            status["host"] = server.host
+            status["port"] = server.port
             
             # Detect local network IP for display
-            if wyoming_server.host == "0.0.0.0":
-                try:
-                    import socket
-                    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                    s.connect(("8.8.8.8", 80))
-                    local_ip = s.getsockname()[0]
-                    s.close()
-                    status["local_ip"] = local_ip
-                except Exception:
-                    status["local_ip"] = None
+            # (cached per host/port for a minute; the dashboard polls this endpoint)
+            if server.host == "0.0.0.0":
+                key = (server.host, server.port)
+                now = time.monotonic()
+                if _LOCAL_IP_CACHE["key"] != key or now - _LOCAL_IP_CACHE["ts"] >= _LOCAL_IP_TTL:
+                    _LOCAL_IP_CACHE["ip"] = await asyncio.to_thread(_detect_local_ip)
+                    _LOCAL_IP_CACHE["key"] = key
+                    _LOCAL_IP_CACHE["ts"] = now
+                status["local_ip"] = _LOCAL_IP_CACHE["ip"]
             else:
-                status["local_ip"] = wyoming_server.host
+                status["local_ip"] = server.host
         
         return {"success": True, "status": status}
         
@@ -3602,12 +4604,7 @@ async def api_wyoming_status():
 
 def _wyoming_startup_shortcut_path() -> Path:
     """Return the path to the Wyoming startup shortcut."""
-    if os.name != "nt":
-        return SCRIPT_DIR / "wyoming_autostart_dummy"
-    appdata = os.environ.get("APPDATA")
-    if not appdata:
-        return SCRIPT_DIR / "PiperTTS Wyoming.lnk"
-    return Path(appdata) / "Microsoft" / "Windows" / "Start Menu" / "Programs" / "Startup" / "PiperTTS Wyoming.lnk"
+    return _WYOMING_LNK_PATH
 
 
 @app.get("/api/wyoming/startup")
@@ -3630,11 +4627,8 @@ async def set_wyoming_startup(request: Request):
         enabled = data.get("enabled", False)
         
         # Update config.json
-        cfg = load_config()
-        cfg["wyoming_launch_on_startup"] = enabled
-        config_path = SCRIPT_DIR / "config.json"
         try:
-            config_path.write_text(json.dumps(cfg, indent=4), encoding="utf-8")
+            await asyncio.to_thread(set_config_value, "wyoming_launch_on_startup", enabled)
         except Exception as e:
             logger.error(f"Failed to write config.json: {e}")
             
@@ -3665,21 +4659,13 @@ objShell.CurrentDirectory = srcDir
 ' Run hidden
 objShell.Run pythonExe & " " & Chr(34) & pythonScript & Chr(34), 0, False
 '''
-                    wyoming_vbs_path.write_text(vbs_content, encoding="utf-8")
+                    await asyncio.to_thread(wyoming_vbs_path.write_text, vbs_content, encoding="utf-8")
                     logger.info(f"Created Wyoming launcher VBS: {wyoming_vbs_path}")
                 
                 if wyoming_vbs_path.exists():
                     shortcut_path.parent.mkdir(parents=True, exist_ok=True)
-                    ps_cmd = (
-                        f"$WshShell = New-Object -ComObject WScript.Shell; "
-                        f"$Shortcut = $WshShell.CreateShortcut('{str(shortcut_path)}'); "
-                        f"$Shortcut.TargetPath = '{str(wyoming_vbs_path)}'; "
-                        f"$Shortcut.WorkingDirectory = '{str(SCRIPT_DIR.parent)}'; "
-                        f"$Shortcut.WindowStyle = 7; "
-                        f"$Shortcut.Save()"
-                    )
-                    subprocess.run(["powershell", "-NoProfile", "-Command", ps_cmd], 
-                                 check=False, capture_output=True, creationflags=0x08000000)
+                    # COM (or the PowerShell fallback) blocks; keep it off the event loop
+                    await asyncio.to_thread(_create_shortcut, shortcut_path, wyoming_vbs_path, window_style=7)
                     logger.info(f"Created Wyoming startup shortcut: {shortcut_path}")
         else:
             if shortcut_path.exists():
@@ -3695,7 +4681,7 @@ objShell.Run pythonExe & " " & Chr(34) & pythonScript & Chr(34), 0, False
 if WEB_DIR.exists():
     # Mount Dojo data so we can play audio clips in the browser
     # Mapping tts_dojo -> /dojo_data/
-    DOJO_PATH = SCRIPT_DIR.parent / "training" / "make piper voice models" / "tts_dojo"
+    DOJO_PATH = DOJO_ROOT
     logger.info(f"Mounting DOJO_PATH: {DOJO_PATH}")
     if DOJO_PATH.exists():
         logger.info("DOJO_PATH found, mounting to /dojo_data")
@@ -3703,8 +4689,9 @@ if WEB_DIR.exists():
     else:
         logger.warning(f"DOJO_PATH NOT FOUND: {DOJO_PATH}")
 
-    # Mount everything else (css, js) at the root
-    app.mount("/", StaticFiles(directory=str(WEB_DIR)), name="static")
+    # Dashboard assets (css, js, vendor) live under /static; "/" itself is serve_dashboard.
+    # A root mount would make every unmatched URL (e.g. API 404s) probe the web folder.
+    app.mount("/static", StaticFiles(directory=str(WEB_DIR)), name="static")
 
 
 if __name__ == "__main__":
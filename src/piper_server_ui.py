@@ -8,7 +8,7 @@ import traceback
 from pathlib import Path
 
 # Common utilities for sanitization and config management
-from common_utils import validate_voice_name, safe_config_save, safe_config_load
+from common_utils import validate_voice_name, safe_config_save, safe_config_load, acquire_instance_lock, fast_rmtree, http_get_json, http_post_json, text_log_buffer
 
 # Import the downloader module
 try:
@@ -39,6 +39,18 @@ else:
 # Default server settings
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 5002
+# Status polling interval: starts here and doubles up to the max while the status is unchanged
+STATUS_REFRESH_MIN_MS = 5000
+STATUS_REFRESH_MAX_MS = 30000
+# Test text up to this length is synthesized in a single /api/tts request instead of per sentence
+SINGLE_REQUEST_MAX_CHARS = 250
+# Seconds of synthesized audio the test fetcher may buffer ahead of playback (at least 2 chunks)
+TEST_PREFETCH_SECS = 10.0
+# Settings changes within this window are written to config.json once
+SETTINGS_SAVE_DEBOUNCE_MS = 500
+# "Generating..." animation tick; slowed down while the window is minimized or hidden
+LOADING_ANIM_MS = 400
+LOADING_ANIM_HIDDEN_MS = 2000
 RUN_KEY = r"HKCU\Software\Microsoft\Windows\CurrentVersion\Run"  # legacy (older versions)
 RUN_VALUE_NAME = "Piper TTS Server"  # legacy (older versions)
 
@@ -69,32 +81,46 @@ def _install_excepthook() -> None:
 _install_excepthook()
 
 
+import http.client
 import json
 import re
 import socket
 import subprocess
+import tempfile
 import threading
 import queue
+import random
 import urllib.error
+import urllib.parse
 import urllib.request
 
 import tkinter as tk
-from tkinter import ttk, filedialog
+from tkinter import ttk, filedialog, messagebox, simpledialog
 
-# Single instance check port
-SINGLE_INSTANCE_PORT = 5003
+# Sentence / clause boundaries for chunked TTS (lookbehind keeps the punctuation with the text)
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_COMMA_SPLIT_RE = re.compile(r'(?<=,)\s+')
+
+# Fun test messages for the "random" test option
+_TEST_MESSAGES = (
+    "Hey there! I'm Piper, your friendly text-to-speech assistant!",
+    "Testing one two three! Sounds great, doesn't it?",
+    "Hello! I can speak anything you type. Pretty cool, right?",
+    "Beep boop! Just kidding, I'm much better than a robot!",
+    "Ready to chat? I'm all ears... well, actually all voice!",
+)
+
+# Single instance lock file (shared with piper_manager_ui.py)
+SINGLE_INSTANCE_LOCK = SCRIPT_DIR / ".instance.lock"
 
 def check_single_instance() -> bool:
-    """Check if another instance is already running using a socket."""
-    try:
-        # Try to bind to the port
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.bind(('127.0.0.1', SINGLE_INSTANCE_PORT))
-        # Keep the socket open for the life of the process
-        globals()['_instance_socket'] = s
-        return True
-    except socket.error:
+    """Check if another instance is already running using an OS file lock."""
+    lock = acquire_instance_lock(SINGLE_INSTANCE_LOCK)
+    if lock is None:
         return False
+    # Keep the file open for the life of the process
+    globals()['_instance_lock'] = lock
+    return True
 
 
 def _startup_shortcut_path() -> Path:
@@ -128,18 +154,21 @@ def _now() -> str:
     return time.strftime("%H:%M:%S")
 
 
+# Log lines arriving within this window are inserted into the Text widget together
+LOG_FLUSH_MS = 50
+# Lines kept in the log widget; older ones are trimmed on flush
+MAX_LOG_LINES = 5000
+
+
 def log_to(widget: tk.Text, msg: str, save_to_file: bool = True) -> None:
-    """Append a message to a Tkinter Text widget and optionally save to log file."""
+    """
+    Append a message to a Tkinter Text widget and optionally save to log file.
+    Safe to call from any thread; lines are batched and shown within ~50ms.
+    """
     if save_to_file:
         _write_ui_log(msg)
 
-    try:
-        widget.configure(state="normal")
-        widget.insert("end", f"[{_now()}] {msg}\n")
-        widget.see("end")
-        widget.configure(state="disabled")
-    except Exception:
-        pass
+    text_log_buffer(widget, LOG_FLUSH_MS, MAX_LOG_LINES).push(f"[{_now()}] {msg}\n")
 
 
 def run_cmd_capture(args: list[str], cwd: Path | None = None) -> tuple[int, str]:
@@ -182,7 +211,6 @@ def run_cmd_realtime(args: list[str], log_widget: tk.Text, progress_callback=Non
             **kwargs,
         )
 
-        full_output = []
         if p.stdout:
             for line in iter(p.stdout.readline, ""):
                 line_str = line.strip()
@@ -200,7 +228,6 @@ def run_cmd_realtime(args: list[str], log_widget: tk.Text, progress_callback=Non
                         pass
                 else:
                     log_to(log_widget, line_str, save_to_file=False)
-                full_output.append(line)
         
         p.stdout.close()
         return_code = p.wait()
@@ -218,7 +245,11 @@ def ensure_venv_and_deps(log: tk.Text) -> bool:
             code, out = run_cmd_capture([str(VENV_PYTHON), "--version"])
             if " 3.13" in out or " 3.14" in out:
                 log_to(log, "Existing venv is Python 3.13+ (incompatible). Recreating with 3.10...")
-                shutil.rmtree(VENV_DIR, ignore_errors=True)
+                # Parallel delete (venvs hold thousands of small files); sweep up any leftovers
+                try:
+                    fast_rmtree(VENV_DIR)
+                except OSError:
+                    shutil.rmtree(VENV_DIR, ignore_errors=True)
         except Exception:
             pass
 
@@ -386,30 +417,18 @@ def ensure_piper_binary(log: tk.Text) -> bool:
 
     log_to(log, "Piper binary not found. Downloading...")
     
-    # Redirect stdout to capture download progress for the log
-    class LogRedirect:
-        def __init__(self, text_widget):
-            self.text_widget = text_widget
-        def write(self, msg):
-            msg_strip = msg.strip()
-            if msg_strip:
-                # Filter out PROGRESS: markers from the log window
-                if msg_strip.startswith("PROGRESS:"):
-                    return
-                # Use after() to be thread-safe with Tkinter
-                self.text_widget.after(0, lambda: log_to(self.text_widget, msg_strip))
-        def flush(self):
-            pass
+    # Relay download progress to the log; after() keeps it thread-safe with Tkinter
+    def relay(msg: str) -> None:
+        msg = msg.strip()
+        # Filter out PROGRESS: markers from the log window
+        if msg and not msg.startswith("PROGRESS:"):
+            log.after(0, log_to, log, msg)
 
-    original_stdout = sys.stdout
     try:
-        sys.stdout = LogRedirect(log)
-        download_piper.download_and_extract_piper(SCRIPT_DIR)
+        download_piper.download_and_extract_piper(SCRIPT_DIR, log=relay)
     except Exception as e:
         log_to(log, f"Download failed: {e}")
         return False
-    finally:
-        sys.stdout = original_stdout
 
     # Verify again
     if (piper_dir / exe_name).exists() or (piper_dir / "piper" / exe_name).exists():
@@ -420,25 +439,55 @@ def ensure_piper_binary(log: tk.Text) -> bool:
     return False
 
 
-def http_get_json(url: str, timeout: float = 5.0) -> dict:
-    """Perform an HTTP GET request and return the JSON response."""
-    req = urllib.request.Request(url, method="GET")
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        data = resp.read()
-    return json.loads(data.decode("utf-8"))
+def _open_health_connection(host: str, port: int, connect_timeout: float, read_timeout: float) -> http.client.HTTPConnection:
+    # Fails fast with ConnectionRefusedError / timeout, skipping the HTTP phase entirely
+    sock = socket.create_connection((host, port), timeout=connect_timeout)
+    sock.settimeout(read_timeout)
+    conn = http.client.HTTPConnection(host, port, timeout=read_timeout)
+    conn.sock = sock
+    return conn
 
 
-def http_post_json(url: str, payload: dict, timeout: float = 10.0) -> bytes:
-    """Perform an HTTP POST request with a JSON payload and return the response bytes."""
-    data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        method="POST",
-        data=data,
-        headers={"Content-Type": "application/json"},
-    )
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return resp.read()
+def _port_accepts(host: str, port: int, timeout: float = 0.2) -> bool:
+    """True if something accepts a TCP connection on host:port."""
+    try:
+        socket.create_connection((host, port), timeout=timeout).close()
+        return True
+    except OSError:
+        return False
+
+
+def _wait_for_port(host: str, port: int, listening: bool = True, attempts: int = 20) -> bool:
+    """
+    Poll host:port until it is (or, with listening=False, is no longer) accepting connections.
+    Returns as soon as that happens, or False after `attempts` tries (~0.1-0.3s each).
+    """
+    for _ in range(attempts):
+        if _port_accepts(host, port) == listening:
+            return True
+        time.sleep(0.1)
+    return False
+
+
+def ping_server(host: str, port: int, connect_timeout: float = 0.5, read_timeout: float = 10.0) -> int:
+    """
+    Liveness check: HEAD /ping on a fresh connection, returning the HTTP status.
+    Raises OSError when the server can't be reached. A stopped server refuses (or, on a
+    firewalled host, drops) the connection, which fails within connect_timeout; only a
+    server that accepted the connection gets the long read timeout. Any response at all
+    means the server process is up (an older server without /ping answers 404).
+
+    The connection is not kept between polls: they are 5-30s apart, longer than
+    uvicorn's 5s keep-alive, so a reused socket would almost always be dead.
+    """
+    conn = _open_health_connection(host, port, connect_timeout, read_timeout)
+    try:
+        conn.request("HEAD", "/ping", headers={"Connection": "close"})
+        resp = conn.getresponse()
+        resp.read()
+        return resp.status
+    finally:
+        conn.close()
 
 
 def powershell(args: str) -> tuple[int, str]:
@@ -790,6 +839,53 @@ def save_config(cfg: dict) -> None:
     safe_config_save(CONFIG_PATH, cfg)
 
 
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class _DaemonPool:
+    """
+    A few reused daemon threads fed from a queue. ThreadPoolExecutor's workers are
+    joined at interpreter exit, so closing the window during a 10s request would leave
+    a headless process behind; daemon workers die with the Tk main thread instead.
+    """
+
+    def __init__(self, workers: int, name: str) -> None:
+        self._jobs: queue.SimpleQueue = queue.SimpleQueue()
+        self._closed = False
+        for i in range(workers):
+            threading.Thread(target=self._run, name=f"{name}-{i}", daemon=True).start()
+
+    def submit(self, fn) -> None:
+        if self._closed:
+            raise RuntimeError("pool is shut down")
+        self._jobs.put(fn)
+
+    def shutdown(self) -> None:
+        """Drop queued jobs; running ones are abandoned when the process exits."""
+        self._closed = True
+        try:
+            while True:
+                self._jobs.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _run(self) -> None:
+        while True:
+            fn = self._jobs.get()
+            if self._closed:
+                continue
+            try:
+                fn()
+            except Exception:
+                # After shutdown the widgets are gone, so Tk errors are expected then
+                if not self._closed:
+                    _write_ui_log("Worker task failed:\n" + traceback.format_exc())
+
+
 class App(ttk.Frame):
     def __init__(self, master: tk.Tk):
         super().__init__(master)
@@ -797,6 +893,10 @@ class App(ttk.Frame):
 
         self.host_var = tk.StringVar(value=DEFAULT_HOST)
         self.port_var = tk.IntVar(value=DEFAULT_PORT)
+        # (host, port, base URL) from the Server fields; cleared whenever host or port is edited
+        self._cached_server: tuple[str, int, str] | None = None
+        self.host_var.trace_add("write", self._invalidate_server_addr)
+        self.port_var.trace_add("write", self._invalidate_server_addr)
         self.voice_var = tk.StringVar()
         self.random_var = tk.BooleanVar(value=True)
         self.auto_restart_var = tk.BooleanVar(value=False)
@@ -806,17 +906,28 @@ class App(ttk.Frame):
 
         self.is_playing = False  # Track if audio is playing
         self.playback_process = None  # Track external player process (Mac/Linux)
+        self._playback_stopped = threading.Event()  # Set by Stop to wake a waiting playback loop
         self._loading_active = False  # Track if TTS is generating
         self._should_be_running = False
         self._last_restart_time = 0
+        self._status_seq = 0  # Latest /health probe; older results are dropped
+        self._last_status = ""
+        self._refresh_interval = STATUS_REFRESH_MIN_MS
 
         self.available_voices = scan_voices()
+        self._voice_names: tuple = ()  # Names last pushed into the voice combobox
+        self._config: dict = {}
+        self._config_mtime: int | None = None
+        self._save_after_id = None  # Pending debounced settings write
+        # Reused workers for short tasks; the status poll alone would otherwise start a thread every few seconds
+        self._pool = _DaemonPool(4, "ui-worker")
         self._load_settings()
 
         self._status_style = "Badge.Unknown.TLabel"
         self._autostart_style = "Badge.Unknown.TLabel"
 
         self._build()
+        self.master.protocol("WM_DELETE_WINDOW", self._on_close)
         self._refresh_autostart()
         self._schedule_status_refresh()
 
@@ -871,7 +982,11 @@ class App(ttk.Frame):
         """Rescan voices and update the combobox."""
         self.available_voices = scan_voices()
         if hasattr(self, "voice_combo"):
-            self.voice_combo["values"] = [v.name for v in self.available_voices]
+            names = tuple(v.name for v in self.available_voices)
+            # Only push the list through Tcl when it actually changed
+            if names != self._voice_names:
+                self._voice_names = names
+                self.voice_combo.configure(values=names)
             
             # If current selection is empty or invalid, pick the first one
             current = self.voice_var.get()
@@ -915,7 +1030,8 @@ class App(ttk.Frame):
         voice_frame.columnconfigure(0, weight=1)
 
         self.voice_combo = ttk.Combobox(voice_frame, textvariable=self.voice_var, state="readonly", width=50)
-        self.voice_combo["values"] = [v.name for v in self.available_voices]
+        self._voice_names = tuple(v.name for v in self.available_voices)
+        self.voice_combo.configure(values=self._voice_names)
         self.voice_combo.grid(row=0, column=0, sticky="ew", padx=8, pady=6)
         self.voice_combo.bind("<<ComboboxSelected>>", lambda e: self._save_voice_selection())
         
@@ -1008,13 +1124,34 @@ class App(ttk.Frame):
         log_to(self.log, f"Found {len(self.available_voices)} voice(s): {', '.join(v.name for v in self.available_voices)}")
 
     def _thread(self, fn):
+        """Dedicated thread, for long-running or blocking work (installs, playback, log tail)."""
         t = threading.Thread(target=fn, daemon=True)
         t.start()
 
+    def _submit(self, fn):
+        """Short one-shot work (status probes, button actions) on the shared worker pool."""
+        try:
+            self._pool.submit(fn)
+        except RuntimeError:
+            pass  # Pool already shut down: the window is closing
+
+    def _cached_server_addr(self) -> tuple[str, int, str]:
+        # Raises ValueError / TclError for an invalid port; only valid values are cached
+        server = self._cached_server
+        if server is None:
+            host = self.host_var.get().strip() or DEFAULT_HOST
+            port = int(self.port_var.get() or DEFAULT_PORT)
+            server = self._cached_server = (host, port, f"http://{host}:{port}")
+        return server
+
+    def _server_addr(self) -> tuple[str, int]:
+        return self._cached_server_addr()[:2]
+
     def _base_url(self) -> str:
-        host = self.host_var.get().strip() or DEFAULT_HOST
-        port = int(self.port_var.get() or DEFAULT_PORT)
-        return f"http://{host}:{port}"
+        return self._cached_server_addr()[2]
+
+    def _invalidate_server_addr(self, *_args) -> None:
+        self._cached_server = None
 
     def _refresh_autostart(self) -> None:
         installed, label = autostart_query()
@@ -1024,22 +1161,45 @@ class App(ttk.Frame):
             self.autostart_label.configure(style=self._autostart_style)
 
     def _refresh_status(self) -> None:
-        base = self._base_url()
-        is_running = False
+        """Probe /health on a worker thread; the result is applied on the Tk thread."""
+        self._status_seq += 1
+        seq = self._status_seq
         try:
-            # Increased timeout from default 5s to 10s to avoid false positives when server is busy
-            info = http_get_json(f"{base}/health", timeout=10.0)
-            if info.get("ok") is True:
-                self.status_var.set("Status: running")
-                self._status_style = "Badge.Running.TLabel"
-                is_running = True
-            else:
-                self.status_var.set(f"Status: error ({info.get('error', 'unknown')})")
-                self._status_style = "Badge.Error.TLabel"
-        except Exception:
-            self.status_var.set("Status: not running")
-            self._status_style = "Badge.Stopped.TLabel"
+            host, port = self._server_addr()
+        except (ValueError, tk.TclError):
+            host, port = self.host_var.get().strip() or DEFAULT_HOST, DEFAULT_PORT
+
+        def work():
+            is_running = False
+            try:
+                # Connect must succeed within 0.5s; the 10s read timeout avoids false positives when busy.
+                # The poll only needs liveness; the full /health JSON is for the Check Status button.
+                code = ping_server(host, port)
+                if code < 500:
+                    text, style = "Status: running", "Badge.Running.TLabel"
+                    is_running = True
+                else:
+                    text, style = f"Status: error (HTTP {code})", "Badge.Error.TLabel"
+            except Exception:
+                text, style = "Status: not running", "Badge.Stopped.TLabel"
+            self.master.after(0, lambda: self._apply_status(seq, text, style, is_running))
 
+        self._submit(work)
+
+    def _apply_status(self, seq: int, text: str, style: str, is_running: bool) -> None:
+        # A newer probe was started meanwhile (e.g. after Start/Stop); its result wins
+        if seq != self._status_seq:
+            return
+
+        # Back off while nothing changes (5s -> 10s -> 20s -> 30s), snap back on any change
+        if text == self._last_status:
+            self._refresh_interval = min(self._refresh_interval * 2, STATUS_REFRESH_MAX_MS)
+        else:
+            self._refresh_interval = STATUS_REFRESH_MIN_MS
+        self._last_status = text
+
+        self.status_var.set(text)
+        self._status_style = style
         if hasattr(self, "status_label"):
             self.status_label.configure(style=self._status_style)
 
@@ -1056,20 +1216,21 @@ class App(ttk.Frame):
                 # We should probably call stop_server_by_port first to be sure.
                 def restart_work():
                     try:
+                        host = self.host_var.get().strip() or DEFAULT_HOST
                         port = int(self.port_var.get() or DEFAULT_PORT)
                         stop_server_by_port(self.log, port)
-                        time.sleep(1)
+                        # Start as soon as the old listener is gone instead of after a fixed second
+                        _wait_for_port(host, port, listening=False, attempts=10)
                         self._start_clicked()
                     except Exception as e:
                         log_to(self.log, f"Auto-restart failed: {e}")
                 
-                self._thread(restart_work)
+                self._submit(restart_work)
 
     def _schedule_status_refresh(self) -> None:
-        """Refresh status and schedule the next refresh."""
+        """Refresh status and schedule the next refresh (adaptive interval, see _apply_status)."""
         self._refresh_status()
-        # Refresh every 5 seconds
-        self.master.after(5000, self._schedule_status_refresh)
+        self.master.after(self._refresh_interval, self._schedule_status_refresh)
 
     def _on_random_toggle(self) -> None:
         """Enable or disable the test text entry based on the random checkbox."""
@@ -1093,9 +1254,18 @@ class App(ttk.Frame):
             self.loading_label.configure(text="")
             return
         
+        try:
+            hidden = self.master.state() in ("iconic", "withdrawn") or not self.master.winfo_viewable()
+        except tk.TclError:
+            hidden = False
+        if hidden:
+            # Nobody can see the label; keep the chain alive at a slow tick so it resumes on restore
+            self.master.after(LOADING_ANIM_HIDDEN_MS, lambda: self._animate_loading(step))
+            return
+        
         dots = "." * (step % 4)
         self.loading_label.configure(text=f"Generating{dots}")
-        self.master.after(400, lambda: self._animate_loading(step + 1))
+        self.master.after(LOADING_ANIM_MS, lambda: self._animate_loading(step + 1))
 
     def _start_clicked(self) -> None:
         self._should_be_running = True
@@ -1117,7 +1287,8 @@ class App(ttk.Frame):
                 log_to(self.log, "Start requested. Checking status...")
                 # Refresh voices in case they were just downloaded
                 self.master.after(0, self._refresh_voices)
-                time.sleep(1.2)
+                # Refresh the moment the server accepts connections; the regular poll covers slow starts
+                _wait_for_port(host, port)
                 self.master.after(0, self._refresh_status)
             else:
                 self.master.after(0, self._refresh_status)
@@ -1143,7 +1314,7 @@ class App(ttk.Frame):
             time.sleep(0.5)
             self.master.after(0, self._refresh_status)
 
-        self._thread(work)
+        self._submit(work)
 
     def _status_clicked(self) -> None:
         self.status_var.set("Status: checking...")
@@ -1163,13 +1334,13 @@ class App(ttk.Frame):
                 log_to(self.log, f"/health failed: {e}")
             self.master.after(0, self._refresh_status)
 
-        self._thread(work)
+        self._submit(work)
 
     def _split_text(self, text: str) -> list[str]:
         """Split text into meaningful chunks (sentences) for smoother TTS playback."""
         # Split by sentence endings (. ! ?) followed by space or newline
         # We use a lookbehind to keep the punctuation with the sentence
-        sentences = re.split(r'(?<=[.!?])\s+', text.strip())
+        sentences = _SENTENCE_SPLIT_RE.split(text.strip())
         # Filter out empty strings and further split very long sentences if needed
         chunks = []
         for s in sentences:
@@ -1178,21 +1349,30 @@ class App(ttk.Frame):
                 continue
             # If a single "sentence" is still huge (e.g. > 250 chars), split by commas or just length
             if len(s) > 250:
-                sub_chunks = re.split(r'(?<=,)\s+', s)
-                for sc in sub_chunks:
-                    sc = sc.strip()
-                    if sc:
-                        chunks.append(sc)
+                chunks.extend(sc for sc in map(str.strip, _COMMA_SPLIT_RE.split(s)) if sc)
             else:
                 chunks.append(s)
         return chunks
 
+    def _test_text(self) -> str:
+        """Text for Test/Download: a random message or whatever is in the test box."""
+        if self.random_var.get():
+            return random.choice(_TEST_MESSAGES)
+        return self.test_entry.get("1.0", "end-1c").strip() or "There is no text for me to say"
+
+    def _fetch_tts_wav(self, text: str, voice: str = "") -> bytes:
+        """POST text to /api/tts (optionally with a voice model) and return the WAV bytes."""
+        payload = {"text": text}
+        if voice:
+            payload["voice_model"] = voice
+        return http_post_json(f"{self._base_url()}/api/tts", payload)
+
     def _test_clicked(self) -> None:
         # Quick check of current status variable
         if "running" not in self.status_var.get().lower():
             log_to(self.log, "Error: Server is not running. Please click 'Start' in the Server section first.")
             # Trigger a status refresh just in case it's actually running now
-            self._thread(lambda: self.master.after(0, self._refresh_status))
+            self.master.after(0, self._refresh_status)
             return
 
         def work():
@@ -1201,56 +1381,56 @@ class App(ttk.Frame):
                 self._stop_audio_clicked()
                 time.sleep(0.2)
             
-            base = self._base_url()
-            url = f"{base}/api/tts"
-            
-            # Determine text to say
-            if self.random_var.get():
-                # Fun test messages
-                test_messages = [
-                    "Hey there! I'm Piper, your friendly text-to-speech assistant!",
-                    "Testing one two three! Sounds great, doesn't it?",
-                    "Hello! I can speak anything you type. Pretty cool, right?",
-                    "Beep boop! Just kidding, I'm much better than a robot!",
-                    "Ready to chat? I'm all ears... well, actually all voice!",
-                ]
-                import random
-                test_msg = random.choice(test_messages)
-            else:
-                test_msg = self.test_entry.get("1.0", "end-1c").strip()
-                if not test_msg:
-                    test_msg = "There is no text for me to say"
-            
+            test_msg = self._test_text()
             selected_voice = (self.voice_var.get() or "").strip()
-            chunks = self._split_text(test_msg)
+            # Short text goes out as one request; splitting only pays off when it hides
+            # the first-audio latency of a long passage
+            if len(test_msg) <= SINGLE_REQUEST_MAX_CHARS:
+                chunks = [test_msg]
+            else:
+                chunks = self._split_text(test_msg)
             
             log_to(self.log, f"Testing with voice: {selected_voice or '(default)'}")
             log_to(self.log, f"Text split into {len(chunks)} chunk(s).")
             
             self.is_playing = True
+            self._playback_stopped.clear()
             self.master.after(0, lambda: self.stop_audio_btn.configure(state="normal"))
             
-            audio_queue = queue.Queue(maxsize=2) # Buffer up to 2 chunks ahead
+            # Lookahead is sized in audio time, not chunk count: short chunks from a fast
+            # server no longer stall the fetcher, and a slow server gets more headroom
+            audio_queue = queue.Queue()
+            room = threading.Condition()  # Notified whenever the player takes a chunk or exits
+            avg_chunk_secs = None  # EMA of fetched chunk durations
+
+            def lookahead() -> int:
+                if not avg_chunk_secs:
+                    return 2
+                return max(2, int(TEST_PREFETCH_SECS / avg_chunk_secs))
             
             def fetcher():
+                nonlocal avg_chunk_secs
                 try:
                     for i, chunk in enumerate(chunks):
+                        with room:
+                            room.wait_for(lambda: not self.is_playing or audio_queue.qsize() < lookahead())
                         if not self.is_playing:
                             break
                         
-                        payload = {"text": chunk}
-                        if selected_voice:
-                            payload["voice_model"] = selected_voice
-                        
                         # Show loading for the first chunk
                         if i == 0:
                             self._loading_active = True
                             self.master.after(0, self._animate_loading)
                         
                         try:
-                            wav_bytes = http_post_json(url, payload)
+                            wav_bytes = self._fetch_tts_wav(chunk, selected_voice)
                             if i == 0:
                                 self._loading_active = False
+                            try:
+                                secs = audio_playback.get_wav_duration(wav_bytes)
+                                avg_chunk_secs = secs if avg_chunk_secs is None else 0.7 * avg_chunk_secs + 0.3 * secs
+                            except Exception:
+                                pass
                             audio_queue.put(wav_bytes)
                         except Exception as e:
                             log_to(self.log, f"Chunk {i+1} fetch failed: {e}")
@@ -1262,14 +1442,26 @@ class App(ttk.Frame):
 
             self._thread(fetcher)
 
+            # Stream decoded PCM to the device when sounddevice is available: no temp files,
+            # no player process, and the next chunk queues gaplessly behind the current one
+            player = audio_playback.WavStreamPlayer() if audio_playback.SOUNDDEVICE_AVAILABLE else None
             try:
                 while self.is_playing:
                     wav_bytes = audio_queue.get()
                     if wav_bytes is None:
                         break
+                    with room:
+                        room.notify()
+
+                    if player is not None:
+                        try:
+                            self.playback_process = player
+                            player.play(wav_bytes)
+                        except Exception as play_err:
+                            log_to(self.log, f"Playback failed: {play_err}")
+                        continue
                     
                     # Save to temp file for playback
-                    import tempfile
                     with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as f:
                         temp_wav = f.name
                         f.write(wav_bytes)
@@ -1279,10 +1471,16 @@ class App(ttk.Frame):
                         self.playback_process = audio_playback.play_wav_async(temp_wav)
                         duration = audio_playback.get_wav_duration(temp_wav)
                         
-                        # Monitor playback completion
-                        start_time = time.time()
-                        while time.time() - start_time < duration and self.is_playing:
-                            time.sleep(0.1)
+                        # Block until the chunk finishes or Stop is pressed; no polling
+                        if isinstance(self.playback_process, subprocess.Popen):
+                            try:
+                                # stop_playback() kills the player, which ends the wait early
+                                self.playback_process.wait(timeout=duration + 0.5)
+                            except subprocess.TimeoutExpired:
+                                pass
+                        else:
+                            # winsound gives no handle to wait on
+                            self._playback_stopped.wait(duration)
 
                     except Exception as play_err:
                         log_to(self.log, f"Playback failed: {play_err}")
@@ -1293,12 +1491,18 @@ class App(ttk.Frame):
                         except Exception:
                             pass
                 
+                if player is not None and self.is_playing:
+                    player.close()  # Wait for the buffered tail to play out
                 log_to(self.log, "Audio playback completed.")
 
             except Exception as e:
                 log_to(self.log, f"Playback loop error: {e}")
             finally:
+                if player is not None:
+                    player.stop()
                 self.is_playing = False
+                with room:
+                    room.notify_all()  # Release a fetcher waiting for buffer space
                 self.master.after(0, lambda: self.stop_audio_btn.configure(state="disabled"))
 
         self._thread(work)
@@ -1307,29 +1511,11 @@ class App(ttk.Frame):
         # Quick check of current status variable
         if "running" not in self.status_var.get().lower():
             log_to(self.log, "Error: Server is not running. Please click 'Start' in the Server section first.")
-            self._thread(lambda: self.master.after(0, self._refresh_status))
+            self.master.after(0, self._refresh_status)
             return
 
         def work():
-            base = self._base_url()
-            url = f"{base}/api/tts"
-            
-            # Determine text to say
-            if self.random_var.get():
-                test_messages = [
-                    "Hey there! I'm Piper, your friendly text-to-speech assistant!",
-                    "Testing one two three! Sounds great, doesn't it?",
-                    "Hello! I can speak anything you type. Pretty cool, right?",
-                    "Beep boop! Just kidding, I'm much better than a robot!",
-                    "Ready to chat? I'm all ears... well, actually all voice!",
-                ]
-                import random
-                test_msg = random.choice(test_messages)
-            else:
-                test_msg = self.test_entry.get("1.0", "end-1c").strip()
-                if not test_msg:
-                    test_msg = "There is no text for me to say"
-            
+            test_msg = self._test_text()
             selected_voice = (self.voice_var.get() or "").strip()
             
             log_to(self.log, f"Downloading TTS with voice: {selected_voice or '(default)'}")
@@ -1340,11 +1526,7 @@ class App(ttk.Frame):
             self.master.after(0, self._animate_loading)
             
             try:
-                payload = {"text": test_msg}
-                if selected_voice:
-                    payload["voice_model"] = selected_voice
-
-                wav_bytes = http_post_json(url, payload)
+                wav_bytes = self._fetch_tts_wav(test_msg, selected_voice)
                 
                 # Hide loading indicator
                 self._loading_active = False
@@ -1360,7 +1542,7 @@ class App(ttk.Frame):
                 self._loading_active = False
                 log_to(self.log, f"TTS download failed: {e}")
 
-        self._thread(work)
+        self._submit(work)
 
     def _save_wav_dialog(self, wav_bytes: bytes, text: str) -> None:
         """Open a save dialog and write the WAV bytes to disk."""
@@ -1388,6 +1570,7 @@ class App(ttk.Frame):
     def _stop_audio_clicked(self) -> None:
         """Stop currently playing audio."""
         self.is_playing = False  # Signal any loops to stop
+        self._playback_stopped.set()
         
         # Cross-platform audio stop
         try:
@@ -1404,17 +1587,17 @@ class App(ttk.Frame):
             autostart_install(self.log)
             self.master.after(0, self._refresh_autostart)
 
-        self._thread(work)
+        self._submit(work)
 
     def _uninstall_autostart_clicked(self) -> None:
         def work():
             autostart_uninstall(self.log)
             self.master.after(0, self._refresh_autostart)
 
-        self._thread(work)
+        self._submit(work)
 
     def _load_settings(self) -> None:
-        cfg = load_config()
+        cfg = self._read_config()
         
         # Load voice
         selected = cfg.get("voice_model", "")
@@ -1426,36 +1609,45 @@ class App(ttk.Frame):
         # Load auto-restart
         self.auto_restart_var.set(cfg.get("auto_restart", False))
 
+    def _read_config(self) -> dict:
+        """Load config.json into the in-memory copy and remember which version it was."""
+        self._config = load_config()
+        self._config_mtime = _mtime_ns(CONFIG_PATH)
+        return self._config
+
     def _save_settings(self) -> None:
-        cfg = load_config()
-        cfg["voice_model"] = self.voice_var.get()
-        cfg["auto_restart"] = self.auto_restart_var.get()
+        """Schedule a settings write; rapid consecutive changes coalesce into one."""
+        if self._save_after_id is not None:
+            self.master.after_cancel(self._save_after_id)
+        self._save_after_id = self.master.after(SETTINGS_SAVE_DEBOUNCE_MS, self._flush_settings)
+
+    def _flush_settings(self) -> None:
+        self._save_after_id = None
+        # The server writes config.json too; only re-read it when it changed since we last saw it
+        cfg = self._config if _mtime_ns(CONFIG_PATH) == self._config_mtime else self._read_config()
+        updates = {"voice_model": self.voice_var.get(), "auto_restart": self.auto_restart_var.get()}
+        if all(cfg.get(k) == v for k, v in updates.items()):
+            return
+        cfg.update(updates)
         save_config(cfg)
+        self._config_mtime = _mtime_ns(CONFIG_PATH)
         # log_to(self.log, f"Settings saved.")
 
+    def _on_close(self) -> None:
+        """Window close: write any pending settings change before exiting."""
+        if self._save_after_id is not None:
+            self.master.after_cancel(self._save_after_id)
+            self._flush_settings()
+        self._pool.shutdown()
+        self.master.destroy()
+
     def _save_voice_selection(self) -> None:
         self._save_settings()
         log_to(self.log, f"Voice changed to: {self.voice_var.get()}")
         log_to(self.log, "Voice will be used immediately on next TTS request.")
 
-    def _refresh_training_projects(self) -> None:
-        """Scan tts_dojo folder for available voice projects."""
-        dojo_dir = SCRIPT_DIR.parent / "training" / "make piper voice models" / "tts_dojo"
-        projects = []
-        if dojo_dir.exists():
-            for item in dojo_dir.iterdir():
-                if item.is_dir() and item.name.endswith("_dojo"):
-                    projects.append(item.name)
-        
-        self.training_project_combo["values"] = sorted(projects)
-        if projects and not self.training_project_var.get():
-            self.training_project_var.set(projects[0])
-        elif not projects:
-            self.training_project_var.set("")
-
     def _create_new_voice_clicked(self) -> None:
         """Show a prompt to create a new voice project."""
-        from tkinter import simpledialog
         raw_name = simpledialog.askstring("New Voice", "Enter a name for your voice (no spaces):")
         if not raw_name:
             return
@@ -1464,7 +1656,6 @@ class App(ttk.Frame):
             # Strictly validate the name using the common utility
             voice_name = validate_voice_name(raw_name)
         except ValueError as e:
-            from tkinter import messagebox
             messagebox.showerror("Invalid Name", str(e))
             return
         
@@ -1476,7 +1667,6 @@ class App(ttk.Frame):
             code, out = powershell(f"cd '{training_dir}'; ./new_dojo.ps1 {voice_name}")
             if code == 0:
                 log_to(self.log, f"Successfully created {voice_name}.")
-                self.master.after(0, self._refresh_training_projects)
                 self.master.after(0, lambda: self.training_project_var.set(f"{voice_name}_dojo"))
                 # Open the dataset folder for them
                 self.master.after(0, self._open_dataset_folder_clicked)
@@ -1540,7 +1730,6 @@ class App(ttk.Frame):
                 self.master.after(0, lambda: self.progress_label.configure(text="Done!"))
                 log_to(self.log, f"Splitting complete for {project}!")
                 # Show a popup to the user
-                from tkinter import messagebox
                 self.master.after(0, lambda: messagebox.showinfo("Success", f"Audio splitting complete!\n\nFound and created numerous voice clips in the dataset folder."))
                 # Open folder so user can see the results
                 self.master.after(0, self._open_dataset_folder_clicked)
@@ -1578,7 +1767,6 @@ class App(ttk.Frame):
                 self.master.after(0, lambda: self.progress_var.set(100))
                 self.master.after(0, lambda: self.progress_label.configure(text="Done!"))
                 log_to(self.log, f"Transcription complete for {project}!")
-                from tkinter import messagebox
                 self.master.after(0, lambda: messagebox.showinfo("Success", f"Transcription complete!\n\nThe AI has successfully written the metadata.csv file for {project}."))
             else:
                 log_to(self.log, f"Transcription failed.")
@@ -1616,7 +1804,6 @@ class App(ttk.Frame):
         """Open the voice guide README file."""
         guide_path = SCRIPT_DIR.parent / "voices" / "HOW_TO_ADD_VOICES.md"
         if guide_path.exists():
-            import subprocess
             try:
                 if os.name == "nt":
                     os.startfile(str(guide_path))
@@ -240,7 +240,12 @@ class TrainingManager:
             # 2. Perform deletion
             dojo_path = DOJO_ROOT / f"{voice_name}_dojo"
             if dojo_path.exists():
-                shutil.rmtree(dojo_path)
+                from common_utils import fast_rmtree
+                from voice_tools import release_master_wav_mmap
+
+                # A cached memmap of the master's sidecar would block the delete on Windows
+                release_master_wav_mmap(dojo_path / "dataset" / "raw" / "master.wav")
+                fast_rmtree(dojo_path)
                 logger.info(f"Permanently deleted Dojo: {voice_name}")
                 return {"ok": True}
             else:
@@ -839,6 +844,9 @@ class TrainingManager:
         # Archive a copy of the original master file for later reference or re-slicing.
         master_dest = raw_folder / "master.wav"
         if master_file_path != str(master_dest):
+            from voice_tools import release_master_wav_mmap
+
+            release_master_wav_mmap(master_dest)
             shutil.copy2(master_file_path, str(master_dest))
 
         from auto_split import split_master_audio
@@ -879,8 +887,40 @@ class TrainingManager:
         # Ensure the master file is staged in the dojo's raw folder.
         master_dest = raw_folder / "master.wav"
         if master_file_path != str(master_dest):
+            from voice_tools import release_master_wav_mmap
+
+            release_master_wav_mmap(master_dest)
             shutil.copy2(master_file_path, str(master_dest))
 
+        # Fast path: vectorized RMS scan over the raw PCM samples. Falls back to
+        # pydub for formats the stdlib wave reader can't decode (or when NumPy
+        # isn't installed).
+        try:
+            import wave
+            from voice_tools import VoiceDepsMissing, fast_detect_nonsilent, load_wav_samples
+
+            try:
+                x, sr = load_wav_samples(str(master_dest))
+                ranges = fast_detect_nonsilent(
+                    x,
+                    sr,
+                    min_silence_ms=int(min_silence_len_ms),
+                    thresh_db=float(silence_thresh_offset_db),
+                    pad_ms=int(pad_ms),
+                    min_seg_ms=int(min_segment_ms),
+                    seek_step_ms=5,
+                    relative=True,
+                )
+                return {"ok": True, "segments": [{"start_ms": s, "end_ms": e} for s, e in ranges]}
+            except (VoiceDepsMissing, wave.Error, ValueError, EOFError):
+                pass
+            except Exception as e:
+                # Anything unexpected (OSError, MemoryError, NumPy errors) still gets the
+                # pydub path, which reports failures as {"ok": False, ...}
+                logger.warning(f"Fast silence scan failed for {master_dest}, falling back to pydub: {e}")
+        except ImportError:
+            pass
+
         try:
             from pydub import AudioSegment
             from pydub.silence import detect_nonsilent
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
@@ -65,6 +68,253 @@ def load_master_wav(master_wav_path: Path) -> VoiceWav:
     return VoiceWav(wav=wav, sr=16000, used_trim_silence=used_trim_silence)
 
 
+# LRU of master memmaps (oldest first). An evicted mapping is unmapped once the last
+# in-flight request drops its view of it.
+_MMAP_CACHE: "OrderedDict[str, tuple[tuple[int, int], VoiceWav]]" = OrderedDict()
+_MMAP_CACHE_MAX = 4
+_MMAP_LOCK = threading.Lock()  # guards _MMAP_CACHE and _MMAP_BUILD_LOCKS only, never held while decoding
+_MMAP_BUILD_LOCKS: dict[str, threading.Lock] = {}
+
+
+def _sidecar_path(master_wav_path: Path) -> Path:
+    return Path(f"{master_wav_path}.f32.raw")
+
+
+def _mmap_cache_get(key: str, stamp: tuple[int, int]) -> Optional[VoiceWav]:
+    with _MMAP_LOCK:
+        cached = _MMAP_CACHE.get(key)
+        if cached is None or cached[0] != stamp:
+            return None
+        _MMAP_CACHE.move_to_end(key)
+        return cached[1]
+
+
+def load_master_wav_mmap(master_wav_path: Path) -> VoiceWav:
+    """Like load_master_wav, but backs .wav with an np.memmap of a float32 sidecar.
+
+    The resampled 16kHz samples are written once to <master>.f32.raw (stamped with
+    the master's mtime so a re-upload invalidates it); later calls only page in
+    the slices the segment APIs actually touch. The last few memmaps are cached;
+    call release_master_wav_mmap before replacing or deleting a master.
+    """
+    np = _require_numpy()
+    master_wav_path = Path(master_wav_path)
+    st = master_wav_path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(master_wav_path)
+
+    cached = _mmap_cache_get(key, stamp)
+    if cached is not None:
+        return cached
+
+    # One cold decode per master at a time; other datasets don't wait behind it
+    with _MMAP_LOCK:
+        build_lock = _MMAP_BUILD_LOCKS.setdefault(key, threading.Lock())
+    with build_lock:
+        cached = _mmap_cache_get(key, stamp)
+        if cached is not None:
+            return cached
+
+        sidecar = _sidecar_path(master_wav_path)
+        try:
+            side_st = sidecar.stat()
+            fresh = side_st.st_mtime_ns == st.st_mtime_ns and side_st.st_size > 0
+        except FileNotFoundError:
+            fresh = False
+
+        if not fresh:
+            decoded = load_master_wav(master_wav_path)
+            if decoded.used_trim_silence:
+                # Old resemblyzer trimmed silence, so sample offsets don't line up with
+                # the master; don't persist that.
+                return decoded
+            # Drop our handle on the stale sidecar first (Windows won't replace a mapped file).
+            with _MMAP_LOCK:
+                _MMAP_CACHE.pop(key, None)
+            tmp = sidecar.with_name(sidecar.name + ".tmp")
+            try:
+                np.asarray(decoded.wav, dtype=np.float32).tofile(str(tmp))
+                os.utime(str(tmp), ns=(st.st_atime_ns, st.st_mtime_ns))
+                os.replace(str(tmp), str(sidecar))
+            except OSError as e:
+                # Another request may still have the old sidecar mapped; serve from RAM.
+                logger.warning("Could not write master sidecar %s: %s", sidecar, e)
+                return decoded
+
+        wav = VoiceWav(
+            wav=np.memmap(str(sidecar), dtype=np.float32, mode="r"),
+            sr=16000,
+            used_trim_silence=False,
+        )
+        with _MMAP_LOCK:
+            _MMAP_CACHE[key] = (stamp, wav)
+            _MMAP_CACHE.move_to_end(key)
+            while len(_MMAP_CACHE) > _MMAP_CACHE_MAX:
+                _MMAP_CACHE.popitem(last=False)
+        return wav
+
+
+def release_master_wav_mmap(master_wav_path: Path) -> None:
+    """Forget the cached memmap for a master and delete its sidecar.
+
+    Call before a master is re-uploaded or its dojo deleted. The mapping is not
+    closed explicitly (a request may still be reading a view of it); dropping the
+    cache reference unmaps it as soon as that view goes away, which is what lets
+    Windows delete the file.
+    """
+    master_wav_path = Path(master_wav_path)
+    key = str(master_wav_path)
+    with _MMAP_LOCK:
+        _MMAP_CACHE.pop(key, None)
+        _MMAP_BUILD_LOCKS.pop(key, None)
+    sidecar = _sidecar_path(master_wav_path)
+    for path in (sidecar, sidecar.with_name(sidecar.name + ".tmp")):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not delete master sidecar %s: %s", path, e)
+
+
+def segments_array(starts_ms: Iterable[float], ends_ms: Iterable[float], count: int = -1):
+    """Pack segment bounds into an (N, 2) float64 array of [start_ms, end_ms] rows.
+
+    Every segment API below accepts either this array or a list of (start, end) tuples.
+    """
+    np = _require_numpy()
+    starts = np.fromiter(starts_ms, dtype=np.float64, count=count)
+    ends = np.fromiter(ends_ms, dtype=np.float64, count=count)
+    return np.column_stack([starts, ends])
+
+
+def _sample_bounds(segments_ms, sr: int, n_samples: int) -> tuple[list[int], list[int]]:
+    """Convert ms segments to sample indices clamped to [0, n_samples], in one vectorized pass."""
+    np = _require_numpy()
+    arr = np.asarray(segments_ms, dtype=np.float64).reshape(-1, 2)
+    # astype() truncates toward zero, same as int()
+    idx = (arr / 1000.0 * sr).astype(np.int64)
+    starts = np.maximum(idx[:, 0], 0)
+    ends = np.minimum(idx[:, 1], n_samples)
+    return starts.tolist(), ends.tolist()
+
+
+def load_wav_samples(path: Path):
+    """Read a PCM WAV with the stdlib wave module as float32 samples in [-1, 1].
+
+    Returns (samples, sr); samples is (frames,) for mono or (frames, channels).
+    Raises wave.Error / ValueError for formats it can't decode (compressed, 24-bit),
+    so callers can fall back to pydub/ffmpeg.
+    """
+    import wave
+
+    np = _require_numpy()
+    with wave.open(str(path), "rb") as wf:
+        sr = wf.getframerate()
+        channels = wf.getnchannels()
+        width = wf.getsampwidth()
+        raw = wf.readframes(wf.getnframes())
+
+    if width == 1:
+        x = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif width == 2:
+        x = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 4:
+        x = np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"Unsupported sample width: {width}")
+
+    if channels > 1:
+        x = x.reshape(-1, channels)
+    return x, sr
+
+
+def fast_detect_nonsilent(
+    x,
+    sr: int,
+    *,
+    min_silence_ms: int,
+    thresh_db: float,
+    pad_ms: int = 0,
+    min_seg_ms: int = 0,
+    seek_step_ms: int = 1,
+    relative: bool = False,
+) -> list[tuple[int, int]]:
+    """Vectorized equivalent of pydub.silence.detect_nonsilent plus pad/min-length filtering.
+
+    x holds float samples in [-1, 1], shaped (frames,) or (frames, channels). A window of
+    min_silence_ms is tested every seek_step_ms; it is silent when its RMS is at or below
+    thresh_db (dBFS, or dB relative to the clip's overall level when relative=True).
+    Each non-silent range is widened by pad_ms and dropped if shorter than min_seg_ms.
+    """
+    np = _require_numpy()
+
+    sq = np.square(np.asarray(x, dtype=np.float32))
+    if sq.ndim == 2:
+        sq = sq.mean(axis=1)
+    n_frames = int(sq.shape[0])
+    dur_ms = int(round(1000 * n_frames / sr)) if sr else 0
+    if n_frames == 0 or dur_ms == 0:
+        return []
+
+    if relative:
+        mean_sq = float(np.mean(sq, dtype=np.float64))
+        level_db = 10.0 * np.log10(mean_sq) if mean_sq > 0 else float("-inf")
+        thresh_db = level_db + float(thresh_db)
+
+    # Cumulative energy at every millisecond boundary (frame index = floor(ms * sr / 1000)).
+    bounds = np.minimum(np.arange(dur_ms + 1, dtype=np.int64) * sr // 1000, n_frames)
+    inside = int(np.searchsorted(bounds, n_frames))  # boundaries strictly inside the clip
+    k = min(inside, dur_ms)
+    energy = np.empty(dur_ms + 1, dtype=np.float64)
+    energy[0] = 0.0
+    per_ms = np.add.reduceat(sq, bounds[:inside])[:k].astype(np.float64)
+    energy[1 : k + 1] = np.cumsum(per_ms)
+    energy[k + 1 :] = energy[k]
+
+    win = int(min_silence_ms)
+    step = max(1, int(seek_step_ms))
+    spans: list[tuple[int, int]]
+    if dur_ms < win:
+        spans = [(0, dur_ms)]
+    else:
+        last_start = dur_ms - win
+        starts = np.arange(0, last_start + 1, step, dtype=np.int64)
+        if last_start % step:
+            starts = np.append(starts, last_start)
+        n = (bounds[starts + win] - bounds[starts]).astype(np.float64)
+        mean_sq = np.divide(energy[starts + win] - energy[starts], n, out=np.zeros_like(n), where=n > 0)
+        thresh_sq = (10.0 ** (float(thresh_db) / 20.0)) ** 2
+        silent_starts = starts[mean_sq <= thresh_sq]
+
+        if silent_starts.size == 0:
+            spans = [(0, dur_ms)]
+        else:
+            # Merge silent windows into ranges the same way pydub does
+            gaps = np.diff(silent_starts)
+            breaks = np.nonzero((gaps != step) & (gaps > win))[0]
+            sil_start = np.concatenate([silent_starts[:1], silent_starts[breaks + 1]])
+            sil_end = np.concatenate([silent_starts[breaks], silent_starts[-1:]]) + win
+
+            if sil_start[0] == 0 and sil_end[0] == dur_ms:
+                return []
+            ns_start = np.concatenate([[0], sil_end])
+            ns_end = np.concatenate([sil_start, [dur_ms]])
+            if sil_end[-1] == dur_ms:
+                ns_start, ns_end = ns_start[:-1], ns_end[:-1]
+            if ns_start.size and ns_start[0] == 0 and ns_end[0] == 0:
+                ns_start, ns_end = ns_start[1:], ns_end[1:]
+            spans = list(zip(ns_start.tolist(), ns_end.tolist()))
+
+    if not spans:
+        return []
+    arr = np.asarray(spans, dtype=np.int64)
+    seg_start = np.maximum(arr[:, 0] - int(pad_ms), 0)
+    seg_end = np.minimum(arr[:, 1] + int(pad_ms), dur_ms)
+    keep = (seg_end - seg_start) >= int(min_seg_ms)
+    return list(zip(seg_start[keep].tolist(), seg_end[keep].tolist()))
+
+
 def _dot(a, b) -> float:
     # Embeddings are typically L2-normalized; dot ~= cosine similarity.
     return float(a @ b)
@@ -104,14 +354,12 @@ def voice_filter_segments(
     kept_count = 0
     total = len(segments_ms)
 
+    start_idxs, end_idxs = _sample_bounds(segments_ms, sr, len(wav.wav))
     for i, (start_ms, end_ms) in enumerate(segments_ms):
         if progress_callback:
             progress_callback(i + 1, total)
-        
-        start_idx = int((start_ms / 1000.0) * sr)
-        end_idx = int((end_ms / 1000.0) * sr)
-        start_idx = max(0, start_idx)
-        end_idx = min(len(wav.wav), end_idx)
+
+        start_idx, end_idx = start_idxs[i], end_idxs[i]
         if end_idx <= start_idx:
             continue
 
@@ -169,15 +417,12 @@ def voice_filter_segments_by_ref_audio(
     kept_count = 0
     total = len(segments_ms)
 
-    sr = wav.sr
+    start_idxs, end_idxs = _sample_bounds(segments_ms, wav.sr, len(wav.wav))
     for i, (start_ms, end_ms) in enumerate(segments_ms):
         if progress_callback:
             progress_callback(i + 1, total)
 
-        start_idx = int((start_ms / 1000.0) * sr)
-        end_idx = int((end_ms / 1000.0) * sr)
-        start_idx = max(0, start_idx)
-        end_idx = min(len(wav.wav), end_idx)
+        start_idx, end_idx = start_idxs[i], end_idxs[i]
         if end_idx <= start_idx:
             continue
 
@@ -220,11 +465,9 @@ def voice_split_by_changes(
         raise ValueError("win_s and hop_s must be > 0")
 
     out: list[tuple[float, float]] = []
-    for seg_start_ms, seg_end_ms in base_segments_ms:
-        start_idx = int((seg_start_ms / 1000.0) * sr)
-        end_idx = int((seg_end_ms / 1000.0) * sr)
-        start_idx = max(0, start_idx)
-        end_idx = min(len(wav.wav), end_idx)
+    start_idxs, end_idxs = _sample_bounds(base_segments_ms, sr, len(wav.wav))
+    for i, (seg_start_ms, seg_end_ms) in enumerate(base_segments_ms):
+        start_idx, end_idx = start_idxs[i], end_idxs[i]
         if end_idx <= start_idx:
             continue
 
@@ -294,13 +537,11 @@ def voice_label_segments(
     embed_seg_indices: list[int] = []
     voice_ids: list[int | None] = [None] * len(segments_ms)
 
+    start_idxs, end_idxs = _sample_bounds(segments_ms, sr, len(wav.wav))
     for i, (start_ms, end_ms) in enumerate(segments_ms):
         if (float(end_ms) - float(start_ms)) < min_embed_ms:
             continue
-        start_idx = int((float(start_ms) / 1000.0) * sr)
-        end_idx = int((float(end_ms) / 1000.0) * sr)
-        start_idx = max(0, start_idx)
-        end_idx = min(len(wav.wav), end_idx)
+        start_idx, end_idx = start_idxs[i], end_idxs[i]
         if end_idx <= start_idx:
             continue
         emb = encoder.embed_utterance(wav.wav[start_idx:end_idx])
@@ -112,7 +112,7 @@ class HomeAssistantIntegration {
                     using the command-line interface or local REST API.
                 </p>
                 <div class="integration-actions">
-                    <a href="api_docs.html" target="_blank" class="btn btn-secondary btn-small" style="text-decoration: none;">
+                    <a href="/static/api_docs.html" target="_blank" class="btn btn-secondary btn-small" style="text-decoration: none;">
                         <i class="fas fa-book-open"></i> Mockingbird Developer Guide
                     </a>
                 </div>
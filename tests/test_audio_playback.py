@@ -0,0 +1,94 @@
+"""Tests for WavStreamPlayer in audio_playback.py (sounddevice replaced by a fake stream)"""
+from __future__ import annotations
+
+import io
+import threading
+import wave
+
+import pytest
+
+from src import audio_playback
+
+
+class _FakeStream:
+    """RawOutputStream stand-in whose write() blocks until abort(), like a full device buffer."""
+
+    instances: list = []
+
+    def __init__(self, **kwargs):
+        self.aborted = threading.Event()
+        self.writing = threading.Event()
+        self.closed_by = None
+        self.calls = []
+        _FakeStream.instances.append(self)
+
+    def start(self):
+        self.calls.append("start")
+
+    def write(self, frames):
+        self.writing.set()
+        if not self.aborted.wait(5):
+            raise AssertionError("write was never unblocked")
+        raise RuntimeError("stream aborted")
+
+    def abort(self):
+        assert self.closed_by is None, "abort() on a closed stream"
+        self.calls.append("abort")
+        self.aborted.set()
+
+    def stop(self):
+        self.calls.append("stop")
+
+    def close(self):
+        assert self.closed_by is None, "stream closed twice"
+        self.closed_by = threading.current_thread()
+        self.calls.append("close")
+
+
+@pytest.fixture
+def fake_sounddevice(monkeypatch):
+    _FakeStream.instances = []
+    fake = type("sd", (), {"RawOutputStream": _FakeStream})
+    monkeypatch.setattr(audio_playback, "sd", fake, raising=False)
+    return _FakeStream
+
+
+def _wav_bytes() -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(b"\0\0" * 16000)
+    return buf.getvalue()
+
+
+def test_stop_from_other_thread_leaves_close_to_playing_thread(fake_sounddevice):
+    player = audio_playback.WavStreamPlayer()
+    playing = threading.Thread(target=player.play, args=(_wav_bytes(),))
+    playing.start()
+    stream = None
+    for _ in range(50):
+        if fake_sounddevice.instances and fake_sounddevice.instances[0].writing.wait(0.1):
+            stream = fake_sounddevice.instances[0]
+            break
+    assert stream is not None
+
+    player.stop()  # from the test thread, while play() is blocked in write()
+    assert "close" not in stream.calls
+    playing.join(5)
+
+    assert stream.calls[-2:] == ["abort", "close"]
+    assert stream.closed_by is playing
+
+
+def test_stop_when_idle_closes_stream(fake_sounddevice):
+    player = audio_playback.WavStreamPlayer()
+    player._stream = stream = _FakeStream()
+
+    player.stop()
+    assert stream.calls == ["abort", "close"]
+    player.stop()  # idempotent
+    assert stream.calls == ["abort", "close"]
+    player.play(_wav_bytes())  # a stopped player ignores further audio
+    assert len(fake_sounddevice.instances) == 1
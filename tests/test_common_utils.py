@@ -0,0 +1,152 @@
+"""Tests for shared helpers in common_utils.py"""
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from src import common_utils
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    timeout = 0.5  # server closes an idle keep-alive connection after this
+    connections = 0
+
+    def setup(self):
+        type(self).connections += 1
+        super().setup()
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(404 if self.path == "/missing" else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def keepalive_server():
+    _KeepAliveHandler.connections = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    common_utils._HTTP_CONNS.conns = {}
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+    common_utils._HTTP_CONNS.conns = {}
+
+
+def test_http_request_reuses_connection_within_burst(keepalive_server):
+    assert common_utils.http_get_json(f"{keepalive_server}/health") == {"ok": True}
+    assert common_utils.http_get_json(f"{keepalive_server}/health") == {"ok": True}
+    assert _KeepAliveHandler.connections == 1
+
+
+def test_http_request_retries_once_on_stale_connection(keepalive_server, monkeypatch):
+    # Pretend the keep-alive window is long so the dropped connection gets reused
+    monkeypatch.setattr(common_utils, "HTTP_KEEPALIVE_IDLE_SECS", 60.0)
+    common_utils.http_get_json(f"{keepalive_server}/health")
+    time.sleep(_KeepAliveHandler.timeout + 0.3)  # server has closed its end by now
+
+    assert common_utils.http_get_json(f"{keepalive_server}/health") == {"ok": True}
+    assert _KeepAliveHandler.connections == 2
+
+
+def test_http_request_drops_idle_connection_before_reuse(keepalive_server, monkeypatch):
+    monkeypatch.setattr(common_utils, "HTTP_KEEPALIVE_IDLE_SECS", 0.1)
+    common_utils.http_get_json(f"{keepalive_server}/health")
+    conn, _ = common_utils._HTTP_CONNS.conns[("127.0.0.1", int(keepalive_server.rsplit(":", 1)[1]))]
+    time.sleep(0.2)
+
+    common_utils.http_get_json(f"{keepalive_server}/health")
+    assert conn.sock is None  # closed locally instead of being sent on
+    assert _KeepAliveHandler.connections == 2
+
+
+def test_http_request_raises_http_error(keepalive_server):
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        common_utils.http_request("GET", f"{keepalive_server}/missing", timeout=2)
+    assert exc.value.code == 404
+    assert exc.value.read() == b'{"ok": true}'
+
+
+class _FakeText:
+    """Just enough of tk.Text for TextLogBuffer: after() queues the callback."""
+
+    def __init__(self):
+        self.text = ""
+        self.callbacks = []
+
+    def after(self, ms, fn):
+        self.callbacks.append(fn)
+
+    def winfo_exists(self):
+        return True
+
+    def configure(self, **kwargs):
+        pass
+
+    def insert(self, index, text):
+        self.text += text
+
+    def delete(self, start, end):
+        # Only the "end-{N}l" form TextLogBuffer uses: keep the last N-1 lines plus the trailing newline
+        keep = int(end[len("end-"):-1]) - 1
+        lines = self.text.splitlines(keepends=True)
+        self.text = "".join(lines[-keep:])
+
+    def see(self, index):
+        pass
+
+
+def test_text_log_buffer_batches_and_trims():
+    widget = _FakeText()
+    buf = common_utils.TextLogBuffer(widget, flush_ms=10, max_lines=3)
+    for i in range(5):
+        buf.push(f"line {i}\n")
+
+    assert len(widget.callbacks) == 1  # one scheduled flush for the whole batch
+    widget.callbacks.pop()()
+    assert widget.text == "line 2\nline 3\nline 4\n"
+
+    buf.push("line 5\n")
+    assert len(widget.callbacks) == 1
+
+
+def test_text_log_buffer_is_shared_per_widget():
+    widget = _FakeText()
+    assert common_utils.text_log_buffer(widget) is common_utils.text_log_buffer(widget)
+
+
+def _lock_in_child(lock_path) -> bool:
+    """Try the lock from a separate process, since flock/msvcrt locks are per process."""
+    code = (
+        "import sys; from pathlib import Path; from src import common_utils; "
+        "sys.exit(0 if common_utils.acquire_instance_lock(Path(sys.argv[1])) else 1)"
+    )
+    root = Path(__file__).resolve().parent.parent
+    return subprocess.run([sys.executable, "-c", code, str(lock_path)], cwd=root, timeout=30).returncode == 0
+
+
+def test_acquire_instance_lock_excludes_second_process(tmp_path):
+    lock_path = tmp_path / "app.lock"
+    held = common_utils.acquire_instance_lock(lock_path)
+    assert held is not None
+    try:
+        assert not _lock_in_child(lock_path)
+    finally:
+        held.close()
+    # closing the handle releases the lock without deleting the file
+    assert lock_path.exists()
+    assert _lock_in_child(lock_path)
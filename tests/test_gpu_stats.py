@@ -0,0 +1,69 @@
+"""Tests for /api/gpu-stats in piper_server.py"""
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+piper_server = pytest.importorskip("piper_server")
+
+
+@pytest.fixture
+def gpu_state(monkeypatch):
+    state = {"ts": 0.0, "payload": None, "proc": object(), "loop_failed": False}
+    monkeypatch.setattr(piper_server, "_gpu_state", state)
+    monkeypatch.setattr(piper_server, "_ensure_gpu_loop", lambda: None)
+    runs = []
+
+    def fake_run(cmd, **kwargs):
+        runs.append(kwargs)
+        return subprocess.CompletedProcess(cmd, 0, stdout="42, 1000, 8000, 61\n", stderr="")
+
+    monkeypatch.setattr(piper_server.subprocess, "run", fake_run)
+    return state, runs
+
+
+def _stats():
+    return asyncio.run(piper_server.get_gpu_stats())
+
+
+def test_gpu_stats_before_first_loop_sample_does_not_spawn(gpu_state):
+    _state, runs = gpu_state
+    assert _stats() == {"available": False}
+    assert runs == []
+
+
+def test_gpu_stats_serves_stale_loop_sample_without_spawning(gpu_state):
+    state, runs = gpu_state
+    sample = {"available": True, "utilization_gpu": 5}
+    state.update(payload=sample, ts=time.monotonic() - 10)
+    assert _stats() == sample
+    assert runs == []
+
+
+def test_gpu_stats_falls_back_to_one_shot_query_with_timeout(gpu_state):
+    state, runs = gpu_state
+    state.update(proc=None, loop_failed=True)
+    payload = _stats()
+    assert payload["available"] and payload["utilization_gpu"] == 42
+    assert runs[0]["timeout"] == 5
+    # The fresh one-shot sample is reused within the TTL
+    assert _stats() == payload
+    assert len(runs) == 1
+
+
+def test_gpu_stats_reports_one_shot_timeout(gpu_state, monkeypatch):
+    state, _runs = gpu_state
+    state.update(proc=None, loop_failed=True)
+
+    def hung_run(cmd, **kwargs):
+        raise subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+
+    monkeypatch.setattr(piper_server.subprocess, "run", hung_run)
+    assert _stats() == {"available": False, "error": "nvidia-smi timed out"}
@@ -0,0 +1,217 @@
+"""Tests for the non-UI helpers in piper_manager_ui.py"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+piper_manager_ui = pytest.importorskip("piper_manager_ui")
+
+
+def _touch_dir(path):
+    # Filesystem timestamps are coarse (often a few ms), so bump the mtime
+    # explicitly rather than relying on the clock having ticked
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def voices_dir(tmp_path, monkeypatch):
+    (tmp_path / "src").mkdir()
+    voices = tmp_path / "voices"
+    (voices / "en" / "amy").mkdir(parents=True)
+    (voices / "en" / "amy" / "amy.onnx").write_bytes(b"")
+    (voices / "en" / "amy" / "amy.onnx.json").write_text("{}")
+    monkeypatch.setattr(piper_manager_ui, "SCRIPT_DIR", tmp_path / "src")
+    monkeypatch.setattr(piper_manager_ui, "_VOICES_CACHE", None)
+    return voices
+
+
+@pytest.fixture
+def scandir_calls(monkeypatch):
+    calls = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        calls.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(piper_manager_ui.os, "scandir", counting_scandir)
+    return calls
+
+
+def test_scan_voices_is_cached_until_a_directory_changes(voices_dir, scandir_calls):
+    first = piper_manager_ui.scan_voices()
+    assert first == [voices_dir / "en" / "amy" / "amy.onnx"]
+    walked = len(scandir_calls)
+    assert walked == 3
+
+    assert piper_manager_ui.scan_voices() == first
+    assert len(scandir_calls) == walked  # served from the cache
+
+    piper_manager_ui.invalidate_voice_cache()
+    assert piper_manager_ui.scan_voices() == first
+    assert len(scandir_calls) == 2 * walked
+
+
+def test_scan_voices_sees_changes_at_any_depth(voices_dir):
+    piper_manager_ui.scan_voices()
+
+    nested = voices_dir / "en" / "amy" / "extra.onnx"
+    nested.write_bytes(b"")
+    _touch_dir(nested.parent)
+    assert nested in piper_manager_ui.scan_voices()
+
+    nested.unlink()
+    _touch_dir(nested.parent)
+    assert nested not in piper_manager_ui.scan_voices()
+
+    new_dir = voices_dir / "de" / "thorsten"
+    new_dir.mkdir(parents=True)
+    (new_dir / "thorsten.onnx").write_bytes(b"")
+    _touch_dir(voices_dir)
+    assert new_dir / "thorsten.onnx" in piper_manager_ui.scan_voices()
+
+
+def test_scan_voices_returns_a_copy(voices_dir):
+    piper_manager_ui.scan_voices().clear()
+    assert piper_manager_ui.scan_voices() == [voices_dir / "en" / "amy" / "amy.onnx"]
+
+
+class _StarterHandler(BaseHTTPRequestHandler):
+    files: dict[str, tuple[bytes, str]] = {}  # path -> (body, ETag)
+    requests: list[tuple[str, str]] = []
+
+    def _serve(self, with_body: bool):
+        type(self).requests.append((self.command, self.path))
+        if self.path == "/moved":
+            self.send_response(302)
+            self.send_header("Location", "/voice.onnx")
+            self.end_headers()
+            return
+        if self.path not in self.files:
+            self.send_error(404)
+            return
+        body, etag = self.files[self.path]
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if with_body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._serve(with_body=True)
+
+    def do_HEAD(self):
+        self._serve(with_body=False)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def starter_server(tmp_path, monkeypatch):
+    _StarterHandler.files = {
+        "/voice.onnx": (b"model-v1", '"v1"'),
+        "/voice.onnx.json": (b"{}", '"j1"'),
+    }
+    _StarterHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StarterHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    (tmp_path / "src").mkdir()
+    monkeypatch.setattr(piper_manager_ui, "SCRIPT_DIR", tmp_path / "src")
+    monkeypatch.setattr(piper_manager_ui, "STARTER_ETAGS_PATH", tmp_path / "src" / ".starter_etags.json")
+    monkeypatch.setattr(piper_manager_ui, "STARTER_MODELS", {
+        "Test": {
+            "onnx_url": f"{base}/voice.onnx",
+            "json_url": f"{base}/voice.onnx.json",
+            "rel_path": "voices/Test/voice.onnx",
+        }
+    })
+    monkeypatch.setattr(piper_manager_ui, "log_to", lambda widget, msg, save_to_file=True: None)
+    yield base, tmp_path / "voices" / "Test" / "voice.onnx"
+    server.shutdown()
+    server.server_close()
+
+
+def _age_checks(etags_path, secs):
+    etags = json.loads(etags_path.read_text(encoding="utf-8"))
+    for entry in etags.values():
+        entry["checked"] -= secs
+    etags_path.write_text(json.dumps(etags), encoding="utf-8")
+
+
+def test_starter_models_download_missing_files_and_record_etags(starter_server):
+    base, onnx = starter_server
+    assert piper_manager_ui.ensure_starter_models(None)
+    assert onnx.read_bytes() == b"model-v1"
+    assert onnx.with_suffix(".onnx.json").read_bytes() == b"{}"
+    assert not onnx.with_suffix(".tmp").exists()
+    etags = json.loads(piper_manager_ui.STARTER_ETAGS_PATH.read_text(encoding="utf-8"))
+    assert etags[f"{base}/voice.onnx"]["etag"] == '"v1"'
+    assert etags[f"{base}/voice.onnx.json"]["etag"] == '"j1"'
+
+
+def test_starter_models_skip_network_within_recheck_window(starter_server):
+    piper_manager_ui.ensure_starter_models(None)
+    _StarterHandler.requests.clear()
+    assert piper_manager_ui.ensure_starter_models(None)
+    assert _StarterHandler.requests == []
+
+
+def test_starter_models_unchanged_etag_only_sends_head(starter_server):
+    _base, onnx = starter_server
+    piper_manager_ui.ensure_starter_models(None)
+    _age_checks(piper_manager_ui.STARTER_ETAGS_PATH, piper_manager_ui.STARTER_RECHECK_SECS + 60)
+    _StarterHandler.requests.clear()
+
+    assert piper_manager_ui.ensure_starter_models(None)
+    assert sorted(m for m, _path in _StarterHandler.requests) == ["HEAD", "HEAD"]
+    assert onnx.read_bytes() == b"model-v1"
+    etags = json.loads(piper_manager_ui.STARTER_ETAGS_PATH.read_text(encoding="utf-8"))
+    assert all(time.time() - e["checked"] < 60 for e in etags.values())
+
+
+def test_starter_models_changed_etag_redownloads(starter_server):
+    base, onnx = starter_server
+    piper_manager_ui.ensure_starter_models(None)
+    _age_checks(piper_manager_ui.STARTER_ETAGS_PATH, piper_manager_ui.STARTER_RECHECK_SECS + 60)
+    _StarterHandler.files["/voice.onnx"] = (b"model-v2", '"v2"')
+    _StarterHandler.requests.clear()
+
+    assert piper_manager_ui.ensure_starter_models(None)
+    assert ("GET", "/voice.onnx") in _StarterHandler.requests
+    assert ("GET", "/voice.onnx.json") not in _StarterHandler.requests
+    assert onnx.read_bytes() == b"model-v2"
+    etags = json.loads(piper_manager_ui.STARTER_ETAGS_PATH.read_text(encoding="utf-8"))
+    assert etags[f"{base}/voice.onnx"]["etag"] == '"v2"'
+
+
+def test_starter_models_keep_files_when_head_fails(starter_server):
+    _base, onnx = starter_server
+    piper_manager_ui.ensure_starter_models(None)
+    _age_checks(piper_manager_ui.STARTER_ETAGS_PATH, piper_manager_ui.STARTER_RECHECK_SECS + 60)
+    before = piper_manager_ui.STARTER_ETAGS_PATH.read_text(encoding="utf-8")
+    _StarterHandler.files.clear()  # every HEAD now 404s
+
+    assert piper_manager_ui.ensure_starter_models(None)
+    assert onnx.read_bytes() == b"model-v1"
+    # Not marked as checked, so the next launch tries again
+    assert piper_manager_ui.STARTER_ETAGS_PATH.read_text(encoding="utf-8") == before
+
+
+def test_head_validator_keeps_head_across_redirects(starter_server):
+    base, _onnx = starter_server
+    assert piper_manager_ui._head_validator(f"{base}/moved") == '"v1"'
+    assert _StarterHandler.requests == [("HEAD", "/moved"), ("HEAD", "/voice.onnx")]
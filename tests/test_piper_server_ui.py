@@ -0,0 +1,38 @@
+"""Tests for the non-UI helpers in piper_server_ui.py"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+piper_server_ui = pytest.importorskip("piper_server_ui")
+
+
+def test_daemon_pool_keeps_working_after_a_failed_job():
+    pool = piper_server_ui._DaemonPool(1, "test-worker")
+    done = threading.Event()
+    pool.submit(lambda: 1 / 0)
+    pool.submit(done.set)
+    assert done.wait(5)
+    pool.shutdown()
+    with pytest.raises(RuntimeError):
+        pool.submit(done.set)
+
+
+def test_daemon_pool_does_not_hold_the_process_open():
+    # A job still running at exit (e.g. a request waiting on its read timeout) must not
+    # keep a windowless process alive
+    code = (
+        "import sys, time; sys.path.insert(0, 'src'); import piper_server_ui; "
+        "pool = piper_server_ui._DaemonPool(2, 'w'); pool.submit(lambda: time.sleep(60)); "
+        "time.sleep(0.2); pool.shutdown()"
+    )
+    root = Path(__file__).resolve().parent.parent
+    result = subprocess.run([sys.executable, "-c", code], cwd=root, timeout=30)
+    assert result.returncode == 0
@@ -0,0 +1,62 @@
+"""Tests for config.json handling in piper_server.py"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+piper_server = pytest.importorskip("piper_server")
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(piper_server, "SCRIPT_DIR", tmp_path)
+    monkeypatch.setitem(piper_server._CFG_CACHE, "key", None)
+    monkeypatch.setitem(piper_server._CFG_CACHE, "val", None)
+    return tmp_path
+
+
+def test_save_config_round_trip_with_backup(config_dir):
+    piper_server.save_config({"voice_model": "a.onnx"})
+    assert piper_server.load_config() == {"voice_model": "a.onnx"}
+
+    piper_server.save_config({"voice_model": "b.onnx"})
+    text = (config_dir / "config.json").read_text(encoding="utf-8")
+    assert json.loads(text) == {"voice_model": "b.onnx"}
+    assert '\n    "voice_model"' in text  # indent=4
+    # The previous file is kept as the .bak that safe_config_load recovers from
+    assert json.loads((config_dir / "config.json.bak").read_text(encoding="utf-8")) == {"voice_model": "a.onnx"}
+    assert not (config_dir / "config.json.tmp").exists()
+    # The cached parse is invalidated by the write
+    assert piper_server.load_config() == {"voice_model": "b.onnx"}
+
+
+def test_save_config_failure_raises_and_keeps_old_file(config_dir, monkeypatch):
+    piper_server.save_config({"port": 5002})
+    monkeypatch.setattr(piper_server, "safe_config_save", lambda *a, **k: False)
+
+    with pytest.raises(OSError):
+        piper_server.save_config({"port": 1})
+    assert piper_server.load_config() == {"port": 5002}
+
+
+def test_set_config_value_skips_unchanged(config_dir):
+    assert piper_server.set_config_value("launch_on_startup", True) is True
+    assert piper_server.set_config_value("launch_on_startup", True) is False
+    assert piper_server.load_config() == {"launch_on_startup": True}
+
+
+def test_concurrent_config_updates_keep_every_key(config_dir):
+    from concurrent.futures import ThreadPoolExecutor
+
+    piper_server.save_config({})
+    keys = [f"key_{i}" for i in range(16)]
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(lambda k: piper_server.set_config_value(k, True), keys[:8]))
+        list(ex.map(lambda k: piper_server.update_config({k: True}), keys[8:]))
+
+    assert piper_server.load_config() == {k: True for k in keys}
@@ -0,0 +1,38 @@
+"""Tests for upload saving in piper_server.py"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+piper_server = pytest.importorskip("piper_server")
+
+
+def _spooled(data: bytes):
+    spool = tempfile.SpooledTemporaryFile(max_size=piper_server._UPLOAD_SPOOL_MAX)
+    spool.write(data)
+    spool.seek(0)
+    return spool
+
+
+def test_fast_save_keeps_small_uploads_in_memory(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(piper_server.os, "sendfile", lambda *a: calls.append(a) or 0, raising=False)
+    data = b"RIFF" + os.urandom(1000)
+    with _spooled(data) as src:
+        piper_server._fast_save(src, tmp_path / "small.wav", len(data))
+        assert not src._rolled  # fileno() was never called
+    assert (tmp_path / "small.wav").read_bytes() == data
+    assert calls == []
+
+
+@pytest.mark.parametrize("known_size", [True, False])
+def test_fast_save_copies_large_uploads(tmp_path, known_size):
+    data = os.urandom(piper_server._UPLOAD_SPOOL_MAX + 12345)
+    with _spooled(data) as src:
+        piper_server._fast_save(src, tmp_path / "big.wav", len(data) if known_size else None)
+    assert (tmp_path / "big.wav").read_bytes() == data
@@ -0,0 +1,178 @@
+"""Tests for the NumPy fast paths in voice_tools.py"""
+from __future__ import annotations
+
+import os
+import sys
+import wave
+
+import pytest
+
+# training_manager imports voice_tools as a top-level module, the way the server runs it
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+np = pytest.importorskip("numpy")
+
+SR = 16000
+
+
+def _synthetic_speech(sr: int = SR):
+    """Three tone bursts separated by near-silent gaps, as int16 samples."""
+    rng = np.random.default_rng(0)
+    parts = []
+    for burst_ms, gap_ms in ((700, 450), (1200, 600), (500, 800)):
+        t = np.arange(int(sr * burst_ms / 1000)) / sr
+        parts.append(0.5 * np.sin(2 * np.pi * 220 * t))
+        parts.append(0.0005 * rng.standard_normal(int(sr * gap_ms / 1000)))
+    x = np.concatenate([0.0005 * rng.standard_normal(int(sr * 0.3))] + parts)
+    return (x * 32767).astype("<i2")
+
+
+def _write_wav(path, samples, sr: int = SR):
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sr)
+        wf.writeframes(samples.tobytes())
+
+
+def test_fast_detect_nonsilent_matches_pydub(tmp_path):
+    pydub_silence = pytest.importorskip("pydub.silence")
+    from pydub import AudioSegment
+    from voice_tools import fast_detect_nonsilent, load_wav_samples
+
+    samples = _synthetic_speech()
+    path = tmp_path / "master.wav"
+    _write_wav(path, samples)
+
+    seek_step = 5
+    audio = AudioSegment(samples.tobytes(), frame_rate=SR, sample_width=2, channels=1)
+    expected = pydub_silence.detect_nonsilent(
+        audio, min_silence_len=300, silence_thresh=audio.dBFS - 16, seek_step=seek_step
+    )
+
+    x, sr = load_wav_samples(path)
+    got = fast_detect_nonsilent(x, sr, min_silence_ms=300, thresh_db=-16, seek_step_ms=seek_step, relative=True)
+
+    assert len(got) == len(expected) == 3
+    for (gs, ge), (es, ee) in zip(got, expected):
+        assert abs(gs - es) <= seek_step
+        assert abs(ge - ee) <= seek_step
+
+
+def test_fast_detect_nonsilent_pad_and_min_length():
+    from voice_tools import fast_detect_nonsilent
+
+    x = _synthetic_speech().astype(np.float32) / 32768.0
+    plain = fast_detect_nonsilent(x, SR, min_silence_ms=300, thresh_db=-16, relative=True)
+    padded = fast_detect_nonsilent(
+        x, SR, min_silence_ms=300, thresh_db=-16, relative=True, pad_ms=100, min_seg_ms=800
+    )
+    # The 500ms burst (700ms padded) is dropped; the others grow by the padding
+    assert len(padded) == 2
+    assert padded[0] == (plain[0][0] - 100, plain[0][1] + 100)
+
+
+def test_detect_nonsilent_segments_unexpected_error_falls_back(tmp_path, monkeypatch):
+    """An unexpected fast-path failure must not escape; it falls back to pydub."""
+    pytest.importorskip("pydub")
+    import voice_tools
+    from src.training_manager import TrainingManager
+
+    monkeypatch.setattr('src.training_manager.DOJO_ROOT', tmp_path)
+
+    def boom(path):
+        raise OSError("disk went away")
+
+    monkeypatch.setattr(voice_tools, "load_wav_samples", boom)
+
+    master = tmp_path / "upload.wav"
+    _write_wav(master, _synthetic_speech())
+
+    result = TrainingManager().detect_nonsilent_segments("test_voice", str(master))
+    assert result["ok"] is True
+    assert len(result["segments"]) == 3
+
+
+@pytest.fixture
+def fake_master_loader(monkeypatch):
+    """Stand-in for the resemblyzer decode: returns the WAV's samples, counts calls."""
+    import voice_tools
+
+    calls = []
+
+    def load(path):
+        calls.append(str(path))
+        x, _ = voice_tools.load_wav_samples(path)
+        return voice_tools.VoiceWav(wav=x, sr=16000, used_trim_silence=False)
+
+    monkeypatch.setattr(voice_tools, "load_master_wav", load)
+    monkeypatch.setattr(voice_tools, "_MMAP_CACHE", type(voice_tools._MMAP_CACHE)())
+    monkeypatch.setattr(voice_tools, "_MMAP_BUILD_LOCKS", {})
+    return calls
+
+
+def test_load_master_wav_mmap_caches_and_releases(tmp_path, fake_master_loader):
+    import voice_tools
+
+    master = tmp_path / "master.wav"
+    _write_wav(master, _synthetic_speech())
+
+    first = voice_tools.load_master_wav_mmap(master)
+    sidecar = voice_tools._sidecar_path(master)
+    assert sidecar.exists()
+    assert isinstance(first.wav, np.memmap)
+    assert voice_tools.load_master_wav_mmap(master) is first
+    assert len(fake_master_loader) == 1
+
+    voice_tools.release_master_wav_mmap(master)
+    assert not sidecar.exists()
+    assert str(master) not in voice_tools._MMAP_CACHE
+
+    # Re-upload: new content is decoded again rather than served from the old sidecar
+    del first
+    _write_wav(master, _synthetic_speech()[: SR])
+    again = voice_tools.load_master_wav_mmap(master)
+    assert len(fake_master_loader) == 2
+    assert again.wav.shape[0] == SR
+
+
+def test_load_master_wav_mmap_cache_is_bounded(tmp_path, fake_master_loader, monkeypatch):
+    import voice_tools
+
+    monkeypatch.setattr(voice_tools, "_MMAP_CACHE_MAX", 2)
+    masters = []
+    for i in range(3):
+        m = tmp_path / f"m{i}.wav"
+        _write_wav(m, _synthetic_speech()[: SR])
+        voice_tools.load_master_wav_mmap(m)
+        masters.append(str(m))
+    assert list(voice_tools._MMAP_CACHE) == masters[1:]
+
+
+def test_load_master_wav_mmap_cold_load_does_not_block_other_masters(tmp_path, monkeypatch):
+    import threading
+    import voice_tools
+
+    monkeypatch.setattr(voice_tools, "_MMAP_CACHE", type(voice_tools._MMAP_CACHE)())
+    monkeypatch.setattr(voice_tools, "_MMAP_BUILD_LOCKS", {})
+    slow, fast = tmp_path / "slow.wav", tmp_path / "fast.wav"
+    _write_wav(slow, _synthetic_speech()[: SR])
+    _write_wav(fast, _synthetic_speech()[: SR])
+    entered, release = threading.Event(), threading.Event()
+
+    def load(path):
+        if path == slow:
+            entered.set()
+            release.wait(5)
+        x, _ = voice_tools.load_wav_samples(path)
+        return voice_tools.VoiceWav(wav=x, sr=16000, used_trim_silence=False)
+
+    monkeypatch.setattr(voice_tools, "load_master_wav", load)
+    t = threading.Thread(target=voice_tools.load_master_wav_mmap, args=(slow,))
+    t.start()
+    try:
+        assert entered.wait(5)
+        assert voice_tools.load_master_wav_mmap(fast).wav.shape[0] == SR
+    finally:
+        release.set()
+        t.join(5)